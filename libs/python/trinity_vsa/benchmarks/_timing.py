@@ -0,0 +1,29 @@
+"""Timing helper shared by the benchmark scripts."""
+
+import time
+
+
+def measure(func, iterations=5, min_time=0.0):
+    """Best-of-``iterations`` wall time in seconds per call.
+
+    ``func`` is called once to warm up. With ``min_time`` each iteration
+    repeats the call enough times to run for at least that long, which
+    keeps timer resolution out of sub-microsecond kernels.
+    """
+    func()
+    calls = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(calls):
+            func()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            break
+        calls = max(calls * 2, int(calls * min_time / max(elapsed, 1e-9) * 1.1))
+    best = elapsed / calls
+    for _ in range(iterations - 1):
+        start = time.perf_counter()
+        for _ in range(calls):
+            func()
+        best = min(best, (time.perf_counter() - start) / calls)
+    return best
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+LSHIndex recall vs QPS benchmark
+
+Stores N random hypervectors, queries with noisy copies of stored
+vectors (the cleanup workload) and compares LSHIndex at several
+settings against brute-force ``cleanup``. Run from the package root:
+
+    python benchmarks/bench_ann.py [--n 100000] [--dim 4096]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from trinity_vsa import ItemMemory, LSHIndex, TritMatrix, TritVector  # noqa: E402
+from trinity_vsa.ops import cleanup  # noqa: E402
+
+SETTINGS = [
+    # (n_tables, n_bits, n_probes)
+    (8, 12, 0),
+    (16, 14, 8),
+    (16, 12, 2),
+    (24, 12, 4),
+    (32, 10, 2),
+]
+
+
+def noisy_queries(codebook, n_queries, noise, rng):
+    """Copies of random stored vectors with a fraction of trits resampled."""
+    targets = rng.integers(0, len(codebook), n_queries)
+    data = codebook.data[targets].copy()
+    mask = rng.random(data.shape) < noise
+    data[mask] = rng.integers(-1, 2, size=int(mask.sum()), dtype=np.int8)
+    return targets, TritMatrix(data)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--n", type=int, default=50_000)
+    parser.add_argument("--dim", type=int, default=4096)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--noise", type=float, default=0.3)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    codebook = TritMatrix.random(args.n, args.dim, seed=1)
+    targets, queries = noisy_queries(codebook, args.queries, args.noise, rng)
+
+    print(f"N={args.n} dim={args.dim} queries={args.queries} noise={args.noise}")
+    print(f"{'method':<28} {'build (s)':>10} {'QPS':>10} {'recall@1':>9}")
+
+    # Brute force: cleanup over the list of prototypes
+    memory = list(codebook)
+    n_brute = min(args.queries, 20)
+    start = time.perf_counter()
+    hits = 0
+    for i in range(n_brute):
+        hits += cleanup(queries[i], memory) == codebook[int(targets[i])]
+    elapsed = time.perf_counter() - start
+    print(f"{'cleanup (brute force)':<28} {'-':>10} {n_brute / elapsed:>10.1f} {hits / n_brute:>9.3f}")
+
+    # Exact batched search: one matmul against the normalized codebook
+    start = time.perf_counter()
+    exact = ItemMemory.from_vectors(codebook)
+    build = time.perf_counter() - start
+    start = time.perf_counter()
+    labels, _ = exact.batch_top_k(queries, k=1)
+    elapsed = time.perf_counter() - start
+    hits = sum(found[0] == t for found, t in zip(labels, targets))
+    print(f"{'ItemMemory (exact matmul)':<28} {build:>10.2f} {args.queries / elapsed:>10.1f} "
+          f"{hits / args.queries:>9.3f}")
+
+    for n_tables, n_bits, n_probes in SETTINGS:
+        start = time.perf_counter()
+        index = LSHIndex.build(codebook, n_tables=n_tables, n_bits=n_bits,
+                               n_probes=n_probes, seed=2)
+        index.query(TritVector.zeros(args.dim))  # build sorted tables
+        build = time.perf_counter() - start
+
+        start = time.perf_counter()
+        labels, _ = index.batch_query(queries, k=1)
+        elapsed = time.perf_counter() - start
+        hits = sum(bool(found) and found[0] == t for found, t in zip(labels, targets))
+        name = f"lsh T={n_tables} b={n_bits} p={n_probes}"
+        print(f"{name:<28} {build:>10.2f} {args.queries / elapsed:>10.1f} "
+              f"{hits / args.queries:>9.3f}")
+
+
+if __name__ == "__main__":
+    main()
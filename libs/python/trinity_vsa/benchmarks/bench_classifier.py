@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+HDClassifier benchmark: streaming fit, retraining and batched prediction
+
+Trains on a synthetic dataset (default 1M samples at dim=10k, i.e. 10 GB
+of trits) that is generated chunk by chunk and never held in memory.
+Each sample is a class prototype with a fraction of its dimensions
+re-drawn at random; pairs of classes share part of their prototype so
+that retraining has errors to correct. ``--imbalance`` skews the
+training class frequencies (the test set stays balanced). Reports
+training, retraining and prediction throughput (data generation
+excluded) plus test accuracy. Run from the package root:
+
+    python benchmarks/bench_classifier.py [--n 1000000] [--dim 10000] [--epochs 2] [--imbalance 100]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from trinity_vsa.classifier import HDClassifier  # noqa: E402
+
+
+def make_prototypes(classes, dim, seed=0):
+    """Random prototypes; class 2i+1 copies half of class 2i."""
+    rng = np.random.default_rng(seed)
+    protos = rng.integers(-1, 2, size=(classes, dim), dtype=np.int8)
+    half = dim // 2
+    protos[1::2, :half] = protos[0::2, :half][:classes // 2]
+    return protos
+
+
+def class_weights(classes, imbalance):
+    """Sampling probabilities falling geometrically from 1 to 1/imbalance."""
+    weights = float(imbalance) ** -np.linspace(0.0, 1.0, classes)
+    return weights / weights.sum()
+
+
+def make_chunk(protos, n, noise, seed, weights=None):
+    """n noisy samples and their labels (deterministic per seed)."""
+    rng = np.random.default_rng(seed)
+    labels = rng.choice(len(protos), size=n, p=weights)
+    samples = protos[labels]
+    noisy = rng.random(samples.shape, dtype=np.float32) < noise
+    samples[noisy] = rng.integers(-1, 2, size=int(noisy.sum()), dtype=np.int8)
+    return samples, labels
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--n", type=int, default=1_000_000)
+    parser.add_argument("--dim", type=int, default=10_000)
+    parser.add_argument("--classes", type=int, default=26)
+    parser.add_argument("--noise", type=float, default=0.9)
+    parser.add_argument("--epochs", type=int, default=2)
+    parser.add_argument("--chunk", type=int, default=16_384)
+    parser.add_argument("--test", type=int, default=20_000)
+    parser.add_argument("--imbalance", type=float, default=1.0,
+                        help="ratio of the most to the least frequent training class")
+    args = parser.parse_args()
+
+    protos = make_prototypes(args.classes, args.dim)
+    chunks = [(start, min(args.chunk, args.n - start)) for start in range(0, args.n, args.chunk)]
+    weights = class_weights(args.classes, args.imbalance)
+    # the test set stays balanced so that every class counts equally
+    test_x, test_y = make_chunk(protos, args.test, args.noise, seed=len(chunks))
+
+    print(f"trinity-vsa HDClassifier ({args.n:,} samples, dim={args.dim:,}, "
+          f"{args.classes} classes, noise={args.noise}, imbalance={args.imbalance:g})")
+    print()
+
+    clf = HDClassifier(args.dim)
+    spent = 0.0
+    for i, (_, size) in enumerate(chunks):
+        x, y = make_chunk(protos, size, args.noise, seed=i, weights=weights)
+        start = time.perf_counter()
+        clf.partial_fit(x, y)
+        spent += time.perf_counter() - start
+    print(f"{'fit (1 pass)':<22}{spent:>8.2f} s  {args.n / spent:>12,.0f} samples/s   "
+          f"test acc {clf.score(test_x, test_y):.4f}")
+
+    for epoch in range(1, args.epochs + 1):
+        spent, errors = 0.0, 0
+        for i, (_, size) in enumerate(chunks):
+            x, y = make_chunk(protos, size, args.noise, seed=i, weights=weights)
+            start = time.perf_counter()
+            errors += clf.retrain(x, y)
+            spent += time.perf_counter() - start
+        print(f"{f'retrain epoch {epoch}':<22}{spent:>8.2f} s  {args.n / spent:>12,.0f} samples/s   "
+              f"test acc {clf.score(test_x, test_y):.4f}  ({errors:,} updates)")
+
+    start = time.perf_counter()
+    clf.predict(test_x)
+    spent = time.perf_counter() - start
+    print(f"{'predict':<22}{spent:>8.2f} s  {len(test_x) / spent:>12,.0f} samples/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Storage codec benchmark: base-243 (5 trits/byte) vs packed (4 trits/byte)
+
+Reports encoded size and encode/decode throughput in million trits per
+second for a batch of random vectors. Run from the package root:
+
+    python benchmarks/bench_codec.py [--n 2000] [--dim 10000]
+"""
+
+import argparse
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from trinity_vsa import decode_base243, encode_base243, pack_trits, unpack_trits  # noqa: E402
+from _timing import measure  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--n", type=int, default=2000)
+    parser.add_argument("--dim", type=int, default=10_000)
+    args = parser.parse_args()
+
+    data = np.random.default_rng(0).integers(-1, 2, size=(args.n, args.dim), dtype=np.int8)
+    trits = data.size
+
+    encoded = encode_base243(data)
+    assert np.array_equal(decode_base243(encoded, args.dim), data)
+    pos, neg = pack_trits(data)
+    assert np.array_equal(unpack_trits(pos, neg, args.dim), data)
+
+    rows = [
+        ("packed (2 bits/trit)", pos.nbytes + neg.nbytes,
+         measure(lambda: pack_trits(data)),
+         measure(lambda: unpack_trits(pos, neg, args.dim))),
+        ("base243 (1.6 bits/trit)", encoded.nbytes,
+         measure(lambda: encode_base243(data)),
+         measure(lambda: decode_base243(encoded, args.dim))),
+    ]
+
+    print(f"{args.n} vectors x dim {args.dim} ({trits / 1e6:.0f}M trits, int8 = {data.nbytes / 1e6:.1f} MB)")
+    print(f"{'codec':<26} {'size (MB)':>10} {'encode Mtrit/s':>15} {'decode Mtrit/s':>15}")
+    for name, size, t_enc, t_dec in rows:
+        print(f"{name:<26} {size / 1e6:>10.2f} {trits / t_enc / 1e6:>15.0f} {trits / t_dec / 1e6:>15.0f}")
+    saving = 1 - rows[1][1] / rows[0][1]
+    print(f"\nbase243 saves {saving:.1%} over packed")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+PackedTritVec pack/unpack benchmark
+
+Compares the vectorized pack/unpack paths against the original
+per-trit Python loop. Run from the package root:
+
+    python benchmarks/bench_packed.py
+"""
+
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from trinity_vsa import PackedTritVec, TritVector, pack_trits, unpack_trits  # noqa: E402
+from _timing import measure  # noqa: E402
+
+DIM = 10_000
+MIN_SPEEDUP = 100.0
+
+
+def loop_pack(data):
+    """Reference scalar pack (the pre-vectorization implementation)."""
+    words = (len(data) + 63) // 64
+    pos = np.zeros(words, dtype=np.uint64)
+    neg = np.zeros(words, dtype=np.uint64)
+    for i, trit in enumerate(data):
+        if trit == 1:
+            pos[i // 64] |= np.uint64(1) << np.uint64(i % 64)
+        elif trit == -1:
+            neg[i // 64] |= np.uint64(1) << np.uint64(i % 64)
+    return pos, neg
+
+
+def loop_unpack(pos, neg, dim):
+    """Reference scalar unpack (the pre-vectorization implementation)."""
+    data = np.zeros(dim, dtype=np.int8)
+    for i in range(dim):
+        mask = np.uint64(1) << np.uint64(i % 64)
+        if pos[i // 64] & mask:
+            data[i] = 1
+        elif neg[i // 64] & mask:
+            data[i] = -1
+    return data
+
+
+def main():
+    v = TritVector.random(DIM, seed=42)
+    packed = PackedTritVec.from_trit_vector(v)
+
+    ref_pos, ref_neg = loop_pack(v.data)
+    assert np.array_equal(ref_pos, packed.pos) and np.array_equal(ref_neg, packed.neg)
+    assert np.array_equal(loop_unpack(packed.pos, packed.neg, DIM), v.data)
+
+    results = []
+    t_loop = measure(lambda: loop_pack(v.data), 3)
+    t_vec = measure(lambda: PackedTritVec.from_trit_vector(v), 200)
+    results.append(("pack", t_loop, t_vec))
+
+    t_loop = measure(lambda: loop_unpack(packed.pos, packed.neg, DIM), 3)
+    t_vec = measure(packed.to_trit_vector, 200)
+    results.append(("unpack", t_loop, t_vec))
+
+    print(f"PackedTritVec pack/unpack, dim={DIM}")
+    print(f"{'op':<10} {'loop (ms)':>12} {'vectorized (µs)':>16} {'speedup':>10}")
+    ok = True
+    for name, t_loop, t_vec in results:
+        speedup = t_loop / t_vec
+        ok &= speedup >= MIN_SPEEDUP
+        print(f"{name:<10} {t_loop * 1e3:>12.2f} {t_vec * 1e6:>16.2f} {speedup:>9.0f}x")
+
+    batch = np.random.default_rng(0).integers(-1, 2, size=(10_000, DIM), dtype=np.int8)
+    t_pack = measure(lambda: pack_trits(batch), 3)
+    pos, neg = pack_trits(batch)
+    t_unpack = measure(lambda: unpack_trits(pos, neg, DIM), 3)
+    print(f"\nbatch of {len(batch)} vectors:")
+    print(f"  pack   {len(batch) / t_pack:>12,.0f} vectors/s")
+    print(f"  unpack {len(batch) / t_unpack:>12,.0f} vectors/s")
+
+    if not ok:
+        print(f"\nFAIL: speedup below {MIN_SPEEDUP:.0f}x")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
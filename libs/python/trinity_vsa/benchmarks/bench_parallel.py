@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Parallel scaling benchmark: ParallelExecutor vs worker count
+
+Times batched bind, similarity, bundle and sequence encoding for each
+worker count and reports the speedup over one worker. Worker counts above
+the machine's core count are still run, but they cannot scale. Run from
+the package root:
+
+    python benchmarks/bench_parallel.py [--workers 1,2,4,8,16,32] [--backend thread]
+"""
+
+import argparse
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from trinity_vsa import TritMatrix, TritVector  # noqa: E402
+from trinity_vsa.parallel import ParallelExecutor  # noqa: E402
+from _timing import measure  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--workers", default="1,2,4,8,16,32")
+    parser.add_argument("--backend", choices=["thread", "process"], default="thread")
+    parser.add_argument("--n", type=int, default=65_536, help="rows per batch")
+    parser.add_argument("--dim", type=int, default=10_000)
+    parser.add_argument("--queries", type=int, default=64)
+    parser.add_argument("--seq-len", type=int, default=8)
+    args = parser.parse_args()
+
+    counts = [int(w) for w in args.workers.split(",")]
+    matrix = TritMatrix.random(args.n, args.dim, seed=0)
+    role = TritVector.random(args.dim, seed=1)
+    queries = TritMatrix.random(args.queries, args.dim, seed=2)
+    codebook = TritMatrix.random(4096, args.dim, seed=3)
+    ids = np.random.default_rng(4).integers(0, len(codebook), size=(args.n // 8, args.seq_len))
+
+    jobs = {
+        "bind": lambda ex: ex.bind(matrix, role),
+        "similarity": lambda ex: ex.similarity(matrix, queries),
+        "bundle": lambda ex: ex.bundle(matrix),
+        "encode_sequences": lambda ex: ex.encode_sequences(ids, codebook),
+    }
+
+    print(f"trinity-vsa parallel scaling ({args.backend} backend, "
+          f"{os.cpu_count()} cores, N={args.n:,}, dim={args.dim:,})")
+    print()
+    print(f"{'job':<18}" + "".join(f"{w:>10}w" for w in counts))
+    for name, job in jobs.items():
+        times = []
+        for workers in counts:
+            with ParallelExecutor(workers=workers, backend=args.backend) as ex:
+                times.append(measure(lambda: job(ex), 3))
+        print(f"{name:<18}" + "".join(f"{t * 1e3:>9.1f}ms" for t in times))
+        print(f"{'  speedup':<18}" + "".join(f"{times[0] / t:>10.2f}x" for t in times))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite: every op in ops.py on every vector type in core.py
+
+Runs each (op, type) pair across dimensions, densities (fraction of
+non-zero trits) and, for ops that take many vectors, batch sizes. For
+every case it reports calls per second, bytes allocated per call
+(tracemalloc peak) and the process peak RSS. Results can be written as
+JSON and compared against an earlier run, so speedups and regressions
+show up on every change. Run from the package root:
+
+    python benchmarks/bench_suite.py --json base.json            # store a baseline
+    python benchmarks/bench_suite.py --baseline base.json        # compare
+    python benchmarks/bench_suite.py --dims 10000 --filter bind --fail-on-regression
+"""
+
+import argparse
+import functools
+import json
+import os
+import platform
+import re
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from trinity_vsa import CountVector, PackedTritVec, SparseVec, TritVector  # noqa: E402
+from trinity_vsa.ops import (  # noqa: E402
+    bind, bundle, cleanup, dot_many, dot_product, encode_sequence, hamming_distance,
+    permute, similarity, similarity_many, unbind,
+)
+from _timing import measure  # noqa: E402
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+SCHEMA = 1
+
+
+def random_trits(dim, density, rng):
+    """int8 trits with the given fraction of non-zeros (signs equally likely)."""
+    data = np.zeros(dim, dtype=np.int8)
+    nnz = int(round(dim * density))
+    idx = rng.choice(dim, size=nnz, replace=False)
+    data[idx] = rng.choice(np.array([-1, 1], dtype=np.int8), size=nnz)
+    return data
+
+
+def make(kind, data):
+    """Wrap int8 trits as the vector type under test."""
+    dense = TritVector.from_trusted(data)
+    if kind == "dense":
+        return dense
+    if kind == "packed":
+        return PackedTritVec.from_trit_vector(dense)
+    if kind == "sparse":
+        return SparseVec.from_trit_vector(dense)
+    return CountVector.from_vectors([dense])
+
+
+def operand(kind, v):
+    """Second operand of bind/unbind: a CountVector binds with a SparseVec."""
+    return SparseVec.from_trit_vector(v.threshold()) if kind == "count" else v
+
+
+# op -> (vector types, takes a batch, builder(kind, vectors) -> zero-arg callable).
+# ``vectors`` holds max(batch, 2) vectors of the type under test.
+CASES = {
+    "bind": (("dense", "sparse", "count"), False,
+             lambda k, v: functools.partial(bind, v[0], operand(k, v[1]))),
+    "bind_packed": (("packed",), False, lambda k, v: lambda: v[0].bind(v[1])),
+    "unbind": (("dense", "sparse", "count"), False,
+               lambda k, v: functools.partial(unbind, v[0], operand(k, v[1]))),
+    "bundle": (("dense", "sparse", "count"), True, lambda k, v: lambda: bundle(v)),
+    "permute": (("dense", "sparse", "count"), False, lambda k, v: lambda: permute(v[0], 7)),
+    "similarity": (("dense", "sparse", "count"), False,
+                   lambda k, v: lambda: similarity(v[0], v[1])),
+    "similarity_packed": (("packed",), False, lambda k, v: lambda: v[0].similarity(v[1])),
+    "dot_product": (("dense", "sparse", "count"), False,
+                    lambda k, v: lambda: dot_product(v[0], v[1])),
+    "dot_packed": (("packed",), False, lambda k, v: lambda: v[0].dot(v[1])),
+    "hamming_distance": (("dense", "packed"), False,
+                         lambda k, v: lambda: hamming_distance(v[0], v[1])),
+    "dot_many": (("packed",), True, lambda k, v: lambda: dot_many(v[0], v)),
+    "similarity_many": (("packed",), True, lambda k, v: lambda: similarity_many(v[0], v)),
+    "encode_sequence": (("dense",), True, lambda k, v: lambda: encode_sequence(v)),
+    "cleanup": (("dense",), True, lambda k, v: lambda: cleanup(v[0], v)),
+    "pack": (("dense",), False, lambda k, v: lambda: PackedTritVec.from_trit_vector(v[0])),
+    "unpack": (("packed",), False, lambda k, v: lambda: v[0].to_trit_vector()),
+    "to_sparse": (("dense",), False, lambda k, v: lambda: SparseVec.from_trit_vector(v[0])),
+    "count_add": (("count",), False, lambda k, v: lambda: v[0].add(v[1])),
+    "threshold": (("count",), False, lambda k, v: lambda: v[0].threshold()),
+}
+
+
+def allocated(func):
+    """Peak bytes allocated (and traced) during one call."""
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def peak_rss():
+    """Peak resident set size of this process in bytes (None if unknown)."""
+    if resource is None:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss if sys.platform == "darwin" else rss * 1024
+
+
+def run(args):
+    pattern = re.compile(args.filter) if args.filter else None
+    results = {}
+    for dim in args.dims:
+        for density in args.densities:
+            rng = np.random.default_rng(0)
+            pool = [random_trits(dim, density, rng) for _ in range(max(max(args.batches), 2))]
+            for op, (kinds, batched, builder) in CASES.items():
+                for kind in kinds:
+                    for batch in (args.batches if batched else [None]):
+                        key = f"{op}/{kind}/dim={dim}/density={density:g}"
+                        if batch is not None:
+                            key += f"/batch={batch}"
+                        if pattern and not pattern.search(key):
+                            continue
+                        vectors = [make(kind, d) for d in pool[:max(batch or 2, 2)]]
+                        func = builder(kind, vectors)
+                        seconds = measure(func, args.repeat, args.min_time)
+                        results[key] = {
+                            "op": op, "type": kind, "dim": dim, "density": density,
+                            "batch": batch,
+                            "ops_per_sec": 1.0 / seconds,
+                            "seconds_per_op": seconds,
+                            "bytes_per_op": allocated(func),
+                        }
+                        yield key, results[key]
+
+
+def compare(result, base, tolerance):
+    """(ratio, status) of a case against its baseline entry."""
+    if base is None:
+        return None, "new"
+    ratio = result["ops_per_sec"] / base["ops_per_sec"]
+    if ratio < 1.0 - tolerance:
+        return ratio, "REGRESSION"
+    if ratio > 1.0 + tolerance:
+        return ratio, "faster"
+    return ratio, ""
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--dims", type=lambda s: [int(x) for x in s.split(",")],
+                        default=[1_000, 10_000, 100_000])
+    parser.add_argument("--densities", type=lambda s: [float(x) for x in s.split(",")],
+                        default=[0.67, 0.05], help="fractions of non-zero trits")
+    parser.add_argument("--batches", type=lambda s: [int(x) for x in s.split(",")],
+                        default=[16, 256], help="vectors per call for batched ops")
+    parser.add_argument("--filter", help="regex on case keys, e.g. 'bind|bundle/sparse'")
+    parser.add_argument("--min-time", type=float, default=0.05,
+                        help="seconds per timing repeat")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--json", help="write results to this file")
+    parser.add_argument("--baseline", help="JSON from an earlier run to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.10,
+                        help="relative ops/sec change reported as faster/regression")
+    parser.add_argument("--fail-on-regression", action="store_true",
+                        help="exit with status 1 if any case regressed")
+    args = parser.parse_args()
+
+    baseline = {}
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)["results"]
+
+    print(f"trinity-vsa benchmark suite (numpy {np.__version__}, "
+          f"{platform.python_implementation()} {platform.python_version()})")
+    print()
+    print(f"{'case':<58}{'ops/s':>12}{'bytes/op':>12}" + (f"{'vs base':>10}" if baseline else ""))
+    results = {}
+    regressions = []
+    for key, result in run(args):
+        results[key] = result
+        line = f"{key:<58}{result['ops_per_sec']:>12,.0f}{result['bytes_per_op']:>12,}"
+        if baseline:
+            ratio, status = compare(result, baseline.get(key), args.tolerance)
+            line += f"{'-' if ratio is None else f'{ratio:.2f}x':>10}  {status}"
+            if status == "REGRESSION":
+                regressions.append(key)
+        print(line)
+
+    rss = peak_rss()
+    print()
+    if rss is not None:
+        print(f"peak RSS: {rss / 2**20:,.1f} MiB")
+    if baseline:
+        print(f"{len(regressions)} regression(s) beyond {args.tolerance:.0%}")
+
+    if args.json:
+        report = {
+            "schema": SCHEMA,
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "machine": {
+                "platform": platform.platform(),
+                "python": platform.python_version(),
+                "numpy": np.__version__,
+                "cpu_count": os.cpu_count(),
+            },
+            "peak_rss_bytes": rss,
+            "results": results,
+        }
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=1, sort_keys=True)
+        print(f"wrote {len(results)} results to {args.json}")
+
+    if args.fail_on_regression and regressions:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
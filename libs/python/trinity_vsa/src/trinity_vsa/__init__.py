@@ -16,8 +16,33 @@ from .core import (
     TritVector,
     PackedTritVec,
     SparseVec,
+    CountVector,
+    pack_trits,
+    unpack_trits,
 )
 
+from .matrix import TritMatrix
+from .accumulator import BundleAccumulator
+from .permutation import Permutation, encode_sequences
+from .sparse import auto_format, to_sparse, to_dense
+from .parallel import ParallelExecutor
+from .memory import ItemMemory
+from .symbols import SymbolTable
+from .index import LSHIndex
+from .pairwise import pairwise_hamming, pairwise_similarity, top_k_hamming
+from .resonator import Resonator
+from .classifier import HDClassifier
+from .encoders import (
+    NGramEncoder,
+    LevelEncoder,
+    ThermometerEncoder,
+    FractionalPowerEncoder,
+    RecordEncoder,
+)
+from .tryte import TryteArray
+from .codec import encode_base243, decode_base243
+from .storage import MappedCodebook, save_codebook, open_codebook
+
 from .ops import (
     bind,
     unbind,
@@ -25,6 +50,8 @@ from .ops import (
     permute,
     similarity,
     hamming_distance,
+    dot_many,
+    similarity_many,
 )
 
 __version__ = "0.1.0"
@@ -33,10 +60,42 @@ __all__ = [
     "TritVector",
     "PackedTritVec",
     "SparseVec",
+    "CountVector",
+    "pack_trits",
+    "unpack_trits",
+    "TritMatrix",
+    "BundleAccumulator",
+    "Permutation",
+    "encode_sequences",
+    "auto_format",
+    "to_sparse",
+    "to_dense",
+    "ParallelExecutor",
+    "ItemMemory",
+    "SymbolTable",
+    "LSHIndex",
+    "Resonator",
+    "HDClassifier",
+    "NGramEncoder",
+    "LevelEncoder",
+    "ThermometerEncoder",
+    "FractionalPowerEncoder",
+    "RecordEncoder",
+    "TryteArray",
+    "encode_base243",
+    "decode_base243",
+    "MappedCodebook",
+    "save_codebook",
+    "open_codebook",
     "bind",
     "unbind",
     "bundle",
     "permute",
     "similarity",
     "hamming_distance",
+    "pairwise_hamming",
+    "pairwise_similarity",
+    "top_k_hamming",
+    "dot_many",
+    "similarity_many",
 ]
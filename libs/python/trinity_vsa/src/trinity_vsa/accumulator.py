@@ -0,0 +1,178 @@
+"""Streaming majority bundling with O(dim) memory."""
+
+from typing import Iterable, Optional, Union
+import numpy as np
+
+from .core import TritVector, SparseVec, CountVector
+from .matrix import TritMatrix
+
+# Rows summed per step when adding a whole matrix; bounds the reduction
+# temporaries while keeping the per-call overhead negligible
+_ADD_CHUNK = 4096
+
+
+class BundleAccumulator:
+    """Running integer sum of trit vectors, thresholded on demand.
+
+    Equivalent to ``bundle(vectors)`` but vectors can be added one at a
+    time, removed again, or accumulated in separate shards and merged,
+    while memory stays at one integer array of length ``dim``.
+
+    The sum starts as ``dtype`` (int16 or int32) and is widened
+    automatically before it could overflow.
+
+    Example:
+        >>> acc = BundleAccumulator(10000)
+        >>> for ngram in document_ngrams():
+        ...     acc.add(ngram)
+        >>> doc_vector = acc.finalize()
+    """
+
+    def __init__(self, dim: int, dtype=np.int32):
+        """Create an empty accumulator.
+
+        Args:
+            dim: Vector dimension
+            dtype: Integer type of the running sum (np.int16 or np.int32)
+        """
+        self._sums = np.zeros(dim, dtype=dtype)
+        self._count = 0
+        # Upper bound on max(|sums|), tracked instead of recomputed per add
+        self._bound = 0
+
+    @property
+    def dim(self) -> int:
+        return len(self._sums)
+
+    @property
+    def count(self) -> int:
+        """Net number of vectors added (adds minus subtracts)."""
+        return self._count
+
+    @property
+    def sums(self) -> np.ndarray:
+        """Current per-dimension sums (read-only view)."""
+        view = self._sums.view()
+        view.flags.writeable = False
+        return view
+
+    def __repr__(self) -> str:
+        return f"BundleAccumulator(dim={self.dim}, count={self._count}, dtype={self._sums.dtype})"
+
+    def _reserve(self, extra: int):
+        """Widen the sum dtype if ``extra`` more unit additions could overflow.
+
+        Raises:
+            OverflowError: If the sums could leave the int64 range
+        """
+        bound = self._bound + extra
+        if bound > np.iinfo(np.int64).max:
+            raise OverflowError("Bundle sums could exceed the int64 range")
+        self._bound = bound
+        dtype = self._sums.dtype
+        while self._bound > np.iinfo(dtype).max:
+            dtype = np.dtype(np.int32) if dtype == np.int16 else np.dtype(np.int64)
+        if dtype != self._sums.dtype:
+            self._sums = self._sums.astype(dtype)
+
+    def add(self, v: Union[TritVector, SparseVec], weight: int = 1) -> "BundleAccumulator":
+        """Add one vector, optionally with an integer weight.
+
+        A SparseVec is scatter-added at its non-zero indices in O(nnz).
+        """
+        assert v.dim == self.dim, "Vectors must have same dimension"
+        self._reserve(abs(weight))
+        if isinstance(v, SparseVec):
+            # indices are unique, so a fancy-index += is a correct scatter-add
+            self._sums[v.indices] += v.values.astype(self._sums.dtype) * self._sums.dtype.type(weight)
+        elif weight == 1:
+            self._sums += v.data
+        else:
+            self._sums += v.data * self._sums.dtype.type(weight)
+        self._count += weight
+        return self
+
+    def subtract(self, v: Union[TritVector, SparseVec]) -> "BundleAccumulator":
+        """Remove a previously added vector."""
+        return self.add(v, weight=-1)
+
+    def add_many(self, vectors: Union[TritMatrix, np.ndarray,
+                                      Iterable[Union[TritVector, SparseVec]]]
+                 ) -> "BundleAccumulator":
+        """Add a batch of vectors.
+
+        Args:
+            vectors: TritMatrix or (N, dim) array (reduced in chunks), or
+                any iterable of TritVector/SparseVec, including generators
+                (consumed one vector at a time)
+        """
+        if isinstance(vectors, TritMatrix):
+            vectors = vectors.data
+        if isinstance(vectors, np.ndarray):
+            rows = np.atleast_2d(vectors)
+            assert rows.shape[1] == self.dim, "Vectors must have same dimension"
+            self._reserve(len(rows))
+            for start in range(0, len(rows), _ADD_CHUNK):
+                chunk = rows[start:start + _ADD_CHUNK]
+                self._sums += chunk.sum(axis=0, dtype=self._sums.dtype)
+            self._count += len(rows)
+            return self
+        for v in vectors:
+            self.add(v)
+        return self
+
+    def merge(self, other: "BundleAccumulator") -> "BundleAccumulator":
+        """Fold another accumulator's sums into this one (reduce step)."""
+        assert other.dim == self.dim, "Vectors must have same dimension"
+        self._reserve(other._bound)
+        self._sums += other._sums.astype(self._sums.dtype)
+        self._count += other._count
+        return self
+
+    def to_count_vector(self) -> CountVector:
+        """Snapshot of the running sum as a CountVector (copied)."""
+        return CountVector(self._sums, dtype=self._sums.dtype, count=self._count)
+
+    def reset(self):
+        """Clear all accumulated vectors."""
+        self._sums[:] = 0
+        self._count = 0
+        self._bound = 0
+
+    def finalize(self, threshold: int = 0,
+                 tie_break: Union[None, str, TritVector] = None,
+                 seed: Optional[int] = None,
+                 out: Optional[TritVector] = None) -> TritVector:
+        """Threshold the running sum into a bundled TritVector.
+
+        Args:
+            threshold: Sums with ``|sum| <= threshold`` become 0
+            tie_break: How to resolve dimensions that come out 0:
+                None keeps 0 (same as ``bundle``), "random" draws +1/-1,
+                a TritVector copies its value at those positions
+            seed: Random seed for ``tie_break="random"``
+            out: Optional vector to write the result into
+
+        Returns:
+            Bundled vector (``out`` if given)
+        """
+        if out is None:
+            out = TritVector.zeros(self.dim)
+        assert out.dim == self.dim, "Output must have same dimension"
+        result = out.data
+        np.sign(self._sums, out=result, casting="unsafe")
+        if threshold > 0:
+            result[np.abs(self._sums) <= threshold] = 0
+        if tie_break is None:
+            return out
+
+        ties = result == 0
+        if isinstance(tie_break, TritVector):
+            assert tie_break.dim == self.dim, "Vectors must have same dimension"
+            result[ties] = tie_break.data[ties]
+        elif tie_break == "random":
+            rng = np.random.default_rng(seed)
+            result[ties] = rng.choice(np.array([-1, 1], dtype=np.int8), size=int(ties.sum()))
+        else:
+            raise ValueError(f"Unknown tie_break {tie_break!r}")
+        return out
@@ -0,0 +1,213 @@
+"""Hyperdimensional classifier: class prototypes as integer superpositions."""
+
+from typing import Dict, Hashable, List, Optional, Sequence
+import numpy as np
+
+from .matrix import Queries, TritMatrix, as_rows, normalize_rows
+from .profiling import instrumented
+
+# Samples processed per step; bounds the float32 and sorted-copy
+# temporaries to a few hundred MB at dim=10k
+_CHUNK = 8192
+
+
+def _group_sum(rows: np.ndarray, groups: np.ndarray, num_groups: int) -> np.ndarray:
+    """Per-group int32 sums of ``rows`` as a (num_groups, dim) array."""
+    sums = np.zeros((num_groups, rows.shape[1]), dtype=np.int32)
+    if not len(rows):
+        return sums
+    if np.any(groups[1:] < groups[:-1]):
+        order = np.argsort(groups, kind="stable")
+        groups, rows = groups[order], rows[order]
+    starts = np.flatnonzero(np.r_[True, groups[1:] != groups[:-1]])
+    sums[groups[starts]] = np.add.reduceat(rows, starts, axis=0, dtype=np.int32)
+    return sums
+
+
+class HDClassifier:
+    """Prototype classifier over encoded hypervectors.
+
+    Each class is the running integer sum of its training vectors, one
+    row per class of a (C, dim) int32 matrix. Scores are cosine
+    similarities against the L2-normalized sums, so classes with more
+    training samples do not win by magnitude.
+    Training is a grouped row sum, and retraining is perceptron-style:
+    each misclassified sample is added to its true class and subtracted
+    from the predicted one, applied as one grouped update per chunk.
+    Prediction scores a whole batch against all prototypes with one
+    float32 matmul.
+
+    Args:
+        dim: Vector dimension
+        epochs: Retraining epochs run by ``fit`` after the first pass
+        lr: Integer weight of a retraining update
+        binarize: Score against thresholded (sign) prototypes instead
+            of the raw counts
+        temperature: Softmax temperature of ``predict_proba`` (on
+            cosine similarities)
+
+    Example:
+        >>> clf = HDClassifier(10000, epochs=3).fit(X_train, y_train)
+        >>> clf.predict(X_test)
+        >>> for X, y in stream:
+        ...     clf.partial_fit(X, y)
+    """
+
+    def __init__(self, dim: int, epochs: int = 0, lr: int = 1,
+                 binarize: bool = False, temperature: float = 0.05):
+        self.dim = dim
+        self.epochs = epochs
+        self.lr = lr
+        self.binarize = binarize
+        self.temperature = temperature
+        self.classes_: List[Hashable] = []
+        self._index: Dict[Hashable, int] = {}
+        self._sums = np.zeros((0, dim), dtype=np.int32)
+        self._normed: Optional[np.ndarray] = None
+
+    def __repr__(self) -> str:
+        return f"HDClassifier(dim={self.dim}, classes={len(self.classes_)})"
+
+    @property
+    def counts(self) -> np.ndarray:
+        """Per-class sums, shape (C, dim) (read-only view)."""
+        view = self._sums.view()
+        view.flags.writeable = False
+        return view
+
+    @property
+    def prototypes(self) -> TritMatrix:
+        """Thresholded class prototypes, one row per class."""
+        return TritMatrix.from_trusted(np.sign(self._sums).astype(np.int8))
+
+    def _class_indices(self, y: Sequence[Hashable], grow: bool) -> np.ndarray:
+        """Map labels to prototype rows, adding unseen classes if ``grow``."""
+        labels, inverse = np.unique(np.asarray(y), return_inverse=True)
+        rows = np.empty(len(labels), dtype=np.int64)
+        for i, label in enumerate(labels.tolist()):
+            if label not in self._index:
+                if not grow:
+                    raise KeyError(f"Unknown class: {label!r}")
+                self._index[label] = len(self.classes_)
+                self.classes_.append(label)
+            rows[i] = self._index[label]
+        extra = len(self.classes_) - len(self._sums)
+        if extra:
+            self._sums = np.vstack([self._sums, np.zeros((extra, self.dim), dtype=np.int32)])
+        return rows[inverse.ravel()]
+
+    def _update(self, delta: np.ndarray):
+        self._sums += delta
+        self._normed = None
+
+    def _scores(self, rows: np.ndarray) -> np.ndarray:
+        if self._normed is None:
+            if self.binarize:
+                self._normed = normalize_rows(np.sign(self._sums))
+            else:
+                # count rows: divide by the true L2 norm, not sqrt(nnz)
+                protos = self._sums.astype(np.float32)
+                norms = np.linalg.norm(protos, axis=1, keepdims=True)
+                np.divide(protos, norms, out=protos, where=norms != 0)
+                self._normed = protos
+        return normalize_rows(rows) @ self._normed.T
+
+    def reset(self):
+        """Forget all classes."""
+        self.classes_ = []
+        self._index = {}
+        self._sums = np.zeros((0, self.dim), dtype=np.int32)
+        self._normed = None
+
+    @instrumented
+    def partial_fit(self, X: Queries, y: Sequence[Hashable]) -> "HDClassifier":
+        """Add a batch of samples to their class sums (new labels become classes).
+
+        Args:
+            X: TritMatrix, (N, dim) array or sequence of TritVector
+            y: N class labels
+        """
+        rows = as_rows(X)
+        assert rows.shape[1] == self.dim, "Vectors must have same dimension"
+        assert len(rows) == len(y), "Need one label per sample"
+        targets = self._class_indices(y, grow=True)
+        for start in range(0, len(rows), _CHUNK):
+            stop = start + _CHUNK
+            self._update(_group_sum(rows[start:stop], targets[start:stop], len(self.classes_)))
+        return self
+
+    @instrumented
+    def retrain(self, X: Queries, y: Sequence[Hashable], epochs: int = 1) -> int:
+        """Perceptron-style retraining passes over a labelled batch.
+
+        Within each chunk all samples are scored at once; the
+        misclassified ones are added (weight ``lr``) to their true class
+        and subtracted from the predicted class.
+
+        Returns:
+            Number of misclassified samples in the last epoch
+        """
+        rows = as_rows(X)
+        targets = self._class_indices(y, grow=False)
+        errors = 0
+        for _ in range(epochs):
+            errors = 0
+            for start in range(0, len(rows), _CHUNK):
+                chunk = rows[start:start + _CHUNK]
+                truth = targets[start:start + _CHUNK]
+                pred = np.argmax(self._scores(chunk), axis=1)
+                wrong = np.flatnonzero(pred != truth)
+                if not len(wrong):
+                    continue
+                errors += len(wrong)
+                num = len(self.classes_)
+                delta = (_group_sum(chunk[wrong], truth[wrong], num)
+                         - _group_sum(chunk[wrong], pred[wrong], num))
+                self._update(delta * np.int32(self.lr))
+            if errors == 0:
+                break
+        return errors
+
+    def fit(self, X: Queries, y: Sequence[Hashable],
+            epochs: Optional[int] = None) -> "HDClassifier":
+        """Train from scratch: one accumulation pass plus retraining epochs.
+
+        Args:
+            X: TritMatrix, (N, dim) array or sequence of TritVector
+            y: N class labels
+            epochs: Retraining epochs (default ``self.epochs``)
+        """
+        self.reset()
+        self.partial_fit(X, y)
+        epochs = self.epochs if epochs is None else epochs
+        if epochs:
+            self.retrain(X, y, epochs)
+        return self
+
+    @instrumented
+    def decision_function(self, X: Queries) -> np.ndarray:
+        """Cosine similarity of each sample to each class, shape (N, C)."""
+        rows = as_rows(X)
+        assert rows.shape[1] == self.dim, "Vectors must have same dimension"
+        assert self.classes_, "Classifier is not fitted"
+        out = np.empty((len(rows), len(self.classes_)), dtype=np.float32)
+        for start in range(0, len(rows), _CHUNK):
+            out[start:start + _CHUNK] = self._scores(rows[start:start + _CHUNK])
+        return out
+
+    def predict(self, X: Queries) -> np.ndarray:
+        """Most similar class label for each sample."""
+        best = np.argmax(self.decision_function(X), axis=1)
+        return np.asarray(self.classes_)[best]
+
+    def predict_proba(self, X: Queries) -> np.ndarray:
+        """Softmax over class similarities, shape (N, C) (columns follow ``classes_``)."""
+        logits = self.decision_function(X) / np.float32(self.temperature)
+        logits -= logits.max(axis=1, keepdims=True)
+        np.exp(logits, out=logits)
+        logits /= logits.sum(axis=1, keepdims=True)
+        return logits
+
+    def score(self, X: Queries, y: Sequence[Hashable]) -> float:
+        """Classification accuracy on a labelled batch."""
+        return float(np.mean(self.predict(X) == np.asarray(y)))
@@ -0,0 +1,78 @@
+"""Dense base-243 storage codec: 5 trits per byte.
+
+Balanced ternary packs 5 digits into one byte because 3**5 = 243 <= 256,
+giving 1.6 bits per trit versus 2 bits for the pos/neg bit planes of
+PackedTritVec (20% smaller). The codec is meant for storage and
+transfer; decode to int8 or packed planes before computing.
+
+Encoding:
+    byte = sum((t[i] + 1) * 3**i for i in range(5))
+
+where ``t[0..4]`` are the five trits of a group, least significant
+first. The final group of a vector is zero-padded.
+"""
+
+import numpy as np
+
+TRITS_PER_BYTE = 5
+
+# _DECODE_TABLE[b] holds the 5 trits of byte b; bytes 243..255 are
+# invalid and decode to zeros
+_DECODE_TABLE = np.zeros((256, TRITS_PER_BYTE), dtype=np.int8)
+_DECODE_TABLE[:243] = (np.arange(243)[:, None] // (3 ** np.arange(TRITS_PER_BYTE))) % 3 - 1
+
+# Same table with rows padded to 8 bytes and viewed as one little-endian
+# uint64 each, so decoding is a scalar gather instead of a row gather
+_DECODE_WORDS = np.zeros((256, 8), dtype=np.int8)
+_DECODE_WORDS[:, :TRITS_PER_BYTE] = _DECODE_TABLE
+_DECODE_WORDS = _DECODE_WORDS.view("<u8").ravel()
+
+
+def encoded_size(dim: int) -> int:
+    """Bytes needed to store ``dim`` trits."""
+    return (dim + TRITS_PER_BYTE - 1) // TRITS_PER_BYTE
+
+
+def encode_base243(data: np.ndarray) -> np.ndarray:
+    """Encode trits as base-243 bytes.
+
+    Args:
+        data: Array of values in {-1, 0, 1}, shape (dim,) or (..., dim)
+
+    Returns:
+        uint8 array of shape (..., ceil(dim / 5))
+
+    Example:
+        >>> encode_base243(np.array([1, 0, -1, 0, 0, 1], dtype=np.int8))
+        array([113, 122], dtype=uint8)
+    """
+    data = np.asarray(data)
+    dim = data.shape[-1]
+    nbytes = encoded_size(dim)
+    digits = np.ones(data.shape[:-1] + (nbytes * TRITS_PER_BYTE,), dtype=np.uint8)
+    np.add(digits[..., :dim], data, out=digits[..., :dim], casting="unsafe")
+    digits = digits.reshape(data.shape[:-1] + (nbytes, TRITS_PER_BYTE))
+    # Horner's rule over the 5 digits; the max value is 242, so uint8
+    # arithmetic never overflows
+    out = digits[..., TRITS_PER_BYTE - 1].copy()
+    for i in range(TRITS_PER_BYTE - 2, -1, -1):
+        out *= 3
+        out += digits[..., i]
+    return out
+
+
+def decode_base243(encoded: np.ndarray, dim: int) -> np.ndarray:
+    """Decode base-243 bytes back to trits with one table lookup.
+
+    Args:
+        encoded: uint8 array of shape (..., ceil(dim / 5))
+        dim: Number of trits per vector
+
+    Returns:
+        int8 array of shape (..., dim)
+    """
+    encoded = np.asarray(encoded, dtype=np.uint8)
+    words = np.take(_DECODE_WORDS, encoded)
+    trits = words.view(np.int8).reshape(encoded.shape + (8,))[..., :TRITS_PER_BYTE]
+    width = encoded.shape[-1] * TRITS_PER_BYTE
+    return trits.reshape(encoded.shape[:-1] + (width,))[..., :dim]
@@ -1,7 +1,7 @@
 """Core types for Trinity VSA."""
 
 from enum import IntEnum
-from typing import List, Optional, Union
+from typing import List, Optional, Tuple, Union
 import numpy as np
 
 
@@ -21,7 +21,29 @@ class Trit(IntEnum):
         return cls.ZERO
 
 
-class TritVector:
+class _Serializable:
+    """Compact wire format and pickling, implemented in ``serialize``."""
+    
+    def to_bytes(self) -> bytes:
+        """Serialize to one frame (dense data travels as 2-bit planes)."""
+        from .serialize import dumps
+        return dumps(self)
+    
+    @classmethod
+    def from_bytes(cls, buffer) -> "_Serializable":
+        """Read a frame from any buffer-protocol object."""
+        from .serialize import loads
+        obj = loads(buffer)
+        if not isinstance(obj, cls):
+            raise TypeError(f"Frame holds a {type(obj).__name__}, not a {cls.__name__}")
+        return obj
+    
+    def __reduce_ex__(self, protocol: int):
+        from .serialize import reduce_ex
+        return reduce_ex(self, protocol)
+
+
+class TritVector(_Serializable):
     """Dense vector of balanced ternary values.
     
     Attributes:
@@ -34,13 +56,25 @@ class TritVector:
     """
     
     def __init__(self, data: np.ndarray):
-        """Create from numpy array."""
+        """Create from numpy array (values are clipped to [-1, 1] and copied)."""
         self.data = np.clip(data, -1, 1).astype(np.int8)
     
+    @classmethod
+    def from_trusted(cls, data: np.ndarray) -> "TritVector":
+        """Wrap an int8 array already known to hold only {-1, 0, 1}.
+        
+        Skips the clip and copy done by the constructor; the vector shares
+        memory with ``data``. Use for results of trit-closed operations
+        (products, shifts, signs) and for preallocated ``out=`` buffers.
+        """
+        v = cls.__new__(cls)
+        v.data = data
+        return v
+    
     @classmethod
     def zeros(cls, dim: int) -> "TritVector":
         """Create zero vector."""
-        return cls(np.zeros(dim, dtype=np.int8))
+        return cls.from_trusted(np.zeros(dim, dtype=np.int8))
     
     @classmethod
     def random(cls, dim: int, seed: Optional[int] = None) -> "TritVector":
@@ -96,7 +130,23 @@ class TritVector:
         self.data[idx] = int(value)
     
     def __neg__(self) -> "TritVector":
-        return TritVector(-self.data)
+        return TritVector.from_trusted(-self.data)
+    
+    def neg_(self) -> "TritVector":
+        """Negate in place."""
+        np.negative(self.data, out=self.data)
+        return self
+    
+    def bind_(self, other: "TritVector") -> "TritVector":
+        """Bind with ``other`` in place."""
+        assert self.dim == other.dim, "Vectors must have same dimension"
+        np.multiply(self.data, other.data, out=self.data)
+        return self
+    
+    def permute_(self, shift: int) -> "TritVector":
+        """Circularly shift in place (same semantics as ``permute``)."""
+        _roll_into(self.data, shift, self.data)
+        return self
     
     def __eq__(self, other: "TritVector") -> bool:
         return np.array_equal(self.data, other.data)
@@ -109,7 +159,106 @@ class TritVector:
         return self.data.copy()
 
 
-class PackedTritVec:
+def _roll_into(src: np.ndarray, shift: int, out: np.ndarray) -> np.ndarray:
+    """``np.roll(src, shift)`` written into ``out``, which may alias ``src``."""
+    dim = src.shape[-1]
+    k = shift % dim if dim else 0
+    if k == 0:
+        if out is not src:
+            out[...] = src
+        return out
+    tail = src[..., dim - k:].copy()
+    out[..., k:] = src[..., :dim - k]
+    out[..., :k] = tail
+    return out
+
+
+WORD_BITS = 64
+
+
+def num_words(dim: int) -> int:
+    """Number of uint64 words needed to hold ``dim`` bits."""
+    return (dim + WORD_BITS - 1) // WORD_BITS
+
+
+def _pack_bits(bits: np.ndarray) -> np.ndarray:
+    """Pack a boolean (..., dim) array into (..., words) uint64 little-endian words."""
+    dim = bits.shape[-1]
+    words = num_words(dim)
+    pad = words * WORD_BITS - dim
+    if pad:
+        widths = [(0, 0)] * (bits.ndim - 1) + [(0, pad)]
+        bits = np.pad(bits, widths)
+    packed = np.packbits(bits, axis=-1, bitorder="little")
+    return np.ascontiguousarray(packed).view("<u8").astype(np.uint64, copy=False)
+
+
+def _unpack_bits(words: np.ndarray, dim: int) -> np.ndarray:
+    """Inverse of :func:`_pack_bits`: (..., words) uint64 -> (..., dim) uint8 bits."""
+    raw = np.ascontiguousarray(words, dtype="<u8").view(np.uint8)
+    return np.unpackbits(raw, axis=-1, count=dim, bitorder="little")
+
+
+def pack_trits(data: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Pack trits into ``pos``/``neg`` uint64 bit planes.
+    
+    Works on a single vector of shape (dim,) or a stacked batch of
+    shape (..., dim); the trailing axis is packed 64 trits per word.
+    
+    Args:
+        data: Array of values in {-1, 0, 1}
+        
+    Returns:
+        (pos, neg) uint64 arrays of shape (..., ceil(dim / 64))
+        
+    Example:
+        >>> pos, neg = pack_trits(np.array([[1, 0, -1], [0, 1, 1]]))
+        >>> pos.shape
+        (2, 1)
+    """
+    data = np.asarray(data)
+    return _pack_bits(data > 0), _pack_bits(data < 0)
+
+
+def unpack_trits(pos: np.ndarray, neg: np.ndarray, dim: int) -> np.ndarray:
+    """Unpack ``pos``/``neg`` bit planes back into an int8 trit array.
+    
+    Args:
+        pos: uint64 array of shape (..., words) with +1 bits
+        neg: uint64 array of shape (..., words) with -1 bits
+        dim: Number of trits per vector
+        
+    Returns:
+        int8 array of shape (..., dim)
+    """
+    p = _unpack_bits(pos, dim).view(np.int8)
+    n = _unpack_bits(neg, dim).view(np.int8)
+    return p - n
+
+
+_POPCOUNT_TABLE = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+
+def popcount(words: np.ndarray) -> np.ndarray:
+    """Count set bits per row of a (..., words) uint64 array.
+    
+    Uses ``np.bitwise_count`` (NumPy >= 2.0) when available and falls
+    back to a byte lookup table otherwise.
+    
+    Args:
+        words: uint64 array of shape (..., words)
+        
+    Returns:
+        int64 array of shape (...) with the number of set bits per row
+    """
+    words = np.asarray(words, dtype=np.uint64)
+    if hasattr(np, "bitwise_count"):
+        return np.bitwise_count(words).sum(axis=-1, dtype=np.int64)
+    raw = np.ascontiguousarray(words).view(np.uint8)
+    return _POPCOUNT_TABLE[raw].sum(axis=-1, dtype=np.int64)
+
+
+class PackedTritVec(_Serializable):
     """Packed trit vector using 2 bits per trit.
     
     Memory efficient storage: 4x smaller than dense.
@@ -129,36 +278,36 @@ class PackedTritVec:
     @classmethod
     def from_trit_vector(cls, v: TritVector) -> "PackedTritVec":
         """Pack a TritVector."""
-        dim = v.dim
-        num_words = (dim + 63) // 64
-        pos = np.zeros(num_words, dtype=np.uint64)
-        neg = np.zeros(num_words, dtype=np.uint64)
-        
-        for i, trit in enumerate(v.data):
-            word_idx = i // 64
-            bit_idx = i % 64
-            if trit == 1:
-                pos[word_idx] |= np.uint64(1) << bit_idx
-            elif trit == -1:
-                neg[word_idx] |= np.uint64(1) << bit_idx
+        return cls.from_numpy(v.data)
+    
+    @classmethod
+    def from_numpy(cls, data: np.ndarray) -> "PackedTritVec":
+        """Pack a 1-D array of trits without an intermediate TritVector."""
+        data = np.asarray(data)
+        assert data.ndim == 1, "Expected a 1-D array"
+        pos, neg = pack_trits(data)
+        return cls(pos, neg, data.shape[0])
+    
+    @classmethod
+    def from_batch(cls, data: np.ndarray) -> List["PackedTritVec"]:
+        """Pack a (N, dim) array of trits into N packed vectors.
         
-        return cls(pos, neg, dim)
+        The whole batch is packed in one vectorized pass; each returned
+        vector holds a row view into the shared ``pos``/``neg`` planes.
+        """
+        data = np.asarray(data)
+        assert data.ndim == 2, "Expected a 2-D (N, dim) array"
+        pos, neg = pack_trits(data)
+        dim = data.shape[1]
+        return [cls(pos[i], neg[i], dim) for i in range(data.shape[0])]
     
     def to_trit_vector(self) -> TritVector:
         """Unpack to TritVector."""
-        data = np.zeros(self._dim, dtype=np.int8)
-        
-        for i in range(self._dim):
-            word_idx = i // 64
-            bit_idx = i % 64
-            mask = np.uint64(1) << bit_idx
-            
-            if self.pos[word_idx] & mask:
-                data[i] = 1
-            elif self.neg[word_idx] & mask:
-                data[i] = -1
-        
-        return TritVector(data)
+        return TritVector.from_trusted(self.to_numpy())
+    
+    def to_numpy(self) -> np.ndarray:
+        """Unpack to an int8 array of trits."""
+        return unpack_trits(self.pos, self.neg, self._dim)
     
     @property
     def dim(self) -> int:
@@ -179,44 +328,73 @@ class PackedTritVec:
         
         return PackedTritVec(new_pos, new_neg, self._dim)
     
+    @property
+    def nnz(self) -> int:
+        """Number of non-zero trits."""
+        return int(popcount(self.pos | self.neg))
+    
     def dot(self, other: "PackedTritVec") -> int:
         """Fast dot product using popcount."""
         assert self._dim == other._dim
         
-        # Count +1 * +1 and -1 * -1 (contribute +1)
-        pos_pos = np.sum([bin(x).count('1') for x in (self.pos & other.pos)])
-        neg_neg = np.sum([bin(x).count('1') for x in (self.neg & other.neg)])
-        
-        # Count +1 * -1 and -1 * +1 (contribute -1)
-        pos_neg = np.sum([bin(x).count('1') for x in (self.pos & other.neg)])
-        neg_pos = np.sum([bin(x).count('1') for x in (self.neg & other.pos)])
+        # +1*+1 and -1*-1 contribute +1; a trit is never both +1 and -1,
+        # so the two agreement masks are disjoint and can be OR-ed
+        agree = (self.pos & other.pos) | (self.neg & other.neg)
+        # +1*-1 and -1*+1 contribute -1
+        disagree = (self.pos & other.neg) | (self.neg & other.pos)
         
-        return int(pos_pos + neg_neg - pos_neg - neg_pos)
+        return int(popcount(agree) - popcount(disagree))
+    
+    def hamming(self, other: "PackedTritVec") -> int:
+        """Number of differing trits, by popcount of the differing bits."""
+        assert self._dim == other._dim
+        return int(popcount((self.pos ^ other.pos) | (self.neg ^ other.neg)))
+    
+    def similarity(self, other: "PackedTritVec") -> float:
+        """Cosine similarity computed in the packed domain."""
+        norm = np.sqrt(float(self.nnz) * float(other.nnz))
+        if norm == 0:
+            return 0.0
+        return self.dot(other) / norm
 
 
-class SparseVec:
+class SparseVec(_Serializable):
     """Sparse trit vector storing only non-zero elements.
     
-    Efficient for vectors with >90% zeros.
+    Efficient for vectors with >90% zeros. Indices are kept sorted so
+    that all kernels are merges over the index arrays and run in time
+    proportional to nnz, not dim.
     """
     
     def __init__(self, indices: np.ndarray, values: np.ndarray, dim: int):
-        """Create from indices and values."""
-        self.indices = indices.astype(np.int64)
-        self.values = values.astype(np.int8)
+        """Create from indices and values (sorted by index if needed)."""
+        indices = np.asarray(indices).astype(np.int64)
+        values = np.asarray(values).astype(np.int8)
+        if len(indices) > 1 and np.any(indices[1:] <= indices[:-1]):
+            order = np.argsort(indices, kind="stable")
+            indices, values = indices[order], values[order]
+        self.indices = indices
+        self.values = values
         self._dim = dim
     
+    @classmethod
+    def _trusted(cls, indices: np.ndarray, values: np.ndarray, dim: int) -> "SparseVec":
+        """Wrap arrays already known to be sorted int64 indices / int8 values."""
+        v = cls.__new__(cls)
+        v.indices, v.values, v._dim = indices, values, dim
+        return v
+    
     @classmethod
     def from_trit_vector(cls, v: TritVector) -> "SparseVec":
         """Create sparse representation."""
-        nonzero = np.nonzero(v.data)[0]
-        return cls(nonzero, v.data[nonzero], v.dim)
+        nonzero = np.flatnonzero(v.data)
+        return cls._trusted(nonzero.astype(np.int64), v.data[nonzero], v.dim)
     
     def to_trit_vector(self) -> TritVector:
         """Convert to dense."""
         data = np.zeros(self._dim, dtype=np.int8)
         data[self.indices] = self.values
-        return TritVector(data)
+        return TritVector.from_trusted(data)
     
     @property
     def dim(self) -> int:
@@ -230,14 +408,272 @@ class SparseVec:
     def sparsity(self) -> float:
         return 1.0 - (self.nnz / self._dim)
     
-    def dot(self, other: "SparseVec") -> int:
-        """Sparse dot product."""
-        assert self._dim == other._dim
+    def __neg__(self) -> "SparseVec":
+        return SparseVec._trusted(self.indices, -self.values, self._dim)
+    
+    def __eq__(self, other: "SparseVec") -> bool:
+        return (self._dim == other._dim
+                and np.array_equal(self.indices, other.indices)
+                and np.array_equal(self.values, other.values))
+    
+    def __repr__(self) -> str:
+        return f"SparseVec(dim={self._dim}, nnz={self.nnz})"
+    
+    def _intersect(self, other: "SparseVec") -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Common indices and their values in self and other.
+        
+        Binary-searches the shorter index array into the longer one,
+        O(min_nnz * log(max_nnz)), and keeps the result sorted.
+        """
+        a, b = (self, other) if self.nnz <= other.nnz else (other, self)
+        if a.nnz == 0 or b.nnz == 0:
+            empty = np.zeros(0, dtype=np.int64)
+            return empty, self.values[:0], other.values[:0]
+        pos = np.searchsorted(b.indices, a.indices)
+        np.minimum(pos, b.nnz - 1, out=pos)
+        hit = b.indices[pos] == a.indices
+        ia, ib = np.flatnonzero(hit), pos[hit]
+        if a is not self:
+            ia, ib = ib, ia
+        return self.indices[ia], self.values[ia], other.values[ib]
+    
+    def dot(self, other: Union["SparseVec", TritVector]) -> int:
+        """Sparse dot product (sorted-index intersection)."""
+        assert self._dim == other.dim
+        if isinstance(other, TritVector):
+            return int(np.dot(self.values.astype(np.int64), other.data[self.indices]))
+        _, va, vb = self._intersect(other)
+        return int(np.dot(va.astype(np.int64), vb))
+    
+    def similarity(self, other: Union["SparseVec", TritVector]) -> float:
+        """Cosine similarity without densifying."""
+        norm = np.sqrt(float(self.nnz) * float(other.nnz))
+        if norm == 0:
+            return 0.0
+        return self.dot(other) / norm
+    
+    def bind(self, other: Union["SparseVec", TritVector]) -> "SparseVec":
+        """Sparse bind: non-zero only where both inputs are non-zero."""
+        assert self._dim == other.dim
+        if isinstance(other, TritVector):
+            values = self.values * other.data[self.indices]
+            keep = values != 0
+            return SparseVec._trusted(self.indices[keep], values[keep], self._dim)
+        common, va, vb = self._intersect(other)
+        return SparseVec._trusted(common, va * vb, self._dim)
+    
+    def permute(self, shift: int) -> "SparseVec":
+        """Cyclic shift; same semantics as ``permute`` on dense vectors.
+        
+        A rotation of sorted indices is two sorted runs, so the result is
+        re-sorted by swapping the runs instead of a full sort.
+        """
+        shift %= self._dim
+        if shift == 0:
+            return self
+        shifted = self.indices + shift
+        split = np.searchsorted(shifted, self._dim)
+        indices = np.concatenate([shifted[split:] - self._dim, shifted[:split]])
+        values = np.concatenate([self.values[split:], self.values[:split]])
+        return SparseVec._trusted(indices, values, self._dim)
+
+
+class CountVector:
+    """Unthresholded integer hypervector: a lossless superposition.
+    
+    Holds the per-dimension sum of the vectors added to it, so items can
+    be added or removed in O(dim) (O(nnz) for SparseVec) without
+    re-bundling everything. ``threshold()`` gives the bundled TritVector
+    on demand, and similarity is computed on the counts themselves. The
+    sum starts as int16 and widens to int32/int64 before it could overflow.
+    
+    Attributes:
+        data: numpy integer array of per-dimension sums
+        
+    Example:
+        >>> proto = CountVector.zeros(10000)
+        >>> proto.add(sample_a).add(sample_b, weight=2)
+        >>> proto.remove(sample_a)          # O(dim), no re-bundling
+        >>> label_vector = proto.threshold()
+    """
+    
+    def __init__(self, data: np.ndarray, dtype=None, count: int = 0):
+        """Create from an integer array of counts (copied).
         
-        # Use set intersection for efficiency
-        self_dict = dict(zip(self.indices, self.values))
-        result = 0
-        for idx, val in zip(other.indices, other.values):
-            if idx in self_dict:
-                result += int(self_dict[idx]) * int(val)
-        return result
+        Args:
+            data: Per-dimension sums
+            dtype: Integer type (default: the smallest of int16/int32/int64
+                that holds ``data``)
+            count: Net number of vectors ``data`` is the sum of, reported
+                by ``count`` (it cannot be inferred from the sums)
+        """
+        data = np.asarray(data)
+        bound = int(np.abs(data.astype(np.int64)).max(initial=0))
+        if dtype is None:
+            dtype = next(t for t in (np.int16, np.int32, np.int64) if bound <= np.iinfo(t).max)
+        self.data = data.astype(dtype)
+        # Upper bound on max(|data|), tracked instead of recomputed per add
+        self._bound = bound
+        self._count = count
+    
+    @classmethod
+    def zeros(cls, dim: int, dtype=np.int16) -> "CountVector":
+        """Create an empty superposition."""
+        return cls(np.zeros(dim, dtype=dtype), dtype=dtype)
+    
+    @classmethod
+    def from_vectors(cls, vectors, dtype=np.int16) -> "CountVector":
+        """Superpose a non-empty sequence of trit vectors."""
+        vectors = list(vectors)
+        assert vectors, "Need at least one vector"
+        c = cls.zeros(vectors[0].dim, dtype=dtype)
+        for v in vectors:
+            c.add(v)
+        return c
+    
+    @property
+    def dim(self) -> int:
+        return len(self.data)
+    
+    @property
+    def nnz(self) -> int:
+        return int(np.count_nonzero(self.data))
+    
+    @property
+    def count(self) -> int:
+        """Net number of vectors added (adds minus removes)."""
+        return self._count
+    
+    def __len__(self) -> int:
+        return self.dim
+    
+    def __repr__(self) -> str:
+        return f"CountVector(dim={self.dim}, count={self.count}, dtype={self.data.dtype})"
+    
+    def __eq__(self, other: "CountVector") -> bool:
+        return np.array_equal(self.data, other.data)
+    
+    def _reserve(self, extra: int):
+        """Widen the dtype if ``extra`` more unit additions could overflow.
+        
+        Raises:
+            OverflowError: If the sums could leave the int64 range
+        """
+        bound = self._bound + extra
+        if bound > np.iinfo(np.int64).max:
+            raise OverflowError("CountVector sums could exceed the int64 range")
+        self._bound = bound
+        dtype = self.data.dtype
+        while self._bound > np.iinfo(dtype).max:
+            dtype = np.dtype(np.int32) if dtype == np.int16 else np.dtype(np.int64)
+        if dtype != self.data.dtype:
+            self.data = self.data.astype(dtype)
+    
+    def _copy(self, data: np.ndarray, bound: int, count: int) -> "CountVector":
+        c = CountVector.__new__(CountVector)
+        c.data, c._bound, c._count = data, bound, count
+        return c
+    
+    def copy(self) -> "CountVector":
+        return self._copy(self.data.copy(), self._bound, self._count)
+    
+    def add(self, v: Union[TritVector, SparseVec, "CountVector"], weight: int = 1) -> "CountVector":
+        """Add ``weight`` copies of a vector in place.
+        
+        Args:
+            v: TritVector, SparseVec (O(nnz) update) or another CountVector
+            weight: Integer weight (negative removes)
+            
+        Returns:
+            self, for chaining
+        """
+        assert v.dim == self.dim, "Vectors must have same dimension"
+        if isinstance(v, CountVector):
+            self._reserve(abs(weight) * v._bound)
+            if v.data.dtype != self.data.dtype:
+                self.data = self.data.astype(np.result_type(self.data, v.data))
+            values = v.data
+            self._count += weight * v._count
+        else:
+            self._reserve(abs(weight))
+            values = v.values if isinstance(v, SparseVec) else v.data
+            self._count += weight
+        if weight != 1:
+            values = values * self.data.dtype.type(weight)
+        if isinstance(v, SparseVec):
+            self.data[v.indices] += values
+        else:
+            self.data += values
+        return self
+    
+    def remove(self, v: Union[TritVector, SparseVec, "CountVector"], weight: int = 1) -> "CountVector":
+        """Remove a previously added vector in place."""
+        return self.add(v, weight=-weight)
+    
+    def __iadd__(self, v) -> "CountVector":
+        return self.add(v)
+    
+    def __isub__(self, v) -> "CountVector":
+        return self.remove(v)
+    
+    def __add__(self, v) -> "CountVector":
+        return self.copy().add(v)
+    
+    def __sub__(self, v) -> "CountVector":
+        return self.copy().remove(v)
+    
+    def __neg__(self) -> "CountVector":
+        return self._copy(-self.data, self._bound, -self._count)
+    
+    def threshold(self, threshold: int = 0) -> TritVector:
+        """Bundled TritVector: sign of the counts, 0 where ``|count| <= threshold``."""
+        result = np.sign(self.data).astype(np.int8)
+        if threshold > 0:
+            result[np.abs(self.data) <= threshold] = 0
+        return TritVector.from_trusted(result)
+    
+    def bind(self, other: Union[TritVector, SparseVec]) -> "CountVector":
+        """Bind every superposed item with ``other`` (bind distributes over sums).
+        
+        A SparseVec keeps ``counts * value`` at its non-zero indices and
+        zeroes every other dimension (O(nnz) after the allocation).
+        
+        Raises:
+            TypeError: If ``other`` is not a TritVector or SparseVec
+        """
+        assert self.dim == other.dim, "Vectors must have same dimension"
+        if isinstance(other, SparseVec):
+            data = np.zeros_like(self.data)
+            data[other.indices] = self.data[other.indices] * other.values.astype(self.data.dtype)
+            return self._copy(data, self._bound, self._count)
+        if not isinstance(other, TritVector):
+            raise TypeError(f"Cannot bind CountVector with {type(other).__name__}")
+        return self._copy(self.data * other.data, self._bound, self._count)
+    
+    def permute(self, shift: int) -> "CountVector":
+        """Circularly shift the counts (same semantics as ``permute``)."""
+        return self._copy(np.roll(self.data, shift), self._bound, self._count)
+    
+    def dot(self, other: Union[TritVector, SparseVec, "CountVector"]) -> int:
+        """Integer dot product with the counts."""
+        assert self.dim == other.dim, "Vectors must have same dimension"
+        if isinstance(other, SparseVec):
+            return int(np.dot(self.data[other.indices].astype(np.int64), other.values))
+        return int(np.dot(self.data.astype(np.int64), other.data.astype(np.int64)))
+    
+    @property
+    def norm(self) -> float:
+        """Euclidean norm of the counts."""
+        return float(np.sqrt(np.dot(self.data.astype(np.float64), self.data.astype(np.float64))))
+    
+    def similarity(self, other: Union[TritVector, SparseVec, "CountVector"]) -> float:
+        """Cosine similarity computed directly on the counts."""
+        other_norm = other.norm if isinstance(other, CountVector) else np.sqrt(float(other.nnz))
+        norm = self.norm * other_norm
+        if norm == 0:
+            return 0.0
+        return self.dot(other) / norm
+    
+    def to_numpy(self) -> np.ndarray:
+        """Return a copy of the counts."""
+        return self.data.copy()
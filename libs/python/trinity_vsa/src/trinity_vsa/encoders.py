@@ -0,0 +1,343 @@
+"""Encoders that turn raw data streams into hypervectors."""
+
+from collections import deque
+from typing import Any, Dict, Hashable, Iterable, Iterator, Mapping, Optional
+import numpy as np
+
+from .core import TritVector, _roll_into
+from .accumulator import BundleAccumulator
+from .matrix import TritMatrix
+from .symbols import SymbolTable
+from .profiling import instrumented
+
+
+class NGramEncoder:
+    """Streaming n-gram encoder with O(dim) work per token.
+
+    The n-gram ending at token t is ``encode_sequence`` of its window,
+    ``prod_i permute(x[t-n+1+i], i)``. Instead of recomputing every
+    window, the encoder updates it in place when the window slides::
+
+        g[t+1] = permute(g[t] / x[t-n+1], -1) * permute(x[t+1], n-1)
+
+    The state is kept in absolute coordinates (token j contributes
+    ``permute(x[j], j)``), so sliding never shifts the state: one token
+    is bound in, the oldest is unbound, and only the emitted n-gram is
+    shifted back by the window start. Unbinding a ternary vector is
+    undefined where it is zero, so the window is tracked as a product of
+    signs (zeros counted as +1) plus a per-dimension count of zeros; a
+    dimension of the n-gram is 0 exactly when that count is non-zero.
+
+    Args:
+        symbols: Symbol table mapping tokens to TritVector (a dict, an
+            ItemMemory, or anything supporting ``symbols[token]``)
+        n: N-gram length
+        dim: Vector dimension (inferred from the first token if omitted)
+
+    Example:
+        >>> enc = NGramEncoder(letters, n=3)
+        >>> doc_vector = enc.encode("the quick brown fox")
+        >>> for vec in enc.encode_documents(open("corpus.txt")):
+        ...     index.add(vec)
+    """
+
+    def __init__(self, symbols: Any, n: int = 3, dim: Optional[int] = None):
+        assert n >= 1, "n must be at least 1"
+        self.symbols = symbols
+        self.n = n
+        self._dim = dim
+        self._buffers_dim = None
+        self._count_dtype = np.int8 if n <= np.iinfo(np.int8).max else np.int32
+
+    @property
+    def dim(self) -> Optional[int]:
+        return self._dim
+
+    def _allocate(self, dim: int):
+        if self._buffers_dim == dim:
+            return
+        self._dim = self._buffers_dim = dim
+        self._sign = np.ones(dim, dtype=np.int8)
+        self._zeros = np.zeros(dim, dtype=self._count_dtype)
+        self._shifted = np.empty(dim, dtype=np.int8)
+        self._mask = np.empty(dim, dtype=bool)
+        self._abs_gram = np.empty(dim, dtype=np.int8)
+        self._gram = np.empty(dim, dtype=np.int8)
+
+    def _ngram_data(self, tokens: Iterable[Hashable]) -> Iterator[np.ndarray]:
+        """Yield each complete n-gram as a view of a reused buffer."""
+        window = deque()
+        for position, token in enumerate(tokens):
+            data = self.symbols[token].data
+            if position == 0:
+                self._allocate(len(data))
+                self._sign[:] = 1
+                self._zeros[:] = 0
+            # contribution of this token in absolute coordinates
+            shifted = _roll_into(data, position, self._shifted)
+            zero = shifted == 0
+            sign = shifted + zero
+            self._sign *= sign
+            self._zeros += zero
+            window.append((sign, zero))
+            if len(window) > self.n:
+                # signs are +-1, so unbinding is multiplying again
+                old_sign, old_zero = window.popleft()
+                self._sign *= old_sign
+                self._zeros -= old_zero
+            if len(window) == self.n:
+                np.equal(self._zeros, 0, out=self._mask)
+                np.multiply(self._sign, self._mask, out=self._abs_gram)
+                start = position - self.n + 1
+                yield _roll_into(self._abs_gram, -start, self._gram)
+
+    def ngrams(self, tokens: Iterable[Hashable]) -> Iterator[TritVector]:
+        """Yield the n-gram vector for every full window of ``tokens``.
+
+        Tokens are consumed lazily, so ``tokens`` may be a generator over
+        an arbitrarily long stream.
+        """
+        for gram in self._ngram_data(tokens):
+            yield TritVector.from_trusted(gram.copy())
+
+    def accumulate(self, tokens: Iterable[Hashable],
+                   accumulator: Optional[BundleAccumulator] = None) -> BundleAccumulator:
+        """Add every n-gram of ``tokens`` to a running bundle sum.
+
+        Args:
+            tokens: Token stream
+            accumulator: Accumulator to add to (created on first token if None)
+
+        Returns:
+            The accumulator (merge shards or call ``finalize()`` on it)
+
+        Raises:
+            ValueError: If ``tokens`` is empty and the dimension is not
+                known yet (no ``dim`` given and no token seen)
+        """
+        for gram in self._ngram_data(tokens):
+            if accumulator is None:
+                accumulator = BundleAccumulator(len(gram))
+            accumulator.add(TritVector.from_trusted(gram))
+        if accumulator is None:
+            if self._dim is None:
+                raise ValueError("Cannot infer the dimension from an empty document; pass dim=")
+            accumulator = BundleAccumulator(self._dim)
+        return accumulator
+
+    @instrumented
+    def encode(self, tokens: Iterable[Hashable]) -> TritVector:
+        """Bundle all n-grams of one document into a single vector."""
+        return self.accumulate(tokens).finalize()
+
+    def encode_documents(self, documents: Iterable[Iterable[Hashable]]) -> Iterator[TritVector]:
+        """Lazily encode a stream of documents, one vector per document."""
+        for doc in documents:
+            yield self.encode(doc)
+
+
+class _LevelTable:
+    """Shared quantize-and-gather machinery of the scalar encoders.
+
+    Subclasses build ``self.table``, a (levels, dim) TritMatrix with one
+    vector per quantization level; encoding a column is then one
+    vectorized quantization plus one row gather.
+    """
+
+    def __init__(self, dim: int, levels: int, low: float, high: float):
+        assert levels >= 2, "Need at least two levels"
+        assert high > low, "Need high > low"
+        self.dim = dim
+        self.levels = levels
+        self.low = float(low)
+        self.high = float(high)
+        self.table: TritMatrix = None
+
+    def __repr__(self) -> str:
+        return (f"{type(self).__name__}(dim={self.dim}, levels={self.levels}, "
+                f"range=[{self.low}, {self.high}])")
+
+    def quantize(self, values: np.ndarray) -> np.ndarray:
+        """Level index of each value (values outside [low, high] are clipped)."""
+        values = np.asarray(values, dtype=np.float64)
+        scaled = (values - self.low) * ((self.levels - 1) / (self.high - self.low))
+        return np.clip(np.rint(scaled), 0, self.levels - 1).astype(np.intp)
+
+    @instrumented
+    def encode(self, values: np.ndarray) -> TritMatrix:
+        """Encode a whole numeric column with one gather.
+
+        Args:
+            values: 1-D array-like of N numbers
+
+        Returns:
+            TritMatrix of shape (N, dim)
+        """
+        idx = self.quantize(np.ravel(values))
+        return TritMatrix.from_trusted(np.take(self.table.data, idx, axis=0))
+
+    def encode_one(self, value: float) -> TritVector:
+        """Encode a single number."""
+        return self.table[int(self.quantize(value))]
+
+
+class LevelEncoder(_LevelTable):
+    """Random level hypervectors with linearly decaying similarity.
+
+    Level 0 is a random vector and the top level another, independent
+    one; level i takes its first ``i / (levels - 1)`` share of dimensions
+    (in a fixed random order) from the top vector and the rest from the
+    bottom one. Nearby values therefore get similar vectors, and the
+    similarity falls linearly to chance across the range.
+
+    Example:
+        >>> temp = LevelEncoder(10000, levels=100, low=-20, high=45)
+        >>> vectors = temp.encode(df["temperature"].to_numpy())   # (N, 10000)
+    """
+
+    def __init__(self, dim: int, levels: int = 64, low: float = 0.0, high: float = 1.0,
+                 seed: Optional[int] = None):
+        super().__init__(dim, levels, low, high)
+        rng = np.random.default_rng(seed)
+        start = rng.integers(-1, 2, size=dim, dtype=np.int8)
+        end = rng.integers(-1, 2, size=dim, dtype=np.int8)
+        rank = np.empty(dim, dtype=np.int64)
+        rank[rng.permutation(dim)] = np.arange(dim)
+        cuts = np.rint(np.linspace(0, dim, levels)).astype(np.int64)
+        self.table = TritMatrix.from_trusted(
+            np.where(rank[None, :] < cuts[:, None], end, start).astype(np.int8))
+
+
+class ThermometerEncoder(_LevelTable):
+    """Deterministic thermometer code: level i is +1 on its first ``k_i`` dims.
+
+    ``k_i`` grows linearly from 0 to ``dim`` and the rest of the vector
+    is -1, so the dot product of two levels falls linearly with their
+    distance and the extreme levels are exact opposites.
+    """
+
+    def __init__(self, dim: int, levels: int = 64, low: float = 0.0, high: float = 1.0):
+        super().__init__(dim, levels, low, high)
+        cuts = np.rint(np.linspace(0, dim, levels)).astype(np.int64)
+        data = np.where(np.arange(dim)[None, :] < cuts[:, None], 1, -1).astype(np.int8)
+        self.table = TritMatrix.from_trusted(data)
+
+
+class FractionalPowerEncoder(_LevelTable):
+    """Ternary fractional power encoding: x -> quantized ``cos(theta * x)``.
+
+    Each dimension gets a random frequency ``theta_d``. A value x is
+    encoded as the phasor ``exp(i * theta_d * x)``, i.e. the fractional
+    power ``z**x`` of a random base phasor, and its real part is rounded
+    to a trit (|cos| <= 1/2 becomes 0, which leaves 1/3 zeros like
+    ``TritVector.random``). Similarity between two encodings then
+    approximates a shift-invariant kernel of ``x - y`` whose width is
+    set by ``bandwidth``: Gaussian-shaped for the default normal
+    frequencies, sinc-shaped for uniform ones.
+
+    Args:
+        dim: Vector dimension
+        levels: Number of quantization levels in [low, high]
+        low, high: Value range
+        bandwidth: Kernel width in value units (larger = smoother)
+        kernel: ``"gaussian"`` or ``"sinc"``
+        seed: Random seed
+    """
+
+    def __init__(self, dim: int, levels: int = 256, low: float = 0.0, high: float = 1.0,
+                 bandwidth: float = 0.1, kernel: str = "gaussian", seed: Optional[int] = None):
+        super().__init__(dim, levels, low, high)
+        rng = np.random.default_rng(seed)
+        if kernel == "gaussian":
+            theta = rng.standard_normal(dim)
+        elif kernel == "sinc":
+            theta = rng.uniform(-np.pi, np.pi, size=dim)
+        else:
+            raise ValueError(f"Unknown kernel {kernel!r}")
+        theta /= bandwidth
+        values = np.linspace(self.low, self.high, levels)
+        phase = np.cos(values[:, None] * theta[None, :] + rng.uniform(0, 2 * np.pi, size=dim))
+        data = (phase > 0.5).astype(np.int8) - (phase < -0.5).astype(np.int8)
+        self.table = TritMatrix.from_trusted(data)
+
+
+class RecordEncoder:
+    """Encode table rows as ``bundle_c bind(role_c, encode_c(value))``.
+
+    Every column has a role vector (from a SymbolTable keyed by the
+    column name) and a value encoder. A whole table is encoded column by
+    column: one gather per column, an in-place broadcast bind with the
+    role, and an add into an int16 running sum per row, processed in row
+    chunks to bound memory.
+
+    Args:
+        fields: Mapping column name -> encoder. An encoder is a level,
+            thermometer or fractional power encoder (numeric columns) or
+            a SymbolTable (categorical columns, values are symbol names)
+        dim: Vector dimension
+        roles: Symbol table for the role vectors (default: a fresh
+            ``SymbolTable(dim, seed)``)
+        seed: Seed of the default role table
+
+    Example:
+        >>> enc = RecordEncoder({
+        ...     "age": LevelEncoder(10000, low=0, high=100, seed=1),
+        ...     "income": ThermometerEncoder(10000, low=0, high=2e5),
+        ...     "city": SymbolTable(10000, seed=2),
+        ... }, dim=10000)
+        >>> records = enc.encode({"age": ages, "income": incomes, "city": cities})
+    """
+
+    _CHUNK = 4096
+
+    def __init__(self, fields: Dict[str, Any], dim: int,
+                 roles: Optional[SymbolTable] = None, seed: int = 0):
+        assert fields, "Need at least one field"
+        self.fields = dict(fields)
+        self.dim = dim
+        self.roles = roles if roles is not None else SymbolTable(dim, seed=seed)
+        assert self.roles.dim == dim, "Role vectors must match dimension"
+
+    def __repr__(self) -> str:
+        return f"RecordEncoder(dim={self.dim}, fields={list(self.fields)})"
+
+    def _encode_column(self, name: str, values: Any) -> np.ndarray:
+        encoder = self.fields[name]
+        if isinstance(encoder, SymbolTable):
+            rows = encoder.materialize(values)
+        else:
+            rows = encoder.encode(values)
+        assert rows.dim == self.dim, f"Encoder for {name!r} has wrong dimension"
+        return rows.data
+
+    @instrumented
+    def encode(self, table: Mapping[str, Any]) -> TritMatrix:
+        """Encode N records given as a mapping column name -> N values.
+
+        Any mapping of columns works, e.g. a dict of numpy arrays or a
+        pandas DataFrame. Columns not in ``fields`` are ignored.
+
+        Returns:
+            TritMatrix of shape (N, dim), one vector per record
+        """
+        columns = {name: np.asarray(table[name]) for name in self.fields}
+        n = len(next(iter(columns.values())))
+        assert all(len(c) == n for c in columns.values()), "Columns must have same length"
+        roles = {name: self.roles[name].data for name in self.fields}
+
+        out = np.empty((n, self.dim), dtype=np.int8)
+        sums = np.empty((min(n, self._CHUNK), self.dim), dtype=np.int16)
+        for start in range(0, n, self._CHUNK):
+            stop = min(start + self._CHUNK, n)
+            acc = sums[:stop - start]
+            acc[...] = 0
+            for name, column in columns.items():
+                rows = self._encode_column(name, column[start:stop])
+                np.multiply(rows, roles[name], out=rows)
+                acc += rows
+            np.sign(acc, out=out[start:stop], casting="unsafe")
+        return TritMatrix.from_trusted(out)
+
+    def encode_one(self, record: Mapping[str, Any]) -> TritVector:
+        """Encode a single record given as a mapping column name -> value."""
+        return self.encode({name: [record[name]] for name in self.fields})[0]
@@ -0,0 +1,259 @@
+"""Approximate nearest-neighbour search for ternary hypervectors."""
+
+from typing import Hashable, List, Optional, Sequence, Tuple
+import numpy as np
+
+from .core import TritVector, num_words, pack_trits, popcount
+from .matrix import Queries, as_rows
+
+# Candidate (query, row) pairs scored per step in batch_query
+_PAIR_CHUNK = 4096
+
+
+class LSHIndex:
+    """Random-projection (SimHash) LSH index over ternary hypervectors.
+
+    Each of ``n_tables`` hash tables maps a vector to the sign pattern of
+    ``n_bits`` random projections; two vectors collide with probability
+    ``(1 - theta / pi) ** n_bits`` where ``theta`` is their angle, which
+    matches the cosine similarity used everywhere else in trinity_vsa.
+    Candidates from all tables are re-ranked exactly with popcount over
+    the stored packed planes, so returned similarities are exact and
+    only recall is approximate.
+
+    Recall/speed trade-off:
+        - more ``n_tables``: higher recall, more memory and hashing work
+        - more ``n_bits``: smaller buckets, faster queries, lower recall
+        - more ``n_probes``: also visit buckets one bit-flip away on the
+          least certain projections, raising recall without extra tables
+
+    Example:
+        >>> index = LSHIndex.build(codebook, n_tables=24, n_bits=12)
+        >>> index.query(noisy, k=1)
+        [(1234, 0.82)]
+    """
+
+    def __init__(self, dim: int, n_tables: int = 24, n_bits: int = 12,
+                 n_probes: int = 4, seed: Optional[int] = None):
+        """Create an empty index.
+
+        Args:
+            dim: Vector dimension
+            n_tables: Number of independent hash tables
+            n_bits: Projections (code bits) per table, at most 62
+            n_probes: Default number of extra buckets probed per table
+            seed: Random seed for the projections
+        """
+        assert 0 < n_bits <= 62, "n_bits must be in [1, 62]"
+        self._dim = dim
+        self.n_tables = n_tables
+        self.n_bits = n_bits
+        self.n_probes = n_probes
+        rng = np.random.default_rng(seed)
+        self._planes = rng.standard_normal((dim, n_tables * n_bits)).astype(np.float32)
+        self._weights = (1 << np.arange(n_bits, dtype=np.int64))
+        self._labels: List[Hashable] = []
+        self._label_set = set()
+        self._next_id = 0
+        self._pending: List[Tuple[np.ndarray, np.ndarray, np.ndarray]] = []
+        self._codes = np.zeros((0, n_tables), dtype=np.int64)
+        words = num_words(dim)
+        self._pos = np.zeros((0, words), dtype=np.uint64)
+        self._neg = np.zeros((0, words), dtype=np.uint64)
+        self._nnz = np.zeros(0, dtype=np.int64)
+        self._sorted: Optional[Tuple[np.ndarray, np.ndarray]] = None
+
+    @classmethod
+    def build(cls, vectors: Queries, labels: Optional[Sequence[Hashable]] = None,
+              **params) -> "LSHIndex":
+        """Build an index over a batch of vectors.
+
+        Args:
+            vectors: TritMatrix, (N, dim) array or sequence of TritVector
+            labels: Optional N labels (default: consecutive integer ids)
+            **params: Forwarded to the constructor (n_tables, n_bits, ...)
+        """
+        rows = as_rows(vectors)
+        index = cls(rows.shape[1], **params)
+        index.insert(rows, labels)
+        return index
+
+    @property
+    def dim(self) -> int:
+        return self._dim
+
+    def __len__(self) -> int:
+        return len(self._labels)
+
+    def __repr__(self) -> str:
+        return (f"LSHIndex(dim={self._dim}, size={len(self)}, "
+                f"n_tables={self.n_tables}, n_bits={self.n_bits})")
+
+    def _project(self, rows: np.ndarray) -> np.ndarray:
+        """Random projections, shape (N, n_tables, n_bits)."""
+        proj = rows.astype(np.float32) @ self._planes
+        return proj.reshape(len(rows), self.n_tables, self.n_bits)
+
+    def _encode(self, proj: np.ndarray) -> np.ndarray:
+        """Bucket code per table from projection signs, shape (N, n_tables)."""
+        return (proj > 0).astype(np.int64) @ self._weights
+
+    def insert(self, vectors: Queries,
+               labels: Optional[Sequence[Hashable]] = None) -> List[Hashable]:
+        """Add vectors to the index.
+
+        Inserts are buffered in O(batch); the packed store and per-table
+        sorted bucket arrays are rebuilt lazily on the next query.
+
+        Args:
+            vectors: TritMatrix, (N, dim) array or sequence of TritVector
+            labels: Optional N labels (default: consecutive integer ids)
+
+        Returns:
+            The labels the vectors were stored under
+
+        Raises:
+            KeyError: If a label repeats within the batch or is already
+                indexed (nothing is added in that case)
+        """
+        rows = as_rows(vectors)
+        assert rows.shape[1] == self._dim, "Vectors must have same dimension"
+        if labels is None:
+            labels = list(range(self._next_id, self._next_id + len(rows)))
+        labels = list(labels)
+        assert len(labels) == len(rows), "Need one label per vector"
+        # validate the whole batch before touching any state
+        if len(set(labels)) != len(labels):
+            raise KeyError("Duplicate labels in batch")
+        for label in labels:
+            if label in self._label_set:
+                raise KeyError(f"Label already in index: {label!r}")
+
+        for label in labels:
+            if isinstance(label, (int, np.integer)):
+                self._next_id = max(self._next_id, int(label) + 1)
+        pos, neg = pack_trits(rows)
+        self._pending.append((self._encode(self._project(rows)), pos, neg))
+        self._labels.extend(labels)
+        self._label_set.update(labels)
+        self._sorted = None
+        return labels
+
+    def _tables(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Per-table codes sorted ascending, with the matching row ids."""
+        if self._pending:
+            codes, pos, neg = zip(*self._pending)
+            self._codes = np.concatenate((self._codes,) + codes)
+            self._pos = np.concatenate((self._pos,) + pos)
+            self._neg = np.concatenate((self._neg,) + neg)
+            self._nnz = np.concatenate([self._nnz] + [popcount(p | n) for p, n in zip(pos, neg)])
+            self._pending = []
+        if self._sorted is None:
+            order = np.argsort(self._codes, axis=0, kind="stable")
+            codes = np.take_along_axis(self._codes, order, axis=0)
+            self._sorted = (np.ascontiguousarray(codes.T), np.ascontiguousarray(order.T))
+        return self._sorted
+
+    def _probe_codes(self, proj: np.ndarray, n_probes: int) -> np.ndarray:
+        """Codes to visit per table: home bucket plus single-bit flips.
+
+        Flips the ``n_probes`` bits whose projections lie closest to the
+        hyperplane, i.e. the bits most likely to differ for a near
+        neighbour. Takes projections of shape (Q, n_tables, n_bits) and
+        returns shape (Q, n_tables, 1 + n_probes).
+        """
+        home = self._encode(proj)
+        if n_probes <= 0:
+            return home[..., None]
+        n_probes = min(n_probes, self.n_bits)
+        uncertain = np.argsort(np.abs(proj), axis=2)[..., :n_probes]
+        flips = home[..., None] ^ self._weights[uncertain]
+        return np.concatenate([home[..., None], flips], axis=2)
+
+    def candidates(self, query: TritVector, n_probes: Optional[int] = None) -> np.ndarray:
+        """Row ids sharing a probed bucket with ``query`` in any table."""
+        proj = self._project(query.data[None, :])
+        _, rows = self._candidate_pairs(proj, self.n_probes if n_probes is None else n_probes)
+        return rows
+
+    def _candidate_pairs(self, proj: np.ndarray,
+                         n_probes: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Unique (query, row) candidate pairs, sorted by query then row.
+
+        Every probe of every query is looked up with one ``searchsorted``
+        per table; the matching bucket ranges are then expanded into row
+        ids without a Python loop over queries or probes.
+        """
+        codes, ids = self._tables()
+        probes = self._probe_codes(proj, n_probes)
+        n_queries, _, n_codes = probes.shape
+        owner = np.repeat(np.arange(n_queries, dtype=np.int64), n_codes)
+        keys = []
+        for t in range(self.n_tables):
+            wanted = probes[:, t, :].ravel()
+            lo = np.searchsorted(codes[t], wanted, side="left")
+            counts = np.searchsorted(codes[t], wanted, side="right") - lo
+            total = int(counts.sum())
+            if total == 0:
+                continue
+            # position of each hit: its range start plus its offset in the range
+            starts = np.repeat(lo - np.cumsum(counts) + counts, counts)
+            rows = ids[t, starts + np.arange(total)]
+            keys.append(np.repeat(owner, counts) * len(self._labels) + rows)
+        if not keys:
+            empty = np.zeros(0, dtype=np.int64)
+            return empty, empty
+        keys = np.unique(np.concatenate(keys))
+        return keys // len(self._labels), keys % len(self._labels)
+
+    def query(self, query: TritVector, k: int = 1,
+              n_probes: Optional[int] = None) -> List[Tuple[Hashable, float]]:
+        """Approximate top-k most similar vectors.
+
+        Args:
+            query: Query vector
+            k: Number of results
+            n_probes: Override the default probes per table
+
+        Returns:
+            Up to k (label, similarity) pairs, most similar first
+        """
+        labels, sims = self.batch_query(query.data[None, :], k, n_probes)
+        return list(zip(labels[0], sims[0].tolist()))
+
+    def batch_query(self, queries: Queries, k: int = 1,
+                    n_probes: Optional[int] = None
+                    ) -> Tuple[List[List[Hashable]], List[np.ndarray]]:
+        """Approximate top-k for each of Q queries.
+
+        Returns:
+            (labels, similarities): Q lists of up to k labels and Q float64
+            arrays of the matching exact similarities, best first
+        """
+        rows = as_rows(queries)
+        assert rows.shape[1] == self._dim, "Vectors must have same dimension"
+        n_probes = self.n_probes if n_probes is None else n_probes
+        qidx, cand = self._candidate_pairs(self._project(rows), n_probes)
+        q_pos, q_neg = pack_trits(rows)
+        q_nnz = popcount(q_pos | q_neg)
+
+        scores = np.zeros(len(cand), dtype=np.float64)
+        for start in range(0, len(cand), _PAIR_CHUNK):
+            q = qidx[start:start + _PAIR_CHUNK]
+            c = cand[start:start + _PAIR_CHUNK]
+            qp, qn, cp, cn = q_pos[q], q_neg[q], self._pos[c], self._neg[c]
+            dots = popcount((qp & cp) | (qn & cn)) - popcount((qp & cn) | (qn & cp))
+            norms = np.sqrt(self._nnz[c] * q_nnz[q].astype(np.float64))
+            np.divide(dots, norms, out=scores[start:start + _PAIR_CHUNK], where=norms != 0)
+
+        # best first within each query, ties broken by row id; keep k per query
+        order = np.lexsort((cand, -scores, qidx))
+        grouped = qidx[order]
+        first = np.searchsorted(grouped, np.arange(len(rows)))
+        keep = order[np.arange(len(order)) - first[grouped] < k]
+        bounds = np.searchsorted(qidx[keep], np.arange(len(rows) + 1))
+        all_labels, all_sims = [], []
+        for a, b in zip(bounds[:-1], bounds[1:]):
+            all_labels.append([self._labels[i] for i in cand[keep[a:b]]])
+            all_sims.append(scores[keep[a:b]])
+        return all_labels, all_sims
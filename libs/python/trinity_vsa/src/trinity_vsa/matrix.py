@@ -0,0 +1,279 @@
+"""TritMatrix: a contiguous (N, dim) store of hypervectors with batched ops."""
+
+from typing import Iterator, List, Optional, Sequence, Tuple, Union
+import numpy as np
+
+from .core import TritVector, PackedTritVec, pack_trits, unpack_trits, _roll_into, _Serializable
+
+# Rows converted to float32 per BLAS call in similarity(); bounds the
+# float temporaries independently of N.
+_MATMUL_CHUNK = 8192
+
+
+class TritMatrix(_Serializable):
+    """N hypervectors stored as one C-contiguous (N, dim) int8 array.
+
+    Batched counterpart of TritVector: every operation runs as a single
+    numpy pass over the whole matrix instead of one Python call per row.
+
+    Attributes:
+        data: numpy array of shape (N, dim), int8 values in {-1, 0, 1}
+
+    Example:
+        >>> m = TritMatrix.random(1000, 10000)
+        >>> role = TritVector.random(10000)
+        >>> bound = m.bind(role)          # 1000 binds in one pass
+        >>> sims = bound.similarity(role)  # shape (1000,)
+    """
+
+    def __init__(self, data: np.ndarray):
+        """Create from a 2-D numpy array (values are clipped and copied)."""
+        data = np.asarray(data)
+        assert data.ndim == 2, "Expected a 2-D (N, dim) array"
+        self.data = np.ascontiguousarray(np.clip(data, -1, 1), dtype=np.int8)
+
+    @classmethod
+    def from_trusted(cls, data: np.ndarray) -> "TritMatrix":
+        """Wrap a 2-D int8 array already known to hold only {-1, 0, 1} (no copy)."""
+        m = cls.__new__(cls)
+        m.data = data
+        return m
+
+    @classmethod
+    def zeros(cls, n: int, dim: int) -> "TritMatrix":
+        """Create N zero vectors."""
+        return cls(np.zeros((n, dim), dtype=np.int8))
+
+    @classmethod
+    def random(cls, n: int, dim: int, seed: Optional[int] = None) -> "TritMatrix":
+        """Create N random hypervectors, uniform over {-1, 0, 1}."""
+        rng = np.random.default_rng(seed)
+        return cls(rng.integers(-1, 2, size=(n, dim), dtype=np.int8))
+
+    @classmethod
+    def from_vectors(cls, vectors: Sequence[TritVector]) -> "TritMatrix":
+        """Stack TritVectors into a matrix."""
+        assert vectors, "Need at least one vector"
+        return cls(np.stack([v.data for v in vectors]))
+
+    @classmethod
+    def from_packed(cls, pos: np.ndarray, neg: np.ndarray, dim: int) -> "TritMatrix":
+        """Unpack (N, words) ``pos``/``neg`` planes into a matrix."""
+        return cls(unpack_trits(pos, neg, dim))
+
+    def to_packed(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Pack into (N, words) ``pos``/``neg`` uint64 planes."""
+        return pack_trits(self.data)
+
+    def to_packed_vectors(self) -> List[PackedTritVec]:
+        """Pack into a list of PackedTritVec sharing one buffer."""
+        return PackedTritVec.from_batch(self.data)
+
+    def to_numpy(self) -> np.ndarray:
+        """Get a copy of the underlying (N, dim) array."""
+        return self.data.copy()
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return self.data.shape
+
+    @property
+    def dim(self) -> int:
+        """Vector dimension."""
+        return self.data.shape[1]
+
+    @property
+    def norms(self) -> np.ndarray:
+        """Euclidean norm of each row (sqrt of its non-zero count)."""
+        return np.sqrt(np.count_nonzero(self.data, axis=1).astype(np.float64))
+
+    def __len__(self) -> int:
+        return self.data.shape[0]
+
+    def __getitem__(self, idx) -> Union[TritVector, "TritMatrix"]:
+        if isinstance(idx, (int, np.integer)):
+            return TritVector.from_trusted(self.data[idx].copy())
+        return TritMatrix.from_trusted(np.ascontiguousarray(self.data[idx]))
+
+    def __iter__(self) -> Iterator[TritVector]:
+        for row in self.data:
+            yield TritVector.from_trusted(row.copy())
+
+    def __neg__(self) -> "TritMatrix":
+        return TritMatrix.from_trusted(-self.data)
+
+    def __eq__(self, other: "TritMatrix") -> bool:
+        return np.array_equal(self.data, other.data)
+
+    def __repr__(self) -> str:
+        return f"TritMatrix(n={len(self)}, dim={self.dim})"
+
+    def bind(self, other: Union["TritMatrix", TritVector]) -> "TritMatrix":
+        """Row-wise bind with another matrix, or broadcast-bind one vector.
+
+        Args:
+            other: TritMatrix of the same shape, or a TritVector bound
+                to every row
+
+        Returns:
+            Bound matrix
+        """
+        if isinstance(other, TritVector):
+            assert other.dim == self.dim, "Vectors must have same dimension"
+        else:
+            assert other.shape == self.shape, "Matrices must have same shape"
+        return TritMatrix.from_trusted(self.data * other.data)
+
+    def bind_(self, other: Union["TritMatrix", TritVector]) -> "TritMatrix":
+        """Bind in place (row-wise, or broadcasting one vector)."""
+        rhs = other.data
+        assert rhs.shape[-1] == self.dim, "Vectors must have same dimension"
+        np.multiply(self.data, rhs, out=self.data)
+        return self
+
+    def neg_(self) -> "TritMatrix":
+        """Negate in place."""
+        np.negative(self.data, out=self.data)
+        return self
+
+    def permute_(self, shift: int) -> "TritMatrix":
+        """Circularly shift every row in place by the same ``shift``."""
+        _roll_into(self.data, shift, self.data)
+        return self
+
+    def unbind(self, key: Union["TritMatrix", TritVector]) -> "TritMatrix":
+        """Unbind (same as bind for balanced ternary)."""
+        return self.bind(key)
+
+    def permute(self, shift: Union[int, np.ndarray]) -> "TritMatrix":
+        """Circularly shift every row.
+
+        Args:
+            shift: One shift for all rows, or an array of N per-row shifts
+
+        Returns:
+            Permuted matrix (row i equals ``permute(self[i], shift[i])``)
+        """
+        if np.ndim(shift) == 0:
+            return TritMatrix.from_trusted(np.roll(self.data, int(shift), axis=1))
+        shift = np.asarray(shift, dtype=np.int64)
+        assert shift.shape == (len(self),), "Need one shift per row"
+        idx = (np.arange(self.dim) - shift[:, None]) % self.dim
+        return TritMatrix.from_trusted(np.take_along_axis(self.data, idx, axis=1))
+
+    def bundle(self, groups: Optional[np.ndarray] = None,
+               num_groups: Optional[int] = None) -> Union[TritVector, "TritMatrix"]:
+        """Majority-bundle rows, either all together or per group.
+
+        Args:
+            groups: Optional array of N integer group labels in
+                [0, num_groups). Rows sharing a label are bundled together.
+            num_groups: Number of output rows (default ``groups.max() + 1``)
+
+        Returns:
+            A TritVector when ``groups`` is None, otherwise a TritMatrix
+            with one bundled vector per group (empty groups are zero)
+
+        Example:
+            >>> # bundle 1M encoded records into 10 class prototypes
+            >>> prototypes = records.bundle(labels, num_groups=10)
+        """
+        if groups is None:
+            sums = self.data.sum(axis=0, dtype=np.int32)
+            return TritVector.from_trusted(np.sign(sums).astype(np.int8))
+
+        groups = np.asarray(groups, dtype=np.int64)
+        assert groups.shape == (len(self),), "Need one group label per row"
+        if num_groups is None:
+            num_groups = int(groups.max()) + 1 if len(groups) else 0
+
+        sums = np.zeros((num_groups, self.dim), dtype=np.int32)
+        if len(groups) == 0:
+            return TritMatrix(sums)
+
+        data = self.data
+        if np.any(groups[1:] < groups[:-1]):
+            order = np.argsort(groups, kind="stable")
+            groups = groups[order]
+            data = data[order]
+        starts = np.flatnonzero(np.r_[True, groups[1:] != groups[:-1]])
+        sums[groups[starts]] = np.add.reduceat(data, starts, axis=0, dtype=np.int32)
+        return TritMatrix.from_trusted(np.sign(sums).astype(np.int8))
+
+    def dot(self, other: Union["TritMatrix", TritVector]) -> np.ndarray:
+        """Integer dot products via BLAS matmul.
+
+        Args:
+            other: A TritVector (query-vs-matrix, result shape (N,)) or a
+                TritMatrix with M rows (all pairs, result shape (N, M))
+
+        Returns:
+            int64 array of dot products
+        """
+        single = isinstance(other, TritVector)
+        rhs = other.data[None, :] if single else other.data
+        assert rhs.shape[1] == self.dim, "Vectors must have same dimension"
+
+        # float32 matmul is exact here: |dot| <= dim < 2**24
+        rhs_f = rhs.astype(np.float32).T
+        out = np.empty((len(self), rhs.shape[0]), dtype=np.int64)
+        for start in range(0, len(self), _MATMUL_CHUNK):
+            chunk = self.data[start:start + _MATMUL_CHUNK].astype(np.float32)
+            out[start:start + _MATMUL_CHUNK] = chunk @ rhs_f
+        return out[:, 0] if single else out
+
+    def similarity(self, other: Union["TritMatrix", TritVector, None] = None) -> np.ndarray:
+        """Cosine similarities via BLAS matmul.
+
+        Args:
+            other: A TritVector (result shape (N,)), a TritMatrix with M
+                rows (result shape (N, M)), or None for all pairs within
+                this matrix (result shape (N, N))
+
+        Returns:
+            float64 array of similarities in [-1.0, 1.0]
+        """
+        if other is None:
+            other = self
+        dots = self.dot(other)
+        if isinstance(other, TritVector):
+            other_norms = np.sqrt(float(other.nnz))
+            denom = self.norms * other_norms
+        else:
+            denom = np.outer(self.norms, other.norms)
+
+        result = np.zeros(dots.shape, dtype=np.float64)
+        np.divide(dots, denom, out=result, where=denom != 0)
+        return result
+
+
+# Batch arguments accepted wherever several vectors are taken at once
+Queries = Union[TritMatrix, np.ndarray, Sequence[TritVector]]
+
+
+def as_rows(vectors: Queries) -> np.ndarray:
+    """Normalize a batch argument to a 2-D array of trits."""
+    if isinstance(vectors, TritMatrix):
+        return vectors.data
+    if isinstance(vectors, np.ndarray):
+        return np.atleast_2d(vectors)
+    return np.stack([v.data for v in vectors])
+
+
+def normalize_rows(rows: np.ndarray) -> np.ndarray:
+    """Scale rows to unit length as float32 (zero rows stay zero)."""
+    rows = rows.astype(np.float32)
+    norms = np.sqrt(np.count_nonzero(rows, axis=-1)).astype(np.float32)
+    np.divide(rows, norms[..., None], out=rows, where=norms[..., None] != 0)
+    return rows
+
+
+def top_k_rows(scores: np.ndarray, k: int) -> np.ndarray:
+    """Column indices of the k largest scores per row, best first."""
+    if k < scores.shape[1]:
+        idx = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+    else:
+        idx = np.broadcast_to(np.arange(scores.shape[1]), scores.shape)
+    part = np.take_along_axis(scores, idx, axis=1)
+    order = np.argsort(-part, axis=1, kind="stable")
+    return np.take_along_axis(idx, order, axis=1)
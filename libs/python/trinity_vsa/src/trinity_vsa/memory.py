@@ -0,0 +1,340 @@
+"""Associative item memory: indexed cleanup against a codebook."""
+
+from typing import Dict, Hashable, List, NamedTuple, Optional, Sequence, Tuple
+import numpy as np
+
+from .core import TritVector
+from .matrix import Queries, TritMatrix, as_rows, normalize_rows, top_k_rows
+from .profiling import instrumented
+
+# Added to every pruning bound to absorb float32 rounding in partial sums
+_SLACK = 1e-5
+
+
+class ProgressiveResult(NamedTuple):
+    """Result of ``ItemMemory.progressive_top_k``.
+
+    Attributes:
+        labels: Up to k labels, most similar first
+        similarities: float32 cosine similarities of those labels
+        skipped: Fraction of the (prototype, dimension) products that
+            were never computed
+    """
+    labels: List[Hashable]
+    similarities: np.ndarray
+    skipped: float
+
+
+class ItemMemory:
+    """Codebook of labelled prototype vectors with matmul-based lookup.
+
+    Prototypes are kept as unit-normalized float32 rows of one matrix, so
+    a query is scored against the whole memory with a single BLAS
+    matrix-vector product followed by ``argpartition``.
+
+    Example:
+        >>> memory = ItemMemory(10000)
+        >>> for name in ["apple", "banana", "cherry"]:
+        ...     memory.add(TritVector.random(10000), name)
+        >>> memory.top_k(noisy_apple, k=1)
+        [('apple', 0.71)]
+    """
+
+    def __init__(self, dim: int, capacity: int = 1024):
+        """Create an empty memory.
+
+        Args:
+            dim: Vector dimension
+            capacity: Initial number of rows to allocate (grows as needed)
+        """
+        self._dim = dim
+        self._size = 0
+        self._data = np.zeros((capacity, dim), dtype=np.int8)
+        self._normed = np.zeros((capacity, dim), dtype=np.float32)
+        self._labels: List[Hashable] = []
+        self._slots: Dict[Hashable, int] = {}
+        self._next_id = 0
+        self._tails: Optional[Tuple[int, np.ndarray]] = None
+
+    @classmethod
+    def from_vectors(cls, vectors: Queries,
+                     labels: Optional[Sequence[Hashable]] = None) -> "ItemMemory":
+        """Build a memory from a batch of prototypes."""
+        rows = as_rows(vectors)
+        memory = cls(rows.shape[1], capacity=max(len(rows), 1))
+        memory.add_many(rows, labels)
+        return memory
+
+    @property
+    def dim(self) -> int:
+        return self._dim
+
+    @property
+    def labels(self) -> List[Hashable]:
+        """Labels in storage order."""
+        return list(self._labels)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, label: Hashable) -> bool:
+        return label in self._slots
+
+    def __repr__(self) -> str:
+        return f"ItemMemory(dim={self._dim}, size={self._size})"
+
+    def _reserve(self, extra: int):
+        needed = self._size + extra
+        capacity = len(self._data)
+        if needed <= capacity:
+            return
+        while capacity < needed:
+            capacity = max(2 * capacity, 1)
+        data = np.zeros((capacity, self._dim), dtype=np.int8)
+        normed = np.zeros((capacity, self._dim), dtype=np.float32)
+        data[:self._size] = self._data[:self._size]
+        normed[:self._size] = self._normed[:self._size]
+        self._data, self._normed = data, normed
+
+    def add(self, vector: TritVector, label: Optional[Hashable] = None) -> Hashable:
+        """Add one prototype.
+
+        Args:
+            vector: Prototype vector
+            label: Key to return from lookups (default: next integer id)
+
+        Returns:
+            The label the prototype was stored under
+        """
+        return self.add_many(vector.data[None, :], None if label is None else [label])[0]
+
+    def add_many(self, vectors: Queries,
+                 labels: Optional[Sequence[Hashable]] = None) -> List[Hashable]:
+        """Add a batch of prototypes in one normalization pass.
+
+        Args:
+            vectors: TritMatrix, (N, dim) array or sequence of TritVector
+            labels: Optional N labels (default: consecutive integer ids)
+
+        Returns:
+            The labels the prototypes were stored under
+
+        Raises:
+            KeyError: If a label repeats within the batch or is already
+                stored (nothing is added in that case)
+        """
+        rows = as_rows(vectors)
+        assert rows.shape[1] == self._dim, "Vectors must have same dimension"
+        if labels is None:
+            labels = list(range(self._next_id, self._next_id + len(rows)))
+        labels = list(labels)
+        assert len(labels) == len(rows), "Need one label per vector"
+        # validate the whole batch before touching any state
+        if len(set(labels)) != len(labels):
+            raise KeyError("Duplicate labels in batch")
+        for label in labels:
+            if label in self._slots:
+                raise KeyError(f"Label already in memory: {label!r}")
+
+        for label in labels:
+            if isinstance(label, (int, np.integer)):
+                self._next_id = max(self._next_id, int(label) + 1)
+        self._reserve(len(rows))
+        end = self._size + len(rows)
+        self._data[self._size:end] = np.clip(rows, -1, 1)
+        self._normed[self._size:end] = normalize_rows(self._data[self._size:end])
+        for i, label in enumerate(labels):
+            self._slots[label] = self._size + i
+            self._labels.append(label)
+        self._size = end
+        self._tails = None
+        return labels
+
+    def remove(self, label: Hashable):
+        """Remove a prototype (the last row is moved into its slot)."""
+        slot = self._slots.pop(label)
+        last = self._size - 1
+        if slot != last:
+            moved = self._labels[last]
+            self._data[slot] = self._data[last]
+            self._normed[slot] = self._normed[last]
+            self._labels[slot] = moved
+            self._slots[moved] = slot
+        self._labels.pop()
+        self._data[last] = 0
+        self._normed[last] = 0
+        self._size = last
+        self._tails = None
+
+    def get(self, label: Hashable) -> TritVector:
+        """Get the prototype stored under ``label``."""
+        return TritVector.from_trusted(self._data[self._slots[label]].copy())
+
+    def __getitem__(self, label: Hashable) -> TritVector:
+        return self.get(label)
+
+    def as_matrix(self) -> TritMatrix:
+        """Copy of all prototypes as a TritMatrix, in storage order."""
+        return TritMatrix(self._data[:self._size])
+
+    @instrumented
+    def scores(self, queries: Queries) -> np.ndarray:
+        """Cosine similarity of each query against every prototype.
+
+        Returns:
+            float32 array of shape (Q, len(self))
+        """
+        rows = as_rows(queries)
+        assert rows.shape[1] == self._dim, "Vectors must have same dimension"
+        return normalize_rows(rows) @ self._normed[:self._size].T
+
+    @instrumented
+    def top_k(self, query: TritVector, k: int = 1) -> List[Tuple[Hashable, float]]:
+        """Find the k prototypes most similar to ``query``.
+
+        Returns:
+            Up to k (label, similarity) pairs, most similar first
+        """
+        labels, sims = self.batch_top_k(query.data[None, :], k)
+        return list(zip(labels[0], sims[0].tolist()))
+
+    @instrumented
+    def batch_top_k(self, queries: Queries,
+                    k: int = 1) -> Tuple[List[List[Hashable]], np.ndarray]:
+        """Find the k most similar prototypes for each of Q queries.
+
+        Args:
+            queries: TritMatrix, (Q, dim) array or sequence of TritVector
+            k: Number of matches per query
+
+        Returns:
+            (labels, similarities): Q lists of up to k labels, and a
+            float32 array of shape (Q, min(k, len(self))), best first
+        """
+        scores = self.scores(queries)
+        k = min(k, self._size)
+        if k <= 0:
+            return [[] for _ in range(len(scores))], np.zeros((len(scores), 0), np.float32)
+        idx = top_k_rows(scores, k)
+        sims = np.take_along_axis(scores, idx, axis=1)
+        labels = [[self._labels[i] for i in row] for row in idx.tolist()]
+        return labels, sims
+
+    def _tail_fractions(self, block: int) -> np.ndarray:
+        """Share of each prototype's squared norm in dims >= each block start.
+
+        Returns:
+            float32 array of shape (len(self), num_blocks + 1); column b is
+            the fraction of non-zeros at or after ``b * block`` (the last
+            column is 0). Cached until the memory changes.
+        """
+        if self._tails is not None and self._tails[0] == block:
+            return self._tails[1]
+        data = self._data[:self._size]
+        counts = np.add.reduceat(data != 0, np.arange(0, self._dim, block), axis=1, dtype=np.int32)
+        tails = np.zeros((self._size, counts.shape[1] + 1), dtype=np.float32)
+        tails[:, :-1] = np.cumsum(counts[:, ::-1], axis=1)[:, ::-1]
+        tails /= np.maximum(tails[:, :1], 1)
+        self._tails = (block, tails)
+        return tails
+
+    @instrumented
+    def progressive_top_k(self, query: TritVector, k: int = 1, block: int = 1024,
+                          z: Optional[float] = None) -> ProgressiveResult:
+        """Top-k lookup that scores dimension blocks and drops hopeless prototypes.
+
+        Prototypes are scored on dims ``[0, block)``, then the next block,
+        and so on. After each block every surviving prototype has a partial
+        score and a bound on what the remaining dims can still add; those
+        whose best case falls below the k-th best worst case are dropped.
+        Once only k remain they are finished in one step.
+
+        With ``z=None`` the bound is Cauchy-Schwarz over the remaining
+        dims, so the result is exactly that of ``top_k``. With a number,
+        the remaining contribution is treated as zero-mean noise and
+        bounded by ``z`` standard deviations, which prunes far earlier
+        (e.g. ``z=5``) at a small risk of dropping a true match.
+
+        Args:
+            query: Query vector
+            k: Number of matches
+            block: Dimensions scored per step
+            z: Statistical bound in standard deviations (None = exact)
+
+        Returns:
+            ProgressiveResult of labels, similarities and the fraction of
+            work skipped
+
+        Example:
+            >>> result = memory.progressive_top_k(noisy_apple, k=1, z=5.0)
+            >>> result.labels, result.skipped
+            (['apple'], 0.87)
+        """
+        q = query.data
+        assert len(q) == self._dim, "Vectors must have same dimension"
+        n, dim = self._size, self._dim
+        k = min(k, n)
+        if k <= 0:
+            return ProgressiveResult([], np.zeros(0, dtype=np.float32), 0.0)
+
+        edges = list(range(0, dim, block)) + [dim]
+        qn = normalize_rows(q[None, :])[0]
+        q_nnz = max(int(np.count_nonzero(q)), 1)
+        q_counts = np.add.reduceat(q != 0, edges[:-1], dtype=np.int64)
+        q_tails = np.append(np.cumsum(q_counts[::-1])[::-1], 0) / q_nnz
+        p_tails = self._tail_fractions(block)
+
+        active = np.arange(n)
+        partial = np.zeros(n, dtype=np.float32)
+        work = 0
+        for b in range(len(edges) - 1):
+            d0, d1 = edges[b], edges[b + 1]
+            rows = self._normed[:n, d0:d1] if len(active) == n else self._normed[active, d0:d1]
+            partial += rows @ qn[d0:d1]
+            work += len(active) * (d1 - d0)
+            if d1 == dim:
+                break
+
+            rest = p_tails[active, b + 1]
+            bound = np.sqrt(rest * q_tails[b + 1])
+            if z is not None:
+                np.minimum(bound, z * np.sqrt(rest / q_nnz), out=bound)
+            bound += _SLACK
+            lower = partial - bound
+            kth = np.partition(lower, len(lower) - k)[len(lower) - k]
+            keep = partial + bound >= kth
+            if not keep.all():
+                active, partial = active[keep], partial[keep]
+            if len(active) == k:
+                partial += self._normed[active, d1:] @ qn[d1:]
+                work += k * (dim - d1)
+                break
+
+        order = np.argsort(-partial, kind="stable")[:k]
+        labels = [self._labels[i] for i in active[order].tolist()]
+        return ProgressiveResult(labels, partial[order], 1.0 - work / (n * dim))
+
+    @instrumented
+    def cleanup(self, query: TritVector, threshold: float = 0.0,
+                progressive: bool = False, z: Optional[float] = None) -> TritVector:
+        """Return the closest prototype, or ``query`` if none beats ``threshold``.
+
+        Args:
+            query: Noisy vector to clean up
+            threshold: Minimum similarity for a match
+            progressive: Use ``progressive_top_k`` (early exit) instead of
+                scoring every prototype on every dimension
+            z: Statistical bound for the progressive search (None = exact)
+        """
+        if self._size == 0:
+            return query
+        if progressive:
+            result = self.progressive_top_k(query, 1, z=z)
+            best, score = self._slots[result.labels[0]], result.similarities[0]
+        else:
+            scores = self.scores(query.data[None, :])[0]
+            best = int(np.argmax(scores))
+            score = scores[best]
+        if score <= threshold:
+            return query
+        return TritVector.from_trusted(self._data[best].copy())
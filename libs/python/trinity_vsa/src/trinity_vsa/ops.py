@@ -1,15 +1,29 @@
 """VSA operations: bind, bundle, permute, similarity."""
 
-from typing import List, Sequence
+from typing import List, Optional, Sequence, Tuple, Union
 import numpy as np
 
-from .core import TritVector
+from .core import TritVector, PackedTritVec, SparseVec, CountVector, popcount, _roll_into
+from .accumulator import BundleAccumulator
+from .memory import ItemMemory
+from .permutation import Permutation
+from .sparse import AnyVector, bundle_sparse
+from .profiling import instrumented
 
+PackedMatrix = Union[Tuple[np.ndarray, np.ndarray], Sequence[PackedTritVec]]
 
-def bind(a: TritVector, b: TritVector) -> TritVector:
+# Rows scored per chunk in the packed batch kernels; bounds the size of
+# the (rows, words) temporaries to a few MB at dim=10k.
+_PACKED_CHUNK = 4096
+
+
+@instrumented
+def bind(a: AnyVector, b: AnyVector, out: Optional[TritVector] = None) -> AnyVector:
     """Bind two vectors (element-wise multiplication).
     
-    Creates an association between two concepts.
+    Creates an association between two concepts. If either input is a
+    SparseVec the result is a SparseVec computed in O(nnz); binding a
+    CountVector binds every item in its superposition.
     
     Properties:
         - bind(a, a) results in all +1 (for non-zero elements)
@@ -19,9 +33,11 @@ def bind(a: TritVector, b: TritVector) -> TritVector:
     Args:
         a: First vector
         b: Second vector
+        out: Optional dense vector to write the result into (may be
+            ``a`` or ``b``); avoids allocating a new vector
         
     Returns:
-        Bound vector
+        Bound vector (``out`` if given)
         
     Example:
         >>> apple = TritVector.random(1000)
@@ -29,10 +45,21 @@ def bind(a: TritVector, b: TritVector) -> TritVector:
         >>> red_apple = bind(apple, red)
     """
     assert a.dim == b.dim, "Vectors must have same dimension"
-    return TritVector(a.data * b.data)
+    if isinstance(a, CountVector) or isinstance(b, CountVector):
+        assert out is None, "out= is only supported for dense vectors"
+        return a.bind(b) if isinstance(a, CountVector) else b.bind(a)
+    if isinstance(a, SparseVec) or isinstance(b, SparseVec):
+        assert out is None, "out= is only supported for dense vectors"
+        return a.bind(b) if isinstance(a, SparseVec) else b.bind(a)
+    if out is None:
+        return TritVector.from_trusted(a.data * b.data)
+    assert out.dim == a.dim, "Output must have same dimension"
+    np.multiply(a.data, b.data, out=out.data)
+    return out
 
 
-def unbind(bound: TritVector, key: TritVector) -> TritVector:
+@instrumented
+def unbind(bound: AnyVector, key: AnyVector, out: Optional[TritVector] = None) -> AnyVector:
     """Unbind (same as bind for balanced ternary).
     
     Retrieves one vector from a bound pair.
@@ -40,6 +67,7 @@ def unbind(bound: TritVector, key: TritVector) -> TritVector:
     Args:
         bound: Bound vector
         key: Key vector to unbind with
+        out: Optional dense vector to write the result into
         
     Returns:
         Retrieved vector (approximately equal to the other bound vector)
@@ -49,19 +77,25 @@ def unbind(bound: TritVector, key: TritVector) -> TritVector:
         >>> recovered = unbind(red_apple, red)
         >>> # recovered ≈ apple
     """
-    return bind(bound, key)
+    return bind(bound, key, out=out)
 
 
-def bundle(vectors: Sequence[TritVector]) -> TritVector:
+@instrumented
+def bundle(vectors: Sequence[AnyVector], out: Optional[TritVector] = None) -> AnyVector:
     """Bundle multiple vectors (majority voting).
     
-    Creates a superposition that is similar to all inputs.
+    Creates a superposition that is similar to all inputs. To bundle a
+    stream too large to hold in memory, use BundleAccumulator. If all
+    inputs are SparseVec the bundle is computed and returned in sparse
+    form; a mix of dense and sparse inputs gives a dense TritVector.
+    CountVector inputs contribute their full counts, not one vote each.
     
     Args:
         vectors: Sequence of vectors to bundle
+        out: Optional dense vector to write the result into
         
     Returns:
-        Bundled vector
+        Bundled vector (``out`` if given)
         
     Example:
         >>> fruits = bundle([apple, orange, banana])
@@ -70,18 +104,27 @@ def bundle(vectors: Sequence[TritVector]) -> TritVector:
     if not vectors:
         return TritVector.zeros(0)
     
+    if all(isinstance(v, SparseVec) for v in vectors):
+        assert out is None, "out= is only supported for dense vectors"
+        return bundle_sparse(vectors)
+    
     dim = vectors[0].dim
     assert all(v.dim == dim for v in vectors), "All vectors must have same dimension"
     
-    # Sum all vectors
-    sums = np.sum([v.data.astype(np.int32) for v in vectors], axis=0)
+    if any(isinstance(v, CountVector) for v in vectors):
+        result = CountVector.from_vectors(vectors, dtype=np.int32).threshold()
+        if out is None:
+            return result
+        np.copyto(out.data, result.data)
+        return out
     
-    # Threshold: positive -> 1, negative -> -1, zero -> 0
-    result = np.sign(sums).astype(np.int8)
-    return TritVector(result)
+    # Sum into one running int32 array (no per-vector copies), then
+    # threshold: positive -> 1, negative -> -1, zero -> 0
+    return BundleAccumulator(dim).add_many(vectors).finalize(out=out)
 
 
-def permute(v: TritVector, shift: int) -> TritVector:
+@instrumented
+def permute(v: AnyVector, shift: int, out: Optional[TritVector] = None) -> AnyVector:
     """Permute vector (circular shift).
     
     Used for encoding sequences and positions.
@@ -89,18 +132,27 @@ def permute(v: TritVector, shift: int) -> TritVector:
     Args:
         v: Vector to permute
         shift: Number of positions to shift (positive = right)
+        out: Optional dense vector to write the result into (may be ``v``)
         
     Returns:
-        Permuted vector
+        Permuted vector (``out`` if given)
         
     Example:
         >>> # Encode sequence: word1, word2, word3
         >>> seq = bind(word1, bind(permute(word2, 1), permute(word3, 2)))
     """
-    return TritVector(np.roll(v.data, shift))
+    if isinstance(v, (SparseVec, CountVector)):
+        assert out is None, "out= is only supported for dense vectors"
+        return v.permute(shift)
+    if out is None:
+        return TritVector.from_trusted(np.roll(v.data, shift))
+    assert out.dim == v.dim, "Output must have same dimension"
+    _roll_into(v.data, shift, out.data)
+    return out
 
 
-def similarity(a: TritVector, b: TritVector) -> float:
+@instrumented
+def similarity(a: AnyVector, b: AnyVector) -> float:
     """Cosine similarity between two vectors.
     
     Args:
@@ -118,6 +170,14 @@ def similarity(a: TritVector, b: TritVector) -> float:
         >>> print(f"Similarity: {sim:.3f}")
     """
     assert a.dim == b.dim, "Vectors must have same dimension"
+    if isinstance(a, CountVector):
+        return a.similarity(b)
+    if isinstance(b, CountVector):
+        return b.similarity(a)
+    if isinstance(a, SparseVec):
+        return a.similarity(b)
+    if isinstance(b, SparseVec):
+        return b.similarity(a)
     
     dot = np.sum(a.data.astype(np.float64) * b.data.astype(np.float64))
     norm_a = np.sqrt(np.sum(a.data.astype(np.float64) ** 2))
@@ -129,9 +189,78 @@ def similarity(a: TritVector, b: TritVector) -> float:
     return float(dot / (norm_a * norm_b))
 
 
-def hamming_distance(a: TritVector, b: TritVector) -> int:
+def _packed_planes(packed_matrix: PackedMatrix) -> Tuple[np.ndarray, np.ndarray]:
+    """Normalize a packed matrix argument to (pos, neg) 2-D uint64 arrays."""
+    if isinstance(packed_matrix, tuple):
+        pos, neg = packed_matrix
+    else:
+        pos = np.stack([p.pos for p in packed_matrix])
+        neg = np.stack([p.neg for p in packed_matrix])
+    return np.atleast_2d(pos), np.atleast_2d(neg)
+
+
+@instrumented
+def dot_many(query: PackedTritVec, packed_matrix: PackedMatrix) -> np.ndarray:
+    """Dot products of one packed query against N packed vectors.
+    
+    Args:
+        query: Packed query vector
+        packed_matrix: Either a (pos, neg) tuple of (N, words) uint64
+            planes (as returned by ``pack_trits``) or a sequence of
+            PackedTritVec
+        
+    Returns:
+        int64 array of N dot products
+        
+    Example:
+        >>> pos, neg = pack_trits(codebook)
+        >>> scores = dot_many(PackedTritVec.from_trit_vector(q), (pos, neg))
+    """
+    pos, neg = _packed_planes(packed_matrix)
+    assert pos.shape[1] == len(query.pos), "Vectors must have same dimension"
+    
+    out = np.empty(pos.shape[0], dtype=np.int64)
+    for start in range(0, pos.shape[0], _PACKED_CHUNK):
+        p = pos[start:start + _PACKED_CHUNK]
+        n = neg[start:start + _PACKED_CHUNK]
+        agree = (p & query.pos) | (n & query.neg)
+        disagree = (p & query.neg) | (n & query.pos)
+        out[start:start + _PACKED_CHUNK] = popcount(agree) - popcount(disagree)
+    return out
+
+
+@instrumented
+def similarity_many(query: PackedTritVec, packed_matrix: PackedMatrix) -> np.ndarray:
+    """Cosine similarities of one packed query against N packed vectors.
+    
+    Args:
+        query: Packed query vector
+        packed_matrix: (pos, neg) planes or a sequence of PackedTritVec
+        
+    Returns:
+        float64 array of N similarities in [-1.0, 1.0]
+    """
+    pos, neg = _packed_planes(packed_matrix)
+    dots = dot_many(query, (pos, neg))
+    norms = np.empty(pos.shape[0], dtype=np.float64)
+    for start in range(0, pos.shape[0], _PACKED_CHUNK):
+        rows = pos[start:start + _PACKED_CHUNK] | neg[start:start + _PACKED_CHUNK]
+        norms[start:start + _PACKED_CHUNK] = popcount(rows)
+    norms = np.sqrt(norms * query.nnz)
+    
+    result = np.zeros(pos.shape[0], dtype=np.float64)
+    np.divide(dots, norms, out=result, where=norms != 0)
+    return result
+
+
+@instrumented
+def hamming_distance(a: Union[TritVector, PackedTritVec],
+                     b: Union[TritVector, PackedTritVec]) -> int:
     """Hamming distance (number of differing positions).
     
+    Packed vectors are compared with popcount on their bit planes. For
+    one-vs-many and all-pairs distances see ``trinity_vsa.pairwise``.
+    
     Args:
         a: First vector
         b: Second vector
@@ -140,10 +269,13 @@ def hamming_distance(a: TritVector, b: TritVector) -> int:
         Number of positions where vectors differ
     """
     assert a.dim == b.dim, "Vectors must have same dimension"
-    return int(np.sum(a.data != b.data))
+    if isinstance(a, PackedTritVec) and isinstance(b, PackedTritVec):
+        return a.hamming(b)
+    return int(np.count_nonzero(a.data != b.data))
 
 
-def dot_product(a: TritVector, b: TritVector) -> int:
+@instrumented
+def dot_product(a: AnyVector, b: AnyVector) -> int:
     """Dot product of two vectors.
     
     Args:
@@ -154,14 +286,27 @@ def dot_product(a: TritVector, b: TritVector) -> int:
         Sum of element-wise products
     """
     assert a.dim == b.dim, "Vectors must have same dimension"
+    if isinstance(a, CountVector):
+        return a.dot(b)
+    if isinstance(b, CountVector):
+        return b.dot(a)
+    if isinstance(a, SparseVec):
+        return a.dot(b)
+    if isinstance(b, SparseVec):
+        return b.dot(a)
     return int(np.sum(a.data.astype(np.int64) * b.data.astype(np.int64)))
 
 
-def encode_sequence(words: List[TritVector]) -> TritVector:
+@instrumented
+def encode_sequence(words: List[TritVector],
+                    permutation: Optional["Permutation"] = None) -> TritVector:
     """Encode a sequence of vectors using permutation.
     
     Args:
         words: List of word vectors in order
+        permutation: Optional position permutation P; word i is encoded
+            as P**i(word). Defaults to a circular shift by 1, i.e.
+            ``permute(word, i)``. Powers of P are cached on the object.
         
     Returns:
         Single vector encoding the sequence
@@ -172,34 +317,47 @@ def encode_sequence(words: List[TritVector]) -> TritVector:
     if not words:
         return TritVector.zeros(0)
     
-    result = words[0]
+    # Reuse two buffers instead of allocating per word
+    result = TritVector.from_trusted(words[0].data.copy())
+    if permutation is not None:
+        for i, word in enumerate(words[1:], 1):
+            permutation.power(i).apply_bind(word, result, out=result)
+        return result
+    
+    shifted = TritVector.zeros(result.dim)
     for i, word in enumerate(words[1:], 1):
-        result = bind(result, permute(word, i))
+        result.bind_(permute(word, i, out=shifted))
     
     return result
 
 
-def cleanup(query: TritVector, memory: List[TritVector], threshold: float = 0.0) -> TritVector:
+@instrumented
+def cleanup(query: TritVector, memory: Union[List[TritVector], "ItemMemory"],
+            threshold: float = 0.0) -> TritVector:
     """Clean up noisy vector by finding closest match in memory.
     
     Args:
         query: Noisy query vector
-        memory: List of clean prototype vectors
+        memory: List of clean prototype vectors, or an ItemMemory
+            (preferred for repeated lookups: its codebook is normalized once)
         threshold: Minimum similarity to return a match
         
     Returns:
         Closest matching vector from memory, or query if no match
     """
+    if isinstance(memory, ItemMemory):
+        return memory.cleanup(query, threshold)
     if not memory:
         return query
     
-    best_sim = threshold
-    best_match = query
-    
-    for proto in memory:
-        sim = similarity(query, proto)
-        if sim > best_sim:
-            best_sim = sim
-            best_match = proto
+    # Score all prototypes with one matrix-vector product
+    protos = np.stack([proto.data for proto in memory]).astype(np.float32)
+    dots = protos @ query.data.astype(np.float32)
+    norms = np.sqrt(np.count_nonzero(protos, axis=1) * float(query.nnz))
+    sims = np.zeros(len(memory), dtype=np.float64)
+    np.divide(dots, norms, out=sims, where=norms != 0)
     
-    return best_match
+    best = int(np.argmax(sims))
+    if sims[best] <= threshold:
+        return query
+    return memory[best]
@@ -0,0 +1,295 @@
+"""Blocked distance and similarity matrices and top-k search over large vector sets."""
+
+from typing import Callable, Iterator, Optional, Sequence, Tuple, Union
+import numpy as np
+
+from .core import PackedTritVec, pack_trits, popcount
+from .matrix import Queries, TritMatrix, as_rows
+
+PackedRows = Union[TritMatrix, np.ndarray, Tuple[np.ndarray, np.ndarray], Sequence[PackedTritVec]]
+
+# Default scratch memory per block (bytes)
+DEFAULT_BUDGET = 64 << 20
+# Default rows/columns per similarity tile (2 x 80 MB float32 operands at dim=10k)
+DEFAULT_BLOCK = 2048
+
+BlockCallback = Callable[[slice, slice, np.ndarray], None]
+
+
+def _planes(vectors: PackedRows) -> Tuple[np.ndarray, np.ndarray]:
+    """Normalize an argument to (N, words) uint64 ``pos``/``neg`` planes.
+
+    Accepts (pos, neg) planes as returned by ``pack_trits``, a sequence of
+    PackedTritVec, or dense trits (TritMatrix or (N, dim) array), which
+    are packed once here.
+    """
+    if isinstance(vectors, tuple):
+        pos, neg = vectors
+    elif isinstance(vectors, TritMatrix):
+        pos, neg = vectors.to_packed()
+    elif isinstance(vectors, np.ndarray):
+        pos, neg = pack_trits(np.atleast_2d(vectors))
+    else:
+        pos = np.stack([v.pos for v in vectors])
+        neg = np.stack([v.neg for v in vectors])
+    return np.atleast_2d(pos), np.atleast_2d(neg)
+
+
+def _block_shape(na: int, nb: int, bytes_per_pair: int, budget: int) -> Tuple[int, int]:
+    """Rows and columns per block so one block's scratch fits ``budget``."""
+    pairs = max(budget // max(bytes_per_pair, 1), 1)
+    cols = int(min(nb, max(pairs // max(min(na, 256), 1), 1)))
+    rows = int(min(na, max(pairs // cols, 1)))
+    return rows, cols
+
+
+def hamming_many(query: PackedTritVec, vectors: PackedRows) -> np.ndarray:
+    """Hamming distances of one packed query to N vectors.
+
+    Returns:
+        int64 array of N distances
+    """
+    pos, neg = _planes(vectors)
+    assert pos.shape[1] == len(query.pos), "Vectors must have same dimension"
+    return popcount((pos ^ query.pos) | (neg ^ query.neg))
+
+
+def iter_hamming_blocks(A: PackedRows, B: Optional[PackedRows] = None,
+                        memory_budget: int = DEFAULT_BUDGET
+                        ) -> Iterator[Tuple[slice, slice, np.ndarray]]:
+    """Yield the all-pairs hamming distance matrix block by block.
+
+    Each block is computed as XOR/OR of the bit planes, broadcast over
+    (rows, cols, words), followed by a popcount, in scratch buffers that
+    are allocated once and sized to ``memory_budget``.
+
+    Args:
+        A: N vectors (planes, PackedTritVec sequence or dense trits)
+        B: M vectors (default: ``A``)
+        memory_budget: Scratch bytes per block
+
+    Yields:
+        (rows, cols, distances): slices into A and B and the int32
+        distance block ``D[rows, cols]`` (a reused buffer; copy it to keep)
+    """
+    pa, na_ = _planes(A)
+    pb, nb_ = (pa, na_) if B is None else _planes(B)
+    words = pa.shape[1]
+    assert pb.shape[1] == words, "Vectors must have same dimension"
+    has_count = hasattr(np, "bitwise_count")
+    # two uint64 planes plus uint8 counts per word, plus the int32 result
+    rows, cols = _block_shape(len(pa), len(pb), words * (16 + has_count) + 4, memory_budget)
+
+    diff = np.empty((rows, cols, words), dtype=np.uint64)
+    tmp = np.empty_like(diff)
+    counts = np.empty((rows, cols, words), dtype=np.uint8) if has_count else None
+    result = np.empty((rows, cols), dtype=np.int32)
+    for r0 in range(0, len(pa), rows):
+        r1 = min(r0 + rows, len(pa))
+        for c0 in range(0, len(pb), cols):
+            c1 = min(c0 + cols, len(pb))
+            d = diff[:r1 - r0, :c1 - c0]
+            t = tmp[:r1 - r0, :c1 - c0]
+            np.bitwise_xor(pa[r0:r1, None, :], pb[None, c0:c1, :], out=d)
+            np.bitwise_xor(na_[r0:r1, None, :], nb_[None, c0:c1, :], out=t)
+            np.bitwise_or(d, t, out=d)
+            block = result[:r1 - r0, :c1 - c0]
+            if has_count:
+                c = counts[:r1 - r0, :c1 - c0]
+                np.bitwise_count(d, out=c)
+                c.sum(axis=-1, dtype=np.int32, out=block)
+            else:
+                block[...] = popcount(d)
+            yield slice(r0, r1), slice(c0, c1), block
+
+
+def pairwise_hamming(A: PackedRows, B: Optional[PackedRows] = None,
+                     memory_budget: int = DEFAULT_BUDGET,
+                     out: Optional[np.ndarray] = None) -> np.ndarray:
+    """All-pairs hamming distance matrix, computed in bounded-memory blocks.
+
+    Args:
+        A: N vectors (planes, PackedTritVec sequence or dense trits)
+        B: M vectors (default: ``A``)
+        memory_budget: Scratch bytes per block (the result is extra)
+        out: Optional (N, M) integer array to write into, e.g. an
+            ``np.memmap`` for matrices larger than RAM
+
+    Returns:
+        int32 array of shape (N, M) (``out`` if given)
+
+    Example:
+        >>> D = pairwise_hamming(codebook)          # (N, N)
+        >>> dupes = np.argwhere(np.triu(D < 50, k=1))
+    """
+    A = _planes(A)
+    B = A if B is None else _planes(B)
+    shape = (len(A[0]), len(B[0]))
+    if out is None:
+        out = np.empty(shape, dtype=np.int32)
+    assert out.shape == shape, "Output must have shape (len(A), len(B))"
+    for rows, cols, block in iter_hamming_blocks(A, B, memory_budget):
+        out[rows, cols] = block
+    return out
+
+
+def top_k_hamming(queries: PackedRows, database: PackedRows, k: int = 1,
+                  memory_budget: int = DEFAULT_BUDGET) -> Tuple[np.ndarray, np.ndarray]:
+    """k nearest database vectors by hamming distance, for every query.
+
+    The distance matrix is never materialized: each block is merged into
+    a running (Q, k) best list with ``argpartition``.
+
+    Args:
+        queries: Q vectors
+        database: N vectors
+        k: Number of neighbours per query
+        memory_budget: Scratch bytes per block
+
+    Returns:
+        (indices, distances): two (Q, min(k, N)) arrays, nearest first
+        (ties broken by lower index)
+    """
+    qp = _planes(queries)
+    dp = _planes(database)
+    n = len(dp[0])
+    k = min(k, n)
+    # rank by one int64 key so ties resolve to the lower index exactly
+    stride = np.int64(n + 1)
+    best = np.full((len(qp[0]), k), np.iinfo(np.int64).max, dtype=np.int64)
+    if k > 0:
+        for rows, cols, block in iter_hamming_blocks(qp, dp, memory_budget):
+            keys = block * stride + np.arange(cols.start, cols.stop, dtype=np.int64)
+            cand = np.concatenate([best[rows], keys], axis=1)
+            part = np.argpartition(cand, k - 1, axis=1)[:, :k]
+            best[rows] = np.take_along_axis(cand, part, axis=1)
+        best.sort(axis=1)
+    return best % stride, best // stride
+
+
+def iter_similarity_blocks(A: Queries, B: Optional[Queries] = None,
+                           block: int = DEFAULT_BLOCK, normalize: bool = True,
+                           triangular: bool = False
+                           ) -> Iterator[Tuple[slice, slice, np.ndarray]]:
+    """Yield the all-pairs similarity matrix tile by tile.
+
+    Each tile is one float32 BLAS matmul of a (block, dim) slice of A
+    against a (block, dim) slice of B. Trit dot products are integers
+    with ``|dot| <= dim < 2**24``, so float32 holds them exactly; only
+    the two operand tiles and one result tile are ever in memory.
+
+    Args:
+        A: N vectors (TritMatrix, (N, dim) array or sequence of TritVector)
+        B: M vectors (default: ``A``)
+        block: Rows and columns per tile
+        normalize: Yield cosine similarities (float32); if False, yield
+            the exact int32 dot products
+        triangular: With ``B=None``, skip tiles below the diagonal (the
+            matrix is symmetric); diagonal tiles are yielded whole
+
+    Yields:
+        (rows, cols, tile): slices into A and B and the tile
+        ``S[rows, cols]`` (a reused buffer; copy it to keep)
+    """
+    a = as_rows(A)
+    b = a if B is None else as_rows(B)
+    assert a.shape[1] == b.shape[1], "Vectors must have same dimension"
+    triangular = triangular and B is None
+    if normalize:
+        inv_a = 1.0 / np.sqrt(np.maximum(np.count_nonzero(a, axis=1), 1)).astype(np.float32)
+        inv_b = inv_a if B is None else (
+            1.0 / np.sqrt(np.maximum(np.count_nonzero(b, axis=1), 1)).astype(np.float32))
+
+    result = np.empty((min(block, len(a)), min(block, len(b))), dtype=np.float32)
+    dots = None if normalize else np.empty(result.shape, dtype=np.int32)
+    for r0 in range(0, len(a), block):
+        r1 = min(r0 + block, len(a))
+        lhs = a[r0:r1].astype(np.float32)
+        for c0 in range(r0 if triangular else 0, len(b), block):
+            c1 = min(c0 + block, len(b))
+            rhs = lhs if triangular and c0 == r0 else b[c0:c1].astype(np.float32)
+            tile = result[:r1 - r0, :c1 - c0]
+            np.matmul(lhs, rhs.T, out=tile)
+            if normalize:
+                tile *= inv_a[r0:r1, None]
+                tile *= inv_b[None, c0:c1]
+            else:
+                tile = dots[:r1 - r0, :c1 - c0]
+                tile[...] = result[:r1 - r0, :c1 - c0]
+            yield slice(r0, r1), slice(c0, c1), tile
+
+
+def pairwise_similarity(A: Queries, B: Optional[Queries] = None,
+                        block: int = DEFAULT_BLOCK,
+                        out: Optional[np.ndarray] = None,
+                        callback: Optional[BlockCallback] = None,
+                        threshold: Optional[float] = None,
+                        normalize: bool = True
+                        ) -> Union[np.ndarray, Tuple[np.ndarray, np.ndarray, np.ndarray], None]:
+    """All-pairs cosine similarity (or dot product), computed tile by tile.
+
+    Exactly one output mode is used:
+
+    - ``callback``: called as ``callback(rows, cols, tile)`` for every tile
+      (the tile buffer is reused); returns None
+    - ``threshold``: only pairs with similarity >= ``threshold`` are kept
+      and returned in coordinate form; with ``B=None`` only pairs
+      ``i < j`` are reported and the lower triangle is never computed
+    - otherwise the dense (N, M) matrix is written to ``out`` (e.g. an
+      ``np.memmap`` for matrices larger than RAM) or a new array; with
+      ``B=None`` each off-diagonal tile is computed once and mirrored
+
+    Args:
+        A: N vectors (TritMatrix, (N, dim) array or sequence of TritVector)
+        B: M vectors (default: ``A``)
+        block: Rows and columns per tile
+        out: Optional (N, M) array for the dense result
+        callback: Optional per-tile consumer
+        threshold: Optional cut-off for sparse output
+        normalize: Cosine similarities (float32) if True, int32 dot
+            products if False
+
+    Returns:
+        The dense matrix, ``(i, j, values)`` arrays for ``threshold``, or
+        None for ``callback``
+
+    Example:
+        >>> S = np.lib.format.open_memmap("sims.npy", "w+", np.float32, (N, N))
+        >>> pairwise_similarity(vectors, out=S)
+        >>> i, j, sims = pairwise_similarity(vectors, threshold=0.3)   # edges
+    """
+    A = as_rows(A)
+    B = None if B is None else as_rows(B)
+    if callback is not None:
+        assert out is None and threshold is None, "Pass only one of out, callback, threshold"
+        for rows, cols, tile in iter_similarity_blocks(A, B, block, normalize):
+            callback(rows, cols, tile)
+        return None
+
+    if threshold is not None:
+        assert out is None, "Pass only one of out, callback, threshold"
+        found_i, found_j, found_v = [], [], []
+        for rows, cols, tile in iter_similarity_blocks(A, B, block, normalize,
+                                                       triangular=True):
+            mask = tile >= threshold
+            if B is None and rows.start == cols.start:
+                mask = np.triu(mask, k=1)
+            i, j = np.nonzero(mask)
+            found_i.append(i + rows.start)
+            found_j.append(j + cols.start)
+            found_v.append(tile[i, j])
+        if not found_i:
+            return (np.zeros(0, np.int64), np.zeros(0, np.int64),
+                    np.zeros(0, np.float32 if normalize else np.int32))
+        return np.concatenate(found_i), np.concatenate(found_j), np.concatenate(found_v)
+
+    n = len(A)
+    m = n if B is None else len(B)
+    if out is None:
+        out = np.empty((n, m), dtype=np.float32 if normalize else np.int32)
+    assert out.shape == (n, m), "Output must have shape (len(A), len(B))"
+    for rows, cols, tile in iter_similarity_blocks(A, B, block, normalize, triangular=True):
+        out[rows, cols] = tile
+        if B is None and rows != cols:
+            out[cols, rows] = tile.T
+    return out
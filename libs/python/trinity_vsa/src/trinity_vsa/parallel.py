@@ -0,0 +1,255 @@
+"""Multi-core execution of batched operations over row chunks."""
+
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing import shared_memory
+import os
+from typing import Any, Callable, List, Optional, Sequence, Tuple, Union
+import numpy as np
+
+from .core import TritVector
+from .matrix import TritMatrix
+from .permutation import Permutation, encode_sequences
+
+# Upper bound on rows per task; bounds per-task temporaries (e.g. the
+# float32 copies made by matmul) and keeps enough tasks for balancing
+_MAX_CHUNK = 8192
+
+# Kernel signature: kernel(inputs, out, task, start, stop, *args) computes
+# rows [start, stop) of the job (task is the chunk number) into ``out``.
+# Kernels are module-level so the process backend can pickle them.
+
+
+def _bind_kernel(inputs, out, task, start, stop):
+    a, b = inputs
+    rhs = b if b.ndim == 1 else b[start:stop]
+    np.multiply(a[start:stop], rhs, out=out[start:stop])
+
+
+def _dot_kernel(inputs, out, task, start, stop):
+    rows, rhs = inputs
+    out[start:stop] = TritMatrix.from_trusted(rows[start:stop]).dot(TritMatrix.from_trusted(rhs))
+
+
+def _sum_kernel(inputs, out, task, start, stop):
+    rows, = inputs
+    rows[start:stop].sum(axis=0, dtype=out.dtype, out=out[task])
+
+
+def _encode_kernel(inputs, out, task, start, stop, permutation):
+    ids, codebook = inputs
+    encoded = encode_sequences(ids[start:stop], permutation=permutation,
+                               codebook=TritMatrix.from_trusted(codebook))
+    out[start:stop] = encoded.data
+
+
+ArraySpec = Tuple[str, Tuple[int, ...], str]
+
+
+def _attach(spec: ArraySpec) -> Tuple[shared_memory.SharedMemory, np.ndarray]:
+    name, shape, dtype = spec
+    shm = shared_memory.SharedMemory(name=name)
+    return shm, np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+
+
+def _run_shared(kernel: Callable, in_specs: Sequence[ArraySpec], out_spec: ArraySpec,
+                task: int, start: int, stop: int, args: tuple):
+    """Process-pool entry point: attach to shared buffers and run a kernel."""
+    blocks, arrays = [], []
+    try:
+        for spec in list(in_specs) + [out_spec]:
+            shm, arr = _attach(spec)
+            blocks.append(shm)
+            arrays.append(arr)
+        kernel(arrays[:-1], arrays[-1], task, start, stop, *args)
+    finally:
+        # views must be released before the mappings under them close
+        del arrays[:]
+        for shm in blocks:
+            shm.close()
+
+
+class ParallelExecutor:
+    """Runs batched bind / similarity / bundle / encode jobs on several cores.
+
+    A job over N rows is split into contiguous row chunks and each chunk
+    is handed to a worker that writes straight into its slice of one
+    preallocated result, so no per-chunk results are concatenated.
+
+    Backends:
+        - ``"thread"``: a thread pool. numpy releases the GIL inside its
+          array kernels and BLAS, so chunks run truly in parallel with no
+          copies at all. This is the right choice for everything here.
+        - ``"process"``: a process pool. Inputs and the result live in
+          ``multiprocessing.shared_memory`` blocks that the workers map, so
+          only the block names are pickled. Use it when the per-chunk work
+          holds the GIL (custom kernels written in Python).
+
+    Jobs smaller than one chunk run inline on the calling thread. If the
+    BLAS library is itself multi-threaded, limit its threads (e.g.
+    ``OPENBLAS_NUM_THREADS=1``) so similarity chunks do not oversubscribe.
+
+    Example:
+        >>> with ParallelExecutor(workers=8) as ex:
+        ...     sims = ex.similarity(codebook, queries)    # (N, M)
+        ...     doc = ex.bundle(encoded_ngrams)
+    """
+
+    def __init__(self, workers: Optional[int] = None, backend: str = "thread",
+                 chunk_rows: Optional[int] = None):
+        """Create an executor (the pool itself starts on first use).
+
+        Args:
+            workers: Number of worker threads/processes (default: CPU count)
+            backend: ``"thread"`` or ``"process"``
+            chunk_rows: Rows per task (default: N split evenly across
+                workers, at most 8192)
+        """
+        if backend not in ("thread", "process"):
+            raise ValueError(f"Unknown backend {backend!r}")
+        self.workers = workers or os.cpu_count() or 1
+        self.backend = backend
+        self.chunk_rows = chunk_rows
+        self._pool: Optional[Executor] = None
+
+    def __repr__(self) -> str:
+        return f"ParallelExecutor(workers={self.workers}, backend={self.backend!r})"
+
+    def __enter__(self) -> "ParallelExecutor":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        """Shut down the worker pool."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def _get_pool(self) -> Executor:
+        if self._pool is None:
+            if self.backend == "thread":
+                self._pool = ThreadPoolExecutor(self.workers)
+            else:
+                self._pool = ProcessPoolExecutor(self.workers)
+        return self._pool
+
+    def _chunks(self, n: int) -> List[Tuple[int, int]]:
+        size = self.chunk_rows or min(-(-n // self.workers), _MAX_CHUNK)
+        size = max(size, 1)
+        return [(start, min(start + size, n)) for start in range(0, n, size)]
+
+    def run(self, kernel: Callable, inputs: Sequence[np.ndarray], n_rows: int,
+            out: np.ndarray, *args: Any, chunks: Optional[List[Tuple[int, int]]] = None
+            ) -> np.ndarray:
+        """Run ``kernel`` over row chunks of a job and fill ``out``.
+
+        Args:
+            kernel: Module-level function ``kernel(inputs, out, task,
+                start, stop, *args)`` that computes rows ``[start, stop)``
+                (chunk number ``task``) into ``out``
+            inputs: Input arrays, passed to every call unchanged
+            n_rows: Number of rows to split
+            out: Result array shared by all chunks
+            *args: Extra picklable arguments for the kernel
+            chunks: Explicit (start, stop) ranges (default: ``_chunks(n_rows)``)
+
+        Returns:
+            ``out``
+        """
+        if chunks is None:
+            chunks = self._chunks(n_rows)
+        if len(chunks) <= 1 or self.workers == 1:
+            for task, (start, stop) in enumerate(chunks):
+                kernel(inputs, out, task, start, stop, *args)
+            return out
+        if self.backend == "thread":
+            futures = [self._get_pool().submit(kernel, inputs, out, task, start, stop, *args)
+                       for task, (start, stop) in enumerate(chunks)]
+            for f in futures:
+                f.result()
+            return out
+        return self._run_processes(kernel, inputs, out, chunks, args)
+
+    def _run_processes(self, kernel: Callable, inputs: Sequence[np.ndarray],
+                       out: np.ndarray, chunks: List[Tuple[int, int]], args: tuple) -> np.ndarray:
+        blocks: List[shared_memory.SharedMemory] = []
+        views: List[np.ndarray] = []
+
+        def share(arr: np.ndarray) -> ArraySpec:
+            shm = shared_memory.SharedMemory(create=True, size=max(arr.nbytes, 1))
+            blocks.append(shm)
+            views.append(np.ndarray(arr.shape, dtype=arr.dtype, buffer=shm.buf))
+            views[-1][...] = arr
+            return shm.name, arr.shape, arr.dtype.str
+
+        try:
+            in_specs = [share(np.ascontiguousarray(arr)) for arr in inputs]
+            out_spec = share(out)
+            futures = [self._get_pool().submit(_run_shared, kernel, in_specs, out_spec,
+                                               task, start, stop, args)
+                       for task, (start, stop) in enumerate(chunks)]
+            for f in futures:
+                f.result()
+            out[...] = views[-1]
+        finally:
+            del views[:]
+            for shm in blocks:
+                shm.close()
+                shm.unlink()
+        return out
+
+    def bind(self, a: TritMatrix, b: Union[TritMatrix, TritVector],
+             out: Optional[TritMatrix] = None) -> TritMatrix:
+        """Parallel ``a.bind(b)`` (row-wise, or broadcasting one vector)."""
+        rhs = b.data
+        assert rhs.shape[-1] == a.dim, "Vectors must have same dimension"
+        if rhs.ndim == 2:
+            assert rhs.shape == a.shape, "Matrices must have same shape"
+        if out is None:
+            out = TritMatrix.from_trusted(np.empty_like(a.data))
+        self.run(_bind_kernel, (a.data, rhs), len(a), out.data)
+        return out
+
+    def dot(self, m: TritMatrix, other: Union[TritMatrix, TritVector]) -> np.ndarray:
+        """Parallel ``m.dot(other)``: rows of ``m`` are split across workers."""
+        single = isinstance(other, TritVector)
+        rhs = other.data[None, :] if single else other.data
+        assert rhs.shape[1] == m.dim, "Vectors must have same dimension"
+        out = np.empty((len(m), rhs.shape[0]), dtype=np.int64)
+        self.run(_dot_kernel, (m.data, rhs), len(m), out)
+        return out[:, 0] if single else out
+
+    def similarity(self, m: TritMatrix,
+                   other: Union[TritMatrix, TritVector, None] = None) -> np.ndarray:
+        """Parallel ``m.similarity(other)`` (same shapes and values)."""
+        if other is None:
+            other = m
+        dots = self.dot(m, other)
+        if isinstance(other, TritVector):
+            denom = m.norms * np.sqrt(float(other.nnz))
+        else:
+            denom = np.outer(m.norms, other.norms)
+        result = np.zeros(dots.shape, dtype=np.float64)
+        np.divide(dots, denom, out=result, where=denom != 0)
+        return result
+
+    def bundle(self, m: TritMatrix) -> TritVector:
+        """Parallel ``m.bundle()``: per-chunk sums are reduced at the end."""
+        chunks = self._chunks(len(m))
+        partial = np.zeros((len(chunks), m.dim), dtype=np.int32)
+        self.run(_sum_kernel, (m.data,), len(m), partial, chunks=chunks)
+        sums = partial.sum(axis=0, dtype=np.int32)
+        return TritVector.from_trusted(np.sign(sums).astype(np.int8))
+
+    def encode_sequences(self, ids: np.ndarray, codebook: TritMatrix,
+                         permutation: Optional[Permutation] = None) -> TritMatrix:
+        """Parallel ``encode_sequences(ids, codebook=codebook)`` over the batch."""
+        ids = np.asarray(ids)
+        assert ids.ndim == 2, "Expected (batch, L) token ids"
+        out = np.empty((len(ids), codebook.dim), dtype=np.int8)
+        if permutation is not None and ids.shape[1] > 1:
+            # fill the power cache once instead of racing to fill it in every worker
+            permutation.power(ids.shape[1] - 1)
+        self.run(_encode_kernel, (ids, codebook.data), len(ids), out, permutation)
+        return TritMatrix.from_trusted(out)
@@ -0,0 +1,238 @@
+"""Permutation engine: cached index tables and fused permute+bind kernels."""
+
+import threading
+from functools import lru_cache
+from typing import Dict, Optional, Sequence, Union
+import numpy as np
+
+from .core import TritVector, _roll_into
+from .matrix import TritMatrix
+
+# Serializes power-cache fills so that permutations shared by worker
+# threads never see the cache resized mid-iteration (re-entrant because
+# filling one power may compute another)
+_CACHE_LOCK = threading.RLock()
+
+
+@lru_cache(maxsize=256)
+def _cyclic_table(dim: int, shift: int) -> np.ndarray:
+    """Gather table of ``np.roll(v, shift)``: out[i] = v[(i - shift) % dim]."""
+    table = (np.arange(dim, dtype=np.intp) - shift) % dim
+    table.flags.writeable = False
+    return table
+
+
+class Permutation:
+    """A fixed permutation of vector coordinates, in gather form.
+
+    ``apply(v)[i] == v[table[i]]``. Tables for powers ``P**k`` (used for
+    position k in a sequence) are computed once and cached, so encoding
+    reuses them instead of recomputing shifts per token. Cyclic shifts
+    keep the ``permute`` semantics and use a slice copy instead of a
+    gather.
+
+    Example:
+        >>> p = Permutation.random(10000, seed=7)
+        >>> q = p.power(3)              # cached table for p∘p∘p
+        >>> bound = p.apply_bind(word, context)   # p(word) * context
+    """
+
+    def __init__(self, table: np.ndarray):
+        """Create from a gather table (a permutation of ``range(dim)``)."""
+        table = np.asarray(table, dtype=np.intp)
+        assert table.ndim == 1, "Expected a 1-D table"
+        assert np.array_equal(np.sort(table), np.arange(len(table))), "Not a permutation"
+        self._init(table, None)
+
+    def _init(self, table: Optional[np.ndarray], shift: Optional[int]):
+        self._table = table
+        self._shift = shift
+        self._powers: Dict[int, "Permutation"] = {}
+
+    @classmethod
+    def cyclic(cls, dim: int, shift: int = 1) -> "Permutation":
+        """Circular shift by ``shift`` (same as ``permute(v, shift)``)."""
+        p = cls.__new__(cls)
+        p._init(None, shift % dim if dim else 0)
+        p._dim = dim
+        return p
+
+    @classmethod
+    def random(cls, dim: int, seed: Optional[int] = None) -> "Permutation":
+        """Uniformly random permutation."""
+        rng = np.random.default_rng(seed)
+        return cls(rng.permutation(dim))
+
+    @property
+    def dim(self) -> int:
+        return self._dim if self._table is None else len(self._table)
+
+    @property
+    def is_cyclic(self) -> bool:
+        return self._shift is not None
+
+    @property
+    def table(self) -> np.ndarray:
+        """Gather table (read-only)."""
+        if self._table is None:
+            return _cyclic_table(self._dim, self._shift)
+        return self._table
+
+    def __repr__(self) -> str:
+        kind = f"cyclic shift={self._shift}" if self.is_cyclic else "table"
+        return f"Permutation(dim={self.dim}, {kind})"
+
+    def power(self, k: int) -> "Permutation":
+        """``P**k`` (negative k gives inverse powers); cached per k.
+
+        Safe to call from several threads: lookups of cached powers are
+        lock-free, new powers are computed under a lock.
+        """
+        result = self._powers.get(k)
+        if result is not None:
+            return result
+        with _CACHE_LOCK:
+            return self._power(k)
+
+    def _power(self, k: int) -> "Permutation":
+        if k in self._powers:
+            return self._powers[k]
+        if self.is_cyclic:
+            result = Permutation.cyclic(self._dim, k * self._shift)
+        elif k == 0:
+            result = Permutation(np.arange(self.dim))
+        elif k < 0:
+            result = self.inverse().power(-k)
+        elif k == 1:
+            result = self
+        else:
+            # P**k = P**(k-1) ∘ P; fill the cache upwards from the
+            # highest power already known
+            known = max([j for j in self._powers if 1 < j < k], default=1)
+            table = self.power(known).table
+            for j in range(known + 1, k + 1):
+                table = table[self._table]
+                result = Permutation.__new__(Permutation)
+                result._init(table, None)
+                self._powers[j] = result
+        self._powers[k] = result
+        return result
+
+    def inverse(self) -> "Permutation":
+        """Inverse permutation."""
+        if self.is_cyclic:
+            return Permutation.cyclic(self._dim, -self._shift)
+        with _CACHE_LOCK:
+            if -1 not in self._powers:
+                inv = np.empty_like(self._table)
+                inv[self._table] = np.arange(len(self._table))
+                result = Permutation.__new__(Permutation)
+                result._init(inv, None)
+                self._powers[-1] = result
+            return self._powers[-1]
+
+    def _gather(self, data: np.ndarray, out: np.ndarray) -> np.ndarray:
+        if self.is_cyclic:
+            return _roll_into(data, self._shift, out)
+        # mode="clip" skips the bounds-check buffering; tables are valid
+        return np.take(data, self._table, axis=-1, out=out, mode="clip")
+
+    def apply(self, v: TritVector, out: Optional[TritVector] = None) -> TritVector:
+        """Permute ``v`` (into ``out`` if given; ``out`` must not alias ``v``)."""
+        assert v.dim == self.dim, "Vectors must have same dimension"
+        if out is None:
+            out = TritVector.zeros(self.dim)
+        self._gather(v.data, out.data)
+        return out
+
+    def apply_bind(self, v: TritVector, other: TritVector,
+                   out: Optional[TritVector] = None) -> TritVector:
+        """Fused ``bind(apply(v), other)`` without an intermediate vector.
+
+        ``out`` may alias ``other`` (e.g. a running sequence product) but
+        not ``v``.
+        """
+        assert v.dim == self.dim == other.dim, "Vectors must have same dimension"
+        if out is None:
+            out = TritVector.zeros(self.dim)
+        if out is other:
+            tmp = np.empty(self.dim, dtype=np.int8)
+            np.multiply(self._gather(v.data, tmp), other.data, out=out.data)
+        else:
+            np.multiply(self._gather(v.data, out.data), other.data, out=out.data)
+        return out
+
+    def apply_matrix(self, m: TritMatrix, out: Optional[TritMatrix] = None) -> TritMatrix:
+        """Permute every row of a matrix with one gather."""
+        assert m.dim == self.dim, "Vectors must have same dimension"
+        if out is None:
+            out = TritMatrix.from_trusted(np.empty_like(m.data))
+        self._gather(m.data, out.data)
+        return out
+
+
+def encode_sequences(tokens: Union[np.ndarray, Sequence[TritMatrix]],
+                     permutation: Optional[Permutation] = None,
+                     lengths: Optional[np.ndarray] = None,
+                     codebook: Optional[TritMatrix] = None) -> TritMatrix:
+    """Batched ``encode_sequence`` over a (batch, L, dim) token tensor.
+
+    Sequence b is encoded as ``prod_i P**i(tokens[b, i])``, which with
+    the default cyclic permutation matches ``encode_sequence``. The loop
+    runs over positions, not tokens: each step is one gather into a
+    reused buffer plus one in-place multiply over the whole batch.
+
+    Args:
+        tokens: int8 array of shape (batch, L, dim), a sequence of L
+            TritMatrix of shape (batch, dim) (one per position), or, with
+            ``codebook``, an integer array of (batch, L) token ids
+        permutation: Position permutation P (default: cyclic shift by 1)
+        lengths: Optional per-sequence lengths; positions at or beyond a
+            sequence's length are ignored
+        codebook: Optional TritMatrix of token vectors indexed by the
+            ids in ``tokens``; rows are gathered per position so the
+            (batch, L, dim) tensor is never materialized
+
+    Returns:
+        TritMatrix of shape (batch, dim)
+
+    Example:
+        >>> ids = np.array([[3, 1, 4], [1, 5, 9]])
+        >>> encoded = encode_sequences(ids, codebook=symbols)
+    """
+    if codebook is not None:
+        ids = np.asarray(tokens)
+        assert ids.ndim == 2, "Expected (batch, L) token ids"
+        batch, length = ids.shape
+        dim = codebook.dim
+        row_buf = np.empty((batch, dim), dtype=np.int8)
+
+        def step(i: int) -> np.ndarray:
+            return np.take(codebook.data, ids[:, i], axis=0, out=row_buf)
+    elif isinstance(tokens, np.ndarray):
+        assert tokens.ndim == 3, "Expected a (batch, L, dim) array"
+        batch, length, dim = tokens.shape
+
+        def step(i: int) -> np.ndarray:
+            return tokens[:, i, :]
+    else:
+        length = len(tokens)
+        assert length, "Need at least one position"
+        batch, dim = tokens[0].shape
+
+        def step(i: int) -> np.ndarray:
+            return tokens[i].data
+
+    assert length, "Need at least one position"
+    if permutation is None:
+        permutation = Permutation.cyclic(dim, 1)
+    assert permutation.dim == dim, "Permutation must match vector dimension"
+
+    result = np.array(step(0), dtype=np.int8)
+    buf = np.empty((batch, dim), dtype=np.int8)
+    for i in range(1, length):
+        permutation.power(i)._gather(step(i), buf)
+        if lengths is not None:
+            buf[np.asarray(lengths) <= i] = 1
+        np.multiply(result, buf, out=result)
+    return TritMatrix.from_trusted(result)
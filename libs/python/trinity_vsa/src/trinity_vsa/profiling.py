@@ -0,0 +1,218 @@
+"""Opt-in per-operation profiling: call counts, time, result bytes and dims.
+
+Instrumented functions check one module global per call and do nothing
+else while profiling is off. When a ``Profile`` is active each call is
+timed and recorded under the operation name (``bind``,
+``ItemMemory.batch_top_k``, ...). Times are inclusive, so an op that
+calls another instrumented op (``unbind`` -> ``bind``) is counted in
+both.
+
+Example:
+    >>> from trinity_vsa import profiling
+    >>> with profiling.profile() as prof:
+    ...     encode_batch(docs)
+    >>> prof.to_dict()["bind"]["calls"]
+    4096
+    >>> print(prof.to_prometheus())
+"""
+
+import functools
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, Optional, TypeVar
+import numpy as np
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+# Upper bounds of the Prometheus dimension histogram buckets
+DIM_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144)
+
+_ARRAY_ATTRS = ("data", "pos", "neg", "indices", "values", "planes")
+
+
+class OpStats:
+    """Accumulated statistics of one operation."""
+
+    __slots__ = ("calls", "seconds", "bytes", "dims")
+
+    def __init__(self):
+        self.calls = 0
+        self.seconds = 0.0
+        self.bytes = 0
+        self.dims: Dict[int, int] = {}
+
+    def __repr__(self) -> str:
+        return f"OpStats(calls={self.calls}, seconds={self.seconds:.6f}, bytes={self.bytes})"
+
+
+class Profile:
+    """Statistics collected while active, keyed by operation name.
+
+    Per op: number of calls, cumulative wall time, result bytes (the
+    arrays of newly returned results; results written into an ``out=``
+    buffer count 0) and a count of calls per vector dimension.
+    Temporaries inside an op are not counted. Recording is thread-safe.
+    """
+
+    def __init__(self):
+        self.ops: Dict[str, OpStats] = {}
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f"Profile(ops={len(self.ops)}, calls={sum(s.calls for s in self.ops.values())})"
+
+    def record(self, name: str, seconds: float, nbytes: int, dim: Optional[int]):
+        with self._lock:
+            stats = self.ops.get(name)
+            if stats is None:
+                stats = self.ops[name] = OpStats()
+            stats.calls += 1
+            stats.seconds += seconds
+            stats.bytes += nbytes
+            if dim is not None:
+                stats.dims[dim] = stats.dims.get(dim, 0) + 1
+
+    def reset(self):
+        with self._lock:
+            self.ops = {}
+
+    def to_dict(self) -> Dict[str, Dict[str, Any]]:
+        """Plain-dict snapshot, e.g. for JSON logging.
+
+        Returns:
+            {op: {"calls", "seconds", "result_bytes", "dims": {dim: calls}}}
+        """
+        with self._lock:
+            return {name: {"calls": s.calls, "seconds": s.seconds, "result_bytes": s.bytes,
+                           "dims": dict(s.dims)}
+                    for name, s in sorted(self.ops.items())}
+
+    def to_prometheus(self, prefix: str = "trinity_vsa") -> str:
+        """Snapshot in the Prometheus text exposition format.
+
+        Exports ``<prefix>_op_calls_total``, ``<prefix>_op_seconds_total``
+        and ``<prefix>_op_result_bytes_total`` counters and a
+        ``<prefix>_op_dim`` histogram, all labelled by ``op``.
+        """
+        ops = self.to_dict()
+        lines = []
+        for metric, field, help_text in (
+                ("op_calls_total", "calls", "Calls per operation."),
+                ("op_seconds_total", "seconds", "Cumulative wall time per operation."),
+                ("op_result_bytes_total", "result_bytes",
+                 "Bytes of newly returned result arrays per operation (out= results count 0).")):
+            lines.append(f"# HELP {prefix}_{metric} {help_text}")
+            lines.append(f"# TYPE {prefix}_{metric} counter")
+            for name, stats in ops.items():
+                lines.append(f'{prefix}_{metric}{{op="{name}"}} {stats[field]}')
+
+        lines.append(f"# HELP {prefix}_op_dim Vector dimension of each call.")
+        lines.append(f"# TYPE {prefix}_op_dim histogram")
+        for name, stats in ops.items():
+            dims = stats["dims"]
+            for bound in DIM_BUCKETS:
+                count = sum(c for d, c in dims.items() if d <= bound)
+                lines.append(f'{prefix}_op_dim_bucket{{op="{name}",le="{bound}"}} {count}')
+            total = sum(dims.values())
+            lines.append(f'{prefix}_op_dim_bucket{{op="{name}",le="+Inf"}} {total}')
+            lines.append(f'{prefix}_op_dim_sum{{op="{name}"}} {sum(d * c for d, c in dims.items())}')
+            lines.append(f'{prefix}_op_dim_count{{op="{name}"}} {total}')
+        return "\n".join(lines) + "\n"
+
+
+_active: Optional[Profile] = None
+
+
+def enable() -> Profile:
+    """Start recording into a process-wide profile (kept if already enabled)."""
+    global _active
+    if _active is None:
+        _active = Profile()
+    return _active
+
+
+def disable() -> Optional[Profile]:
+    """Stop recording; returns the profile that was active."""
+    global _active
+    prof, _active = _active, None
+    return prof
+
+
+def is_enabled() -> bool:
+    return _active is not None
+
+
+def current() -> Optional[Profile]:
+    """The active profile, or None."""
+    return _active
+
+
+@contextmanager
+def profile() -> Iterator[Profile]:
+    """Record a fresh profile for the enclosed block.
+
+    Whatever was active before (nothing, or an enabled profile) is
+    restored on exit; calls inside the block go only to the new profile.
+    """
+    global _active
+    previous, _active = _active, Profile()
+    try:
+        yield _active
+    finally:
+        _active = previous
+
+
+def _nbytes(obj: Any) -> int:
+    """Bytes held by the arrays of a result (vector, matrix, array or tuple)."""
+    if isinstance(obj, np.ndarray):
+        return obj.nbytes
+    if isinstance(obj, tuple):
+        return sum(_nbytes(item) for item in obj)
+    total = 0
+    for attr in _ARRAY_ATTRS:
+        value = getattr(obj, attr, None)
+        if isinstance(value, np.ndarray):
+            total += value.nbytes
+    return total
+
+
+def _dim(args: tuple) -> Optional[int]:
+    """Dimension of the first of two arguments that has one (or of its first item).
+
+    For methods the first argument is ``self`` (an ItemMemory or encoder
+    knows its dimension).
+    """
+    for arg in args[:2]:
+        dim = getattr(arg, "dim", None)
+        if dim is None and isinstance(arg, (list, tuple)) and arg:
+            dim = getattr(arg[0], "dim", None)
+        if isinstance(dim, (int, np.integer)):
+            return int(dim)
+    return None
+
+
+def instrumented(func: F) -> F:
+    """Record calls of ``func`` in the active profile.
+
+    Plain functions are recorded under their name, methods under
+    ``<type of self>.<name>`` so subclasses are told apart.
+    """
+    is_method = "." in func.__qualname__
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        prof = _active
+        if prof is None:
+            return func(*args, **kwargs)
+        start = time.perf_counter()
+        result = func(*args, **kwargs)
+        elapsed = time.perf_counter() - start
+        name = f"{type(args[0]).__name__}.{func.__name__}" if is_method else func.__name__
+        # a result that is one of the arguments (an ``out=`` buffer, or
+        # ``self`` from a chaining method) allocated nothing
+        reused = any(result is arg for arg in args) or any(result is v for v in kwargs.values())
+        prof.record(name, elapsed, 0 if reused else _nbytes(result), _dim(args))
+        return result
+
+    return wrapper  # type: ignore[return-value]
@@ -0,0 +1,169 @@
+"""Resonator network: factorize a bound vector against several codebooks."""
+
+from typing import NamedTuple, Optional, Sequence, Union
+import numpy as np
+
+from .core import TritVector
+from .matrix import Queries, TritMatrix, as_rows
+from .profiling import instrumented
+
+
+class Factorization(NamedTuple):
+    """Result of ``Resonator.factorize_batch``.
+
+    Attributes:
+        indices: (B, K) codebook row chosen for each factor
+        similarities: (B, K) absolute cosine similarity of each final
+            estimate to its chosen codebook row
+        iterations: (B,) iterations run per query
+        converged: (B,) whether the estimates reached a fixed point
+    """
+    indices: np.ndarray
+    similarities: np.ndarray
+    iterations: np.ndarray
+    converged: np.ndarray
+
+
+class Resonator:
+    """Iterative factorizer for ``s = bind(x_1, ..., x_K)`` with x_k in codebook k.
+
+    Brute force would score all ``M_1 * ... * M_K`` combinations. The
+    resonator instead keeps one estimate per factor and refines them all
+    at once: factor k is unbound from ``s`` with the other estimates and
+    projected back onto codebook k,
+
+        x_k <- sign(X_k^T X_k (s * prod_{j != k} x_j))
+
+    so each iteration costs two (B, dim) x (dim, M_k) matmuls per factor.
+    Estimates start as the superposition of their whole codebook. Queries
+    are processed as a batch; a query stops updating once no estimate
+    changes during a full sweep.
+
+    Ternary codebooks get one extra step first. A bound vector is zero
+    wherever any factor is zero, so the true x_k must be non-zero on the
+    whole support of ``s``. A random ternary row covers only about 2/3
+    of it. Rows covering less than ``min_coverage`` of the support are
+    masked out of the projections (one |s| x |X_k| matmul per codebook).
+    For exact composites this leaves about one candidate per codebook,
+    and the network settles in one or two sweeps even for 3 codebooks
+    of 1000 entries. If no row passes for a query, or the codebooks are
+    dense bipolar, the plain resonator runs. Its capacity is much lower
+    (about 100 entries per codebook for 3 factors at dim=10k).
+
+    Example:
+        >>> colors, shapes, sizes = (TritMatrix.random(1000, 10000, seed=i) for i in range(3))
+        >>> s = bind(bind(colors[4], shapes[17]), sizes[256])
+        >>> Resonator([colors, shapes, sizes]).factorize(s)
+        [4, 17, 256]
+    """
+
+    def __init__(self, codebooks: Sequence[Union[TritMatrix, np.ndarray]],
+                 max_iter: int = 100, min_coverage: Optional[float] = 0.9):
+        """Create a resonator over K codebooks.
+
+        Args:
+            codebooks: K codebooks (TritMatrix or (M_k, dim) arrays)
+            max_iter: Iteration limit per query
+            min_coverage: Fraction of the composite's support a codebook
+                row must be non-zero on to stay a candidate (None
+                disables support pruning)
+        """
+        assert len(codebooks) >= 2, "Need at least two codebooks"
+        books = [as_rows(cb) for cb in codebooks]
+        dim = books[0].shape[1]
+        assert all(b.shape[1] == dim for b in books), "All codebooks must have same dimension"
+        self._dim = dim
+        self._books = [b.astype(np.float32) for b in books]
+        self._norms = [np.sqrt(np.count_nonzero(b, axis=1)).astype(np.float32) for b in books]
+        self.max_iter = max_iter
+        self.min_coverage = min_coverage
+
+    @property
+    def dim(self) -> int:
+        return self._dim
+
+    @property
+    def num_factors(self) -> int:
+        return len(self._books)
+
+    def __repr__(self) -> str:
+        sizes = "x".join(str(len(b)) for b in self._books)
+        return f"Resonator(dim={self._dim}, codebooks={sizes})"
+
+    def _candidate_masks(self, s: np.ndarray) -> list:
+        """Per-codebook (B, M_k) 0/1 masks of rows covering supp(s), or None."""
+        if self.min_coverage is None:
+            return [None] * len(self._books)
+        support = np.abs(s)
+        needed = self.min_coverage * support.sum(axis=1, keepdims=True)
+        masks = []
+        for book in self._books:
+            if np.all(book != 0):
+                masks.append(None)
+                continue
+            mask = (support @ np.abs(book).T >= needed).astype(np.float32)
+            mask[~mask.any(axis=1)] = 1
+            masks.append(mask)
+        return masks
+
+    def factorize(self, composite: TritVector) -> list:
+        """Codebook indices ``[i_1, ..., i_K]`` of one bound vector."""
+        return self.factorize_batch([composite]).indices[0].tolist()
+
+    @instrumented
+    def factorize_batch(self, composites: Queries) -> Factorization:
+        """Factorize B bound vectors at once.
+
+        Args:
+            composites: TritMatrix, (B, dim) array or sequence of TritVector
+
+        Returns:
+            Factorization with per-query indices, similarities,
+            iteration counts and convergence flags
+        """
+        s = as_rows(composites).astype(np.float32)
+        assert s.shape[1] == self._dim, "Vectors must have same dimension"
+        batch = len(s)
+
+        estimates = [np.repeat(np.sign(b.sum(axis=0, keepdims=True)), batch, axis=0)
+                     for b in self._books]
+        active = np.arange(batch)
+        iterations = np.zeros(batch, dtype=np.int64)
+        converged = np.zeros(batch, dtype=bool)
+        context = np.empty_like(s)
+        masks = self._candidate_masks(s)
+
+        for _ in range(self.max_iter):
+            if not len(active):
+                break
+            iterations[active] += 1
+            stable = np.ones(len(active), dtype=bool)
+            for k, book in enumerate(self._books):
+                # unbind every other factor estimate from s
+                np.copyto(context[:len(active)], s[active])
+                ctx = context[:len(active)]
+                for j, est in enumerate(estimates):
+                    if j != k:
+                        ctx *= est[active]
+                coeffs = ctx @ book.T
+                if masks[k] is not None:
+                    coeffs *= masks[k][active]
+                new = np.sign(coeffs @ book)
+                stable &= np.all(new == estimates[k][active], axis=1)
+                estimates[k][active] = new
+            converged[active[stable]] = True
+            active = active[~stable]
+
+        indices = np.empty((batch, self.num_factors), dtype=np.int64)
+        sims = np.empty((batch, self.num_factors), dtype=np.float64)
+        for k, (book, norms) in enumerate(zip(self._books, self._norms)):
+            est = estimates[k]
+            denom = norms[None, :] * np.sqrt(np.count_nonzero(est, axis=1))[:, None]
+            scores = np.zeros((batch, len(book)), dtype=np.float64)
+            np.divide(est @ book.T, denom, out=scores, where=denom != 0)
+            # bind(-a, -b) == bind(a, b): pairs of estimates may settle
+            # sign-flipped, so match on |similarity|
+            np.abs(scores, out=scores)
+            indices[:, k] = np.argmax(scores, axis=1)
+            sims[:, k] = scores[np.arange(batch), indices[:, k]]
+        return Factorization(indices, sims, iterations, converged)
@@ -0,0 +1,63 @@
+"""Sparse-form kernels and automatic dense/sparse format selection."""
+
+from typing import Sequence, Union
+import numpy as np
+
+from .core import TritVector, SparseVec
+
+# Below this density (nnz / dim) sorted-index kernels beat dense numpy
+# passes: a merge costs ~log(nnz) per non-zero versus one pass over dim.
+AUTO_DENSITY = 1 / 16
+
+AnyVector = Union[TritVector, SparseVec]
+
+
+def bundle_sparse(vectors: Sequence[SparseVec]) -> SparseVec:
+    """Majority-bundle sparse vectors without densifying.
+
+    Runs in O(T log T) for T total non-zeros across all inputs.
+
+    Args:
+        vectors: Sparse vectors of the same dimension
+
+    Returns:
+        Bundled sparse vector (same values as ``bundle`` on dense copies)
+    """
+    dim = vectors[0].dim
+    assert all(v.dim == dim for v in vectors), "All vectors must have same dimension"
+    indices = np.concatenate([v.indices for v in vectors])
+    values = np.concatenate([v.values for v in vectors])
+    unique, inverse = np.unique(indices, return_inverse=True)
+    sums = np.bincount(inverse.ravel(), weights=values, minlength=len(unique))
+    keep = sums != 0
+    return SparseVec._trusted(unique[keep], np.sign(sums[keep]).astype(np.int8), dim)
+
+
+def to_sparse(v: AnyVector) -> SparseVec:
+    """Convert to SparseVec (no-op if already sparse)."""
+    return v if isinstance(v, SparseVec) else SparseVec.from_trit_vector(v)
+
+
+def to_dense(v: AnyVector) -> TritVector:
+    """Convert to TritVector (no-op if already dense)."""
+    return v.to_trit_vector() if isinstance(v, SparseVec) else v
+
+
+def auto_format(v: AnyVector, max_density: float = AUTO_DENSITY) -> AnyVector:
+    """Pick the cheaper representation for ``v`` from its nnz.
+
+    Args:
+        v: Dense or sparse vector
+        max_density: Largest nnz / dim kept in sparse form
+
+    Returns:
+        SparseVec if ``v.nnz <= max_density * v.dim``, else TritVector
+
+    Example:
+        >>> v = auto_format(TritVector.random_sparse(100000, sparsity=0.99))
+        >>> type(v).__name__
+        'SparseVec'
+    """
+    if v.nnz <= max_density * v.dim:
+        return to_sparse(v)
+    return to_dense(v)
@@ -0,0 +1,234 @@
+"""Versioned on-disk codebook format with zero-copy memory-mapped access.
+
+File layout (all integers little-endian)::
+
+    offset 0   header (64 bytes)
+                 magic        4s   b"TVSA"
+                 version      u16
+                 codec        u16  payload encoding (0 = packed 2-bit,
+                                   1 = base-243, 5 trits per byte)
+                 dim          u64  trits per vector
+                 count        u64  number of vectors
+                 flags        u64  bit 0: symbol-name table present
+                 payload_off  u64  start of payload (64-byte aligned)
+                 payload_size u64
+                 names_off    u64  start of name table (0 if absent)
+    payload    codec 0: pos planes (count, words) uint64, then neg
+               planes (count, words) uint64
+               codec 1: (count, ceil(dim / 5)) uint8 base-243 bytes
+    names      (count + 1) uint64 offsets, then the UTF-8 name blob
+
+Opening a file maps the payload with ``np.memmap`` so that worker
+processes share one page-cached copy and no vector is regenerated.
+The base-243 codec is 20% smaller on disk but rows are decoded on
+access instead of being exposed as zero-copy packed planes.
+"""
+
+import os
+import struct
+from typing import Dict, List, Optional, Sequence, Union
+import numpy as np
+
+from .codec import decode_base243, encode_base243, encoded_size
+from .core import TritVector, PackedTritVec, num_words, pack_trits, unpack_trits
+from .matrix import Queries, TritMatrix, as_rows
+
+MAGIC = b"TVSA"
+VERSION = 1
+CODEC_PACKED = 0
+CODEC_BASE243 = 1
+_CODECS = {"packed": CODEC_PACKED, "base243": CODEC_BASE243}
+
+_HEADER = struct.Struct("<4sHHQQQQQQ")
+_HEADER_SIZE = 64
+_ALIGN = 64
+_FLAG_NAMES = 1
+# Rows packed per write when saving, bounds temporaries for huge codebooks
+_WRITE_CHUNK = 65536
+
+PathLike = Union[str, os.PathLike]
+
+
+def _align(offset: int) -> int:
+    return (offset + _ALIGN - 1) // _ALIGN * _ALIGN
+
+
+def _payload_shape(codec: int, count: int, dim: int) -> tuple:
+    if codec == CODEC_PACKED:
+        return (2, count, num_words(dim))
+    return (count, encoded_size(dim))
+
+
+def save_codebook(path: PathLike, vectors: Queries,
+                  names: Optional[Sequence[str]] = None, codec: str = "packed"):
+    """Write vectors (and optional symbol names) to a codebook file.
+
+    Args:
+        path: Output file path
+        vectors: TritMatrix, (N, dim) array or sequence of TritVector
+        names: Optional N symbol names
+        codec: "packed" (2 bits/trit, zero-copy on open) or "base243"
+            (1.6 bits/trit, decoded on access)
+
+    Example:
+        >>> save_codebook("symbols.tvsa", TritMatrix.random(1000, 10000),
+        ...               names=[f"sym{i}" for i in range(1000)])
+    """
+    if codec not in _CODECS:
+        raise ValueError(f"Unknown codec {codec!r}, expected one of {sorted(_CODECS)}")
+    rows = as_rows(vectors)
+    count, dim = rows.shape
+    payload_off = _align(_HEADER_SIZE)
+    payload_shape = _payload_shape(_CODECS[codec], count, dim)
+    payload_size = int(np.prod(payload_shape)) * (8 if codec == "packed" else 1)
+
+    flags = 0
+    names_off = 0
+    offsets = blob = None
+    if names is not None:
+        assert len(names) == count, "Need one name per vector"
+        encoded = [str(name).encode("utf-8") for name in names]
+        offsets = np.zeros(count + 1, dtype="<u8")
+        np.cumsum([len(e) for e in encoded], out=offsets[1:])
+        blob = b"".join(encoded)
+        flags |= _FLAG_NAMES
+        names_off = _align(payload_off + payload_size)
+
+    header = _HEADER.pack(MAGIC, VERSION, _CODECS[codec], dim, count, flags,
+                          payload_off, payload_size, names_off)
+    with open(path, "wb") as f:
+        f.write(header.ljust(payload_off, b"\0"))
+        f.truncate(payload_off + payload_size)
+        if names is not None:
+            f.seek(names_off)
+            f.write(offsets.tobytes())
+            f.write(blob)
+
+    if count:
+        dtype = "<u8" if codec == "packed" else np.uint8
+        payload = np.memmap(path, dtype=dtype, mode="r+", offset=payload_off,
+                            shape=payload_shape)
+        for start in range(0, count, _WRITE_CHUNK):
+            chunk = rows[start:start + _WRITE_CHUNK]
+            end = start + len(chunk)
+            if codec == "packed":
+                payload[0, start:end], payload[1, start:end] = pack_trits(chunk)
+            else:
+                payload[start:end] = encode_base243(chunk)
+        payload.flush()
+        del payload
+
+
+def open_codebook(path: PathLike) -> "MappedCodebook":
+    """Open a codebook file written by :func:`save_codebook`."""
+    return MappedCodebook(path)
+
+
+class MappedCodebook:
+    """Read-only, memory-mapped view of a codebook file.
+
+    For packed files ``pos`` and ``neg`` are zero-copy ``np.memmap``
+    arrays of shape (count, words); rows are only paged in when touched.
+    For base-243 files ``pos``/``neg`` are None, ``payload`` maps the
+    encoded bytes and rows are decoded on access.
+
+    Example:
+        >>> book = open_codebook("symbols.tvsa")
+        >>> v = book["sym42"]            # PackedTritVec, no copy
+        >>> m = book.to_matrix(slice(0, 100))
+    """
+
+    def __init__(self, path: PathLike):
+        """Map an existing codebook file."""
+        self.path = os.fspath(path)
+        with open(self.path, "rb") as f:
+            raw = f.read(_HEADER.size)
+        if len(raw) < _HEADER.size:
+            raise ValueError(f"{self.path}: file too short for a codebook header")
+        (magic, version, codec, dim, count, flags,
+         payload_off, payload_size, names_off) = _HEADER.unpack(raw)
+        if magic != MAGIC:
+            raise ValueError(f"{self.path}: not a trinity_vsa codebook (bad magic)")
+        if version > VERSION:
+            raise ValueError(f"{self.path}: unsupported codebook version {version}")
+        if codec not in _CODECS.values():
+            raise ValueError(f"{self.path}: unsupported payload codec {codec}")
+
+        self.version = version
+        self.codec = codec
+        self._dim = dim
+        self._count = count
+        shape = _payload_shape(codec, count, dim)
+        dtype = "<u8" if codec == CODEC_PACKED else np.uint8
+        if count:
+            self.payload = np.memmap(self.path, dtype=dtype, mode="r",
+                                     offset=payload_off, shape=shape)
+        else:
+            self.payload = np.zeros(shape, dtype=dtype)
+        self.pos = self.neg = None
+        if codec == CODEC_PACKED:
+            self.pos, self.neg = self.payload[0], self.payload[1]
+
+        self._name_offsets = self._name_blob = None
+        self._name_index: Optional[Dict[str, int]] = None
+        if flags & _FLAG_NAMES:
+            self._name_offsets = np.memmap(self.path, dtype="<u8", mode="r",
+                                           offset=names_off, shape=(count + 1,))
+            blob_size = int(self._name_offsets[-1])
+            self._name_blob = np.zeros(0, dtype=np.uint8)
+            if blob_size:
+                self._name_blob = np.memmap(self.path, dtype=np.uint8, mode="r",
+                                            offset=names_off + 8 * (count + 1),
+                                            shape=(blob_size,))
+
+    @property
+    def dim(self) -> int:
+        return self._dim
+
+    @property
+    def has_names(self) -> bool:
+        return self._name_offsets is not None
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __repr__(self) -> str:
+        return f"MappedCodebook({self.path!r}, dim={self._dim}, count={self._count})"
+
+    def name(self, i: int) -> str:
+        """Symbol name of row ``i``."""
+        if not self.has_names:
+            raise KeyError("Codebook has no symbol-name table")
+        a, b = int(self._name_offsets[i]), int(self._name_offsets[i + 1])
+        return bytes(self._name_blob[a:b]).decode("utf-8")
+
+    @property
+    def names(self) -> Optional[List[str]]:
+        """All symbol names (decoded on access), or None."""
+        if not self.has_names:
+            return None
+        return [self.name(i) for i in range(self._count)]
+
+    def index(self, name: str) -> int:
+        """Row of the symbol called ``name``."""
+        if self._name_index is None:
+            self._name_index = {n: i for i, n in enumerate(self.names or [])}
+        return self._name_index[name]
+
+    def __getitem__(self, key: Union[int, str]) -> PackedTritVec:
+        """Packed row by position or symbol name (zero-copy for packed files)."""
+        i = self.index(key) if isinstance(key, str) else int(key)
+        if self.pos is None:
+            return PackedTritVec.from_numpy(decode_base243(self.payload[i], self._dim))
+        return PackedTritVec(self.pos[i], self.neg[i], self._dim)
+
+    def vector(self, key: Union[int, str]) -> TritVector:
+        """Unpacked copy of one row."""
+        return self[key].to_trit_vector()
+
+    def to_matrix(self, rows: Union[slice, np.ndarray, None] = None) -> TritMatrix:
+        """Unpack all rows, or a slice/index array of rows, into a TritMatrix."""
+        sel = slice(None) if rows is None else rows
+        if self.pos is None:
+            return TritMatrix(decode_base243(self.payload[sel], self._dim))
+        return TritMatrix(unpack_trits(self.pos[sel], self.neg[sel], self._dim))
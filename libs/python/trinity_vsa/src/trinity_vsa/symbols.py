@@ -0,0 +1,156 @@
+"""Deterministic symbol codebook with hash-seeded, lazily generated vectors."""
+
+from collections import OrderedDict
+import hashlib
+from typing import Hashable, Iterable, NamedTuple, Optional
+import numpy as np
+
+from .core import TritVector
+from .matrix import TritMatrix
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: Optional[int]
+    currsize: int
+
+
+def _name_key(name: Hashable) -> bytes:
+    """Stable byte encoding of a symbol name (``hash()`` is salted per process)."""
+    if isinstance(name, str):
+        return b"s" + name.encode("utf-8")
+    if isinstance(name, bytes):
+        return b"b" + name
+    if isinstance(name, (int, np.integer)):
+        return b"i" + str(int(name)).encode("ascii")
+    return b"r" + repr(name).encode("utf-8")
+
+
+class SymbolTable:
+    """Open-vocabulary codebook: symbol name -> random TritVector.
+
+    Each symbol's vector is drawn from a generator seeded with a hash
+    (BLAKE2b) of its name and the table seed, so it is created on first
+    use, never needs to be stored, and is identical in every process
+    that uses the same ``dim`` and ``seed``. Recently used vectors are
+    kept in an LRU cache of at most ``cache_size`` entries, which bounds
+    memory however many distinct symbols pass through.
+
+    Cached vectors are shared and read-only; copy one (``TritVector(v.data)``)
+    before modifying it in place.
+
+    Example:
+        >>> symbols = SymbolTable(10000, seed=42)
+        >>> cat = symbols["cat"]
+        >>> SymbolTable(10000, seed=42)["cat"] == cat
+        True
+        >>> batch = symbols.materialize(["the", "cat", "sat"])   # TritMatrix
+    """
+
+    def __init__(self, dim: int, seed: int = 0, cache_size: Optional[int] = 4096):
+        """Create a symbol table.
+
+        Args:
+            dim: Vector dimension
+            seed: Table seed; tables with different seeds are independent
+            cache_size: Maximum number of cached vectors (None = unbounded)
+        """
+        assert cache_size is None or cache_size >= 0, "cache_size must be non-negative"
+        self._dim = dim
+        self._seed = seed
+        self._prefix = str(int(seed)).encode("ascii") + b"\0"
+        self._cache_size = cache_size
+        self._cache: "OrderedDict[Hashable, TritVector]" = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def dim(self) -> int:
+        return self._dim
+
+    @property
+    def seed(self) -> int:
+        return self._seed
+
+    def __repr__(self) -> str:
+        return (f"SymbolTable(dim={self._dim}, seed={self._seed}, "
+                f"cached={len(self._cache)}/{self._cache_size})")
+
+    def _generator(self, name: Hashable) -> np.random.Generator:
+        digest = hashlib.blake2b(self._prefix + _name_key(name), digest_size=16,
+                                 person=b"trinity-vsa-sym").digest()
+        return np.random.default_rng(int.from_bytes(digest, "little"))
+
+    def _generate(self, name: Hashable, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Draw the vector for ``name`` (copied into ``out`` if given)."""
+        data = self._generator(name).integers(-1, 2, size=self._dim, dtype=np.int8)
+        if out is None:
+            return data
+        out[...] = data
+        return out
+
+    def vector(self, name: Hashable) -> TritVector:
+        """Vector for ``name``, generated on first use and cached."""
+        cached = self._cache.get(name)
+        if cached is not None:
+            self._cache.move_to_end(name)
+            self._hits += 1
+            return cached
+        self._misses += 1
+        data = self._generate(name)
+        data.flags.writeable = False
+        v = TritVector.from_trusted(data)
+        if self._cache_size != 0:
+            self._cache[name] = v
+            if self._cache_size is not None and len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+        return v
+
+    def __getitem__(self, name: Hashable) -> TritVector:
+        return self.vector(name)
+
+    def __contains__(self, name: Hashable) -> bool:
+        """Every name has a vector; membership means "currently cached"."""
+        return name in self._cache
+
+    def materialize(self, names: Iterable[Hashable]) -> TritMatrix:
+        """Stack the vectors of ``names`` into a TritMatrix.
+
+        Cached symbols are copied from the cache and count as recently
+        used; the others are generated and copied into their rows without
+        being cached, so materializing a large vocabulary does not evict
+        the hot working set. Repeated names are generated once.
+
+        Args:
+            names: Symbol names (order is preserved)
+
+        Returns:
+            TritMatrix with one row per name
+        """
+        names = list(names)
+        rows = np.empty((len(names), self._dim), dtype=np.int8)
+        first = {}
+        for i, name in enumerate(names):
+            if name in first:
+                rows[i] = rows[first[name]]
+                continue
+            first[name] = i
+            cached = self._cache.get(name)
+            if cached is not None:
+                self._cache.move_to_end(name)
+                self._hits += 1
+                rows[i] = cached.data
+            else:
+                self._misses += 1
+                self._generate(name, out=rows[i])
+        return TritMatrix.from_trusted(rows)
+
+    def cache_info(self) -> CacheInfo:
+        """Hit/miss statistics, in the style of ``functools.lru_cache``."""
+        return CacheInfo(self._hits, self._misses, self._cache_size, len(self._cache))
+
+    def cache_clear(self):
+        """Drop all cached vectors and reset the statistics."""
+        self._cache.clear()
+        self._hits = self._misses = 0
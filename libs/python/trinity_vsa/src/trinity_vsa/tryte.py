@@ -0,0 +1,180 @@
+"""Vectorized fixed-width balanced-ternary integers in trit-plane form."""
+
+from typing import Union
+import numpy as np
+
+# Trits per tryte, as in the VM's tryte type (-13..13)
+TRITS_PER_TRYTE = 3
+# Widest array whose values (up to (3**40 - 1) / 2) fit in int64
+MAX_WIDTH = 40
+# Widest array whose products still fit in int64, (3**20 / 2)**2 < 2**63
+_INT64_MUL_WIDTH = 20
+
+_POW3 = 3 ** np.arange(MAX_WIDTH + 1, dtype=object)
+
+
+def max_value(width: int) -> int:
+    """Largest integer representable in ``width`` balanced trits."""
+    return (3 ** width - 1) // 2
+
+
+def _balanced_digit(x: np.ndarray) -> np.ndarray:
+    """Balanced-ternary low digit of ``x``: ((x + 1) mod 3) - 1, in {-1, 0, 1}."""
+    return (np.mod(x + 1, 3) - 1).astype(np.int8)
+
+
+class TryteArray:
+    """N balanced-ternary integers of ``width`` trits, stored plane by plane.
+
+    ``planes[i]`` holds trit i (least significant first) of every number,
+    so each arithmetic step is one numpy pass over N values and carries
+    ripple across the ``width`` planes. Results keep the fixed width and
+    wrap around modulo ``3**width``, like the VM's tryte arithmetic
+    (width 3: -13..13).
+
+    Attributes:
+        planes: int8 array of shape (width, N), values in {-1, 0, 1}
+
+    Example:
+        >>> a = TryteArray.from_ints(np.arange(1_000_000), width=27)
+        >>> b = TryteArray.from_ints(np.full(1_000_000, -5), width=27)
+        >>> (a * b + a).to_ints()[:3]
+        array([ 0, -4, -8])
+    """
+
+    def __init__(self, planes: np.ndarray):
+        """Create from a (width, N) array of trits (values are clipped and copied)."""
+        planes = np.asarray(planes)
+        assert planes.ndim == 2, "Expected a (width, N) array of trits"
+        assert 1 <= len(planes) <= MAX_WIDTH, f"Width must be in 1..{MAX_WIDTH}"
+        self.planes = np.clip(planes, -1, 1).astype(np.int8)
+
+    @classmethod
+    def _trusted(cls, planes: np.ndarray) -> "TryteArray":
+        t = cls.__new__(cls)
+        t.planes = planes
+        return t
+
+    @classmethod
+    def zeros(cls, n: int, width: int = 27) -> "TryteArray":
+        return cls._trusted(np.zeros((width, n), dtype=np.int8))
+
+    @classmethod
+    def from_ints(cls, values: np.ndarray, width: int = 27) -> "TryteArray":
+        """Convert integers to balanced ternary, ``width`` digits each.
+
+        Raises:
+            ValueError: If a value does not fit in ``width`` trits
+        """
+        assert 1 <= width <= MAX_WIDTH, f"Width must be in 1..{MAX_WIDTH}"
+        x = np.array(values, dtype=np.int64).ravel()
+        limit = max_value(width)
+        if len(x) and (x.max() > limit or x.min() < -limit):
+            raise ValueError(f"Values out of range for {width} trits (|x| <= {limit})")
+        return cls._from_wide(x, width)
+
+    def to_ints(self) -> np.ndarray:
+        """Convert back to an int64 array (Horner's rule over the planes)."""
+        acc = np.zeros(len(self), dtype=np.int64)
+        for plane in self.planes[::-1]:
+            acc *= 3
+            acc += plane
+        return acc
+
+    @property
+    def width(self) -> int:
+        return len(self.planes)
+
+    def __len__(self) -> int:
+        return self.planes.shape[1]
+
+    def __getitem__(self, idx: Union[int, slice, np.ndarray]) -> Union[int, "TryteArray"]:
+        if isinstance(idx, (int, np.integer)):
+            return int(np.dot(self.planes[:, idx].astype(object), _POW3[:self.width]))
+        return TryteArray._trusted(self.planes[:, idx])
+
+    def __eq__(self, other: "TryteArray") -> bool:
+        return np.array_equal(self.planes, other.planes)
+
+    def __repr__(self) -> str:
+        return f"TryteArray(n={len(self)}, width={self.width})"
+
+    def to_strings(self) -> list:
+        """Trit strings, most significant first, with 'T' for -1 (e.g. '01T')."""
+        chars = np.array(["T", "0", "1"])[self.planes[::-1] + 1]
+        return ["".join(col) for col in chars.T]
+
+    def _check(self, other: "TryteArray"):
+        assert self.planes.shape == other.planes.shape, "Arrays must have same width and length"
+
+    def __neg__(self) -> "TryteArray":
+        # Balanced ternary negation is digit-wise; no carries
+        return TryteArray._trusted(-self.planes)
+
+    def __add__(self, other: "TryteArray") -> "TryteArray":
+        """Ripple-carry addition, one pass over N per trit position."""
+        self._check(other)
+        out = np.empty_like(self.planes)
+        carry = np.zeros(len(self), dtype=np.int8)
+        s = np.empty(len(self), dtype=np.int8)
+        for i in range(self.width):
+            # s in -3..3; carry_out = floor((s + 1) / 3), digit = s - 3 * carry_out
+            np.add(self.planes[i], other.planes[i], out=s)
+            s += carry
+            np.add(s, 1, out=carry)
+            carry //= 3
+            np.subtract(s, 3 * carry, out=out[i])
+        return TryteArray._trusted(out)
+
+    def __sub__(self, other: "TryteArray") -> "TryteArray":
+        return self + (-other)
+
+    def __mul__(self, other: "TryteArray") -> "TryteArray":
+        """Product modulo ``3**width``.
+
+        Up to 20 trits the product fits in int64 and is computed there.
+        Wider arrays use a carry-free convolution of the trit planes
+        (column sums of digit products), normalized by one carry pass.
+        """
+        self._check(other)
+        if self.width <= _INT64_MUL_WIDTH:
+            product = self.to_ints() * other.to_ints()
+            return TryteArray._from_wide(product, self.width)
+
+        width = self.width
+        columns = np.zeros((width, len(self)), dtype=np.int16)
+        for j in range(width):
+            # digit j of ``other`` times ``self``, shifted up j places
+            columns[j:] += self.planes[:width - j] * other.planes[j]
+        return TryteArray._normalize(columns)
+
+    @classmethod
+    def _from_wide(cls, x: np.ndarray, width: int) -> "TryteArray":
+        """Low ``width`` balanced digits of int64 ``x`` (i.e. wrap modulo 3**width).
+
+        ``x`` is consumed (overwritten) by the conversion.
+        """
+        planes = np.empty((width, len(x)), dtype=np.int8)
+        for i in range(width):
+            planes[i] = _balanced_digit(x)
+            x -= planes[i]
+            x //= 3
+        return cls._trusted(planes)
+
+    @classmethod
+    def _normalize(cls, columns: np.ndarray) -> "TryteArray":
+        """Turn per-position digit sums into balanced digits, dropping the top carry."""
+        planes = np.empty(columns.shape, dtype=np.int8)
+        carry = np.zeros(columns.shape[1], dtype=np.int16)
+        for i in range(len(columns)):
+            v = columns[i] + carry
+            planes[i] = _balanced_digit(v)
+            carry = (v - planes[i]) // 3
+        return cls._trusted(planes)
+
+    def sign(self) -> np.ndarray:
+        """Sign of each number: its most significant non-zero trit."""
+        result = np.zeros(len(self), dtype=np.int8)
+        for plane in self.planes:
+            np.copyto(result, plane, where=plane != 0)
+        return result
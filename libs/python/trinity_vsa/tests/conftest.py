@@ -0,0 +1,22 @@
+"""Reference helpers shared by the test modules."""
+
+import numpy as np
+
+
+def naive_cosine(a, b):
+    """Float64 cosine between the rows of ``a`` and ``b``; zero vectors score 0.
+
+    1-D arguments are single vectors: two vectors give a float, a matrix
+    and a vector give one score per row, two matrices give the full
+    (len(a), len(b)) matrix.
+    """
+    a, b = np.asarray(a, dtype=np.float64), np.asarray(b, dtype=np.float64)
+    rows_a, rows_b = np.atleast_2d(a), np.atleast_2d(b)
+    denom = np.outer(np.linalg.norm(rows_a, axis=1), np.linalg.norm(rows_b, axis=1))
+    result = np.zeros(denom.shape, dtype=np.float64)
+    np.divide(rows_a @ rows_b.T, denom, out=result, where=denom != 0)
+    if b.ndim == 1:
+        result = result[:, 0]
+    if a.ndim == 1:
+        result = result[0]
+    return float(result) if result.ndim == 0 else result
@@ -0,0 +1,80 @@
+"""BundleAccumulator against a plain int64 running sum."""
+
+import numpy as np
+import pytest
+
+from trinity_vsa import BundleAccumulator, TritMatrix, TritVector, bundle
+from trinity_vsa.accumulator import _ADD_CHUNK
+
+
+def majority(sums):
+    return np.sign(sums).astype(np.int8)
+
+
+def test_matches_bundle_for_every_input_form():
+    m = TritMatrix.random(31, 500, seed=0)
+    expected = majority(m.data.astype(np.int64).sum(axis=0))
+    assert bundle(list(m)).data.tolist() == expected.tolist()
+    for vectors in (m, m.data, list(m), iter(m)):
+        acc = BundleAccumulator(500).add_many(vectors)
+        assert acc.count == 31
+        np.testing.assert_array_equal(acc.finalize().data, expected)
+
+
+def test_add_many_spans_chunks():
+    rows = np.random.default_rng(1).integers(-1, 2, size=(_ADD_CHUNK + 5, 16), dtype=np.int8)
+    acc = BundleAccumulator(16).add_many(rows)
+    np.testing.assert_array_equal(acc.sums, rows.astype(np.int64).sum(axis=0))
+
+
+def test_weights_subtract_and_merge():
+    vs = list(TritMatrix.random(6, 200, seed=2))
+    weights = [1, 3, -2, 5, 1, 2]
+    expected = sum(w * v.data.astype(np.int64) for w, v in zip(weights, vs))
+    left, right = BundleAccumulator(200), BundleAccumulator(200)
+    for i, (w, v) in enumerate(zip(weights, vs)):
+        (left if i % 2 else right).add(v, weight=w)
+    left.merge(right).add(vs[0]).subtract(vs[0])
+    np.testing.assert_array_equal(left.sums, expected)
+    assert left.count == sum(weights)
+    np.testing.assert_array_equal(left.to_count_vector().data, expected)
+
+
+def test_widens_instead_of_overflowing():
+    v = TritVector(np.ones(4, dtype=np.int8))
+    acc = BundleAccumulator(4, dtype=np.int16)
+    for _ in range(3):
+        acc.add(v, weight=20000)
+    assert acc.sums.tolist() == [60000] * 4
+    assert acc.sums.dtype == np.int32
+
+
+def test_overflow_past_int64_raises():
+    v = TritVector(np.ones(4, dtype=np.int8))
+    acc = BundleAccumulator(4).add(v, weight=2 ** 62)
+    with pytest.raises(OverflowError):
+        acc.add(v, weight=2 ** 62)
+    assert acc.sums.tolist() == [2 ** 62] * 4 and acc.count == 2 ** 62
+
+
+def test_finalize_threshold_and_tie_break():
+    acc = BundleAccumulator(6)
+    acc.add(TritVector([1, 1, -1, 0, 1, -1]), weight=2)
+    acc.add(TritVector([1, 0, 1, 0, -1, -1]))
+    # sums: 3, 2, -1, 0, 1, -3
+    assert acc.finalize().data.tolist() == [1, 1, -1, 0, 1, -1]
+    assert acc.finalize(threshold=1).data.tolist() == [1, 1, 0, 0, 0, -1]
+    fill = TritVector([-1] * 6)
+    assert acc.finalize(threshold=1, tie_break=fill).data.tolist() == [1, 1, -1, -1, -1, -1]
+    rand = acc.finalize(tie_break="random", seed=0).data
+    assert rand[3] != 0 and rand[[0, 1, 2, 4, 5]].tolist() == [1, 1, -1, 1, -1]
+    with pytest.raises(ValueError):
+        acc.finalize(tie_break="coin")
+
+
+def test_sums_view_is_read_only_and_reset():
+    acc = BundleAccumulator(8).add(TritVector.random(8, seed=3))
+    with pytest.raises(ValueError):
+        acc.sums[0] = 5
+    acc.reset()
+    assert acc.count == 0 and not acc.sums.any()
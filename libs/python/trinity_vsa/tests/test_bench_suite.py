@@ -0,0 +1,45 @@
+"""Smoke test: every bench_suite case runs once at a tiny size."""
+
+import argparse
+import importlib
+import json
+import os
+import sys
+
+import pytest
+
+BENCHMARKS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "benchmarks")
+TINY = ["--dims", "64", "--densities", "0.5", "--batches", "2",
+        "--min-time", "0", "--repeat", "1"]
+
+
+@pytest.fixture
+def suite(monkeypatch):
+    monkeypatch.syspath_prepend(BENCHMARKS)
+    return importlib.import_module("bench_suite")
+
+
+def test_every_case_runs(suite):
+    args = argparse.Namespace(dims=[64], densities=[0.5], batches=[2], filter=None,
+                              min_time=0.0, repeat=1)
+    results = dict(suite.run(args))
+    expected = {(op, kind) for op, (kinds, _, _) in suite.CASES.items() for kind in kinds}
+    assert {(r["op"], r["type"]) for r in results.values()} == expected
+    for result in results.values():
+        assert result["ops_per_sec"] > 0
+        assert result["bytes_per_op"] >= 0
+
+
+def test_json_and_baseline_roundtrip(suite, monkeypatch, tmp_path, capsys):
+    path = str(tmp_path / "base.json")
+    monkeypatch.setattr(sys, "argv", ["bench_suite.py", *TINY, "--filter", "^bind/", "--json", path])
+    suite.main()
+    with open(path) as f:
+        report = json.load(f)
+    assert report["schema"] == suite.SCHEMA
+    assert report["results"] and all(k.startswith("bind/") for k in report["results"])
+
+    monkeypatch.setattr(sys, "argv", ["bench_suite.py", *TINY, "--filter", "^bind/",
+                                      "--baseline", path])
+    suite.main()
+    assert "regression(s) beyond" in capsys.readouterr().out
@@ -0,0 +1,88 @@
+"""HDClassifier against a naive cosine-to-class-sum baseline."""
+
+import numpy as np
+import pytest
+
+from trinity_vsa import HDClassifier
+
+
+def noisy(protos, labels, noise, rng):
+    x = protos[labels].copy()
+    mask = rng.random(x.shape) < noise
+    x[mask] = rng.integers(-1, 2, size=int(mask.sum()), dtype=np.int8)
+    return x
+
+
+def naive_scores(counts, x):
+    """Cosine of each sample against each raw class sum, in float64."""
+    c = counts.astype(np.float64)
+    x = x.astype(np.float64)
+    return (x @ c.T) / np.linalg.norm(x, axis=1)[:, None] / np.linalg.norm(c, axis=1)[None, :]
+
+
+@pytest.fixture
+def imbalanced():
+    rng = np.random.default_rng(0)
+    dim = 2000
+    protos = rng.integers(-1, 2, size=(2, dim), dtype=np.int8)
+    protos[1, :dim // 2] = protos[0, :dim // 2]
+    y = np.array([0] * 2000 + [1] * 20)
+    X = noisy(protos, y, 0.8, rng)
+    y_test = np.array([0, 1] * 200)
+    X_test = noisy(protos, y_test, 0.8, rng)
+    return X, y, X_test, y_test
+
+
+def test_decision_function_is_cosine(imbalanced):
+    X, y, X_test, _ = imbalanced
+    clf = HDClassifier(X.shape[1]).fit(X, y)
+    scores = clf.decision_function(X_test)
+    np.testing.assert_allclose(scores, naive_scores(clf.counts, X_test), atol=1e-5)
+    assert np.abs(scores).max() <= 1.0 + 1e-6
+
+
+def test_imbalanced_classes_do_not_win_by_magnitude(imbalanced):
+    X, y, X_test, y_test = imbalanced
+    clf = HDClassifier(X.shape[1]).fit(X, y)
+    expected = np.argmax(naive_scores(clf.counts, X_test), axis=1)
+    np.testing.assert_array_equal(clf.predict(X_test), expected)
+    assert clf.score(X_test, y_test) > 0.95
+
+
+def test_predict_proba_rows_sum_to_one(imbalanced):
+    X, y, X_test, _ = imbalanced
+    proba = HDClassifier(X.shape[1]).fit(X, y).predict_proba(X_test)
+    np.testing.assert_allclose(proba.sum(axis=1), 1.0, rtol=1e-5)
+
+
+def test_partial_fit_matches_group_sums():
+    rng = np.random.default_rng(1)
+    X = rng.integers(-1, 2, size=(300, 64), dtype=np.int8)
+    y = rng.choice(["a", "b", "c"], size=300)
+    clf = HDClassifier(64)
+    clf.partial_fit(X[:100], y[:100]).partial_fit(X[100:], y[100:])
+    for label, row in zip(clf.classes_, clf.counts):
+        np.testing.assert_array_equal(row, X[y == label].sum(axis=0))
+
+
+def test_retrain_matches_naive_perceptron():
+    rng = np.random.default_rng(2)
+    X = rng.integers(-1, 2, size=(50, 32), dtype=np.int8)
+    y = rng.integers(0, 3, size=50)
+    clf = HDClassifier(32).fit(X, y)
+    sums = clf.counts.astype(np.int64).copy()
+    # one chunk: all samples scored against the pre-update sums
+    pred = np.argmax(naive_scores(sums, X), axis=1)
+    for xi, t, p in zip(X, y, pred):
+        if t != p:
+            sums[t] += xi
+            sums[p] -= xi
+    errors = clf.retrain(X, y)
+    assert errors == int(np.sum(pred != y))
+    np.testing.assert_array_equal(clf.counts, sums)
+
+
+def test_unknown_class_in_retrain_raises():
+    clf = HDClassifier(8).fit(np.ones((2, 8), dtype=np.int8), [0, 1])
+    with pytest.raises(KeyError):
+        clf.retrain(np.ones((1, 8), dtype=np.int8), [5])
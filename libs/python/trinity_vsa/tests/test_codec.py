@@ -0,0 +1,36 @@
+"""Base-243 codec against the byte formula."""
+
+import numpy as np
+import pytest
+
+from trinity_vsa import decode_base243, encode_base243
+from trinity_vsa.codec import encoded_size
+
+
+def trits(shape, seed):
+    return np.random.default_rng(seed).integers(-1, 2, size=shape, dtype=np.int8)
+
+
+def naive_encode(data):
+    padded = np.zeros(encoded_size(len(data)) * 5, dtype=np.int64)
+    padded[:len(data)] = data
+    groups = padded.reshape(-1, 5) + 1
+    return (groups * 3 ** np.arange(5)).sum(axis=1)
+
+
+@pytest.mark.parametrize("dim", [1, 5, 6, 1001])
+def test_base243_matches_formula_and_roundtrips(dim):
+    data = trits((2, dim), dim)
+    encoded = encode_base243(data)
+    assert encoded.dtype == np.uint8 and encoded.shape == (2, encoded_size(dim))
+    for row, enc in zip(data, encoded):
+        assert enc.tolist() == naive_encode(row).tolist()
+    np.testing.assert_array_equal(decode_base243(encoded, dim), data)
+    np.testing.assert_array_equal(decode_base243(encoded[0], dim), data[0])
+
+
+def test_base243_all_bytes():
+    digits = (np.arange(243)[:, None] // 3 ** np.arange(5)) % 3 - 1
+    decoded = decode_base243(np.arange(243, dtype=np.uint8)[:, None], 5)
+    np.testing.assert_array_equal(decoded, digits)
+    np.testing.assert_array_equal(encode_base243(decoded.astype(np.int8))[:, 0], np.arange(243))
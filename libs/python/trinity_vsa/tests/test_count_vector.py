@@ -0,0 +1,78 @@
+"""CountVector against plain int64 sums of the superposed vectors."""
+
+import numpy as np
+import pytest
+
+from trinity_vsa import (BundleAccumulator, CountVector, TritVector, bind, bundle, permute,
+                         similarity)
+from trinity_vsa.ops import dot_product
+from trinity_vsa.sparse import to_sparse
+
+
+@pytest.fixture
+def items():
+    return [TritVector.random(256, seed=s) for s in range(9)]
+
+
+def test_add_remove_match_sums(items):
+    c = CountVector.from_vectors(items)
+    expected = np.sum([v.data for v in items], axis=0, dtype=np.int64)
+    np.testing.assert_array_equal(c.data, expected)
+    c.remove(items[0]).add(to_sparse(items[1]), weight=2)
+    expected += -items[0].data + 2 * items[1].data.astype(np.int64)
+    np.testing.assert_array_equal(c.data, expected)
+    assert c.count == len(items) - 1 + 2
+
+
+def test_widens_before_overflow():
+    v = TritVector.from_trusted(np.ones(4, dtype=np.int8))
+    c = CountVector.zeros(4).add(v, weight=40000)
+    assert c.data.dtype == np.int32
+    np.testing.assert_array_equal(c.data, np.full(4, 40000))
+
+
+def test_overflow_past_int64_raises():
+    v = TritVector(np.ones(4, dtype=np.int8))
+    c = CountVector.zeros(4).add(v, weight=2 ** 62)
+    with pytest.raises(OverflowError):
+        c.add(v, weight=2 ** 62)
+    assert c.data.tolist() == [2 ** 62] * 4 and c.count == 2 ** 62
+
+
+def test_threshold_matches_bundle(items):
+    c = CountVector.from_vectors(items)
+    np.testing.assert_array_equal(c.threshold().data, bundle(items).data)
+
+
+def test_bind_permute_dot_similarity(items):
+    c = CountVector.from_vectors(items)
+    counts = c.data.astype(np.int64)
+    key = items[0]
+    np.testing.assert_array_equal(bind(c, key).data, counts * key.data)
+    np.testing.assert_array_equal(permute(c, 5).data, np.roll(counts, 5))
+    assert dot_product(c, key) == int(counts @ key.data)
+    expected = counts @ key.data / np.linalg.norm(counts) / np.sqrt(key.nnz)
+    assert similarity(c, key) == pytest.approx(expected)
+
+
+def test_bind_with_sparse(items):
+    c = CountVector.from_vectors(items)
+    data = np.zeros(256, dtype=np.int8)
+    data[[3, 50, 200]] = [1, -1, 1]
+    key = TritVector.from_trusted(data)
+    expected = c.data.astype(np.int64) * data
+    np.testing.assert_array_equal(bind(c, to_sparse(key)).data, expected)
+    np.testing.assert_array_equal(bind(to_sparse(key), c).data, expected)
+
+
+def test_bind_rejects_other_types(items):
+    c = CountVector.from_vectors(items)
+    with pytest.raises(TypeError):
+        c.bind(c)
+
+
+def test_count_from_array_and_accumulator(items):
+    assert CountVector(np.array([2, -1, 0])).count == 0
+    assert CountVector(np.array([2, -1, 0]), count=3).count == 3
+    acc = BundleAccumulator(256).add_many(items)
+    assert acc.to_count_vector().count == len(items)
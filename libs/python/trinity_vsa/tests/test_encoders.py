@@ -0,0 +1,128 @@
+"""Streaming and column encoders against direct per-item recomputation."""
+
+import numpy as np
+import pytest
+
+from trinity_vsa import (FractionalPowerEncoder, LevelEncoder, NGramEncoder, RecordEncoder,
+                         SymbolTable, ThermometerEncoder, TritVector, bind, bundle)
+from trinity_vsa.ops import encode_sequence
+
+
+@pytest.fixture
+def letters():
+    rng = np.random.default_rng(0)
+    table = {c: TritVector.from_trusted(rng.integers(-1, 2, size=301, dtype=np.int8))
+             for c in "abcdefgh"}
+    # zeros everywhere except one dimension: exercises the zero counts
+    table["z"] = TritVector.from_trusted(np.eye(1, 301, 7, dtype=np.int8)[0])
+    return table
+
+
+@pytest.mark.parametrize("n", [1, 2, 3, 5])
+def test_ngrams_match_encode_sequence(letters, n):
+    text = "abcazbhgfeedcbzza"
+    expected = [encode_sequence([letters[c] for c in text[i:i + n]])
+                for i in range(len(text) - n + 1)]
+    enc = NGramEncoder(letters, n=n)
+    got = list(enc.ngrams(iter(text)))
+    assert len(got) == len(expected)
+    for g, e in zip(got, expected):
+        np.testing.assert_array_equal(g.data, e.data)
+    np.testing.assert_array_equal(enc.encode(text).data, bundle(expected).data)
+
+
+def test_ngram_documents_and_short_input(letters):
+    enc = NGramEncoder(letters, n=3)
+    docs = ["abcde", "hgf", "ab"]
+    out = list(enc.encode_documents(docs))
+    np.testing.assert_array_equal(out[0].data, enc.encode("abcde").data)
+    np.testing.assert_array_equal(out[1].data, encode_sequence(
+        [letters[c] for c in "hgf"]).data)
+    assert not out[2].data.any()
+
+
+def test_ngram_empty_document(letters):
+    with pytest.raises(ValueError):
+        NGramEncoder(letters, n=3).encode("")
+    assert NGramEncoder(letters, n=3, dim=301).encode("").data.tolist() == [0] * 301
+    enc = NGramEncoder(letters, n=3)
+    enc.encode("abc")
+    assert enc.encode("").dim == 301
+
+
+def test_ngram_accumulate_shards(letters):
+    enc = NGramEncoder(letters, n=2)
+    acc = enc.accumulate("abcd")
+    enc.accumulate("efgh", acc)
+    grams = [encode_sequence([letters[a], letters[b]])
+             for text in ("abcd", "efgh") for a, b in zip(text, text[1:])]
+    np.testing.assert_array_equal(acc.finalize().data, bundle(grams).data)
+
+
+def test_level_encoder():
+    enc = LevelEncoder(2000, levels=11, low=-1, high=1, seed=1)
+    table = enc.table.data
+    changed = (table[1:] != table[:1]).sum(axis=1)
+    assert np.all(np.diff(changed) >= 0)
+    sims = enc.table.similarity(enc.table[0])
+    assert sims[0] == pytest.approx(1.0)
+    assert np.all(np.diff(sims) < 0.05)
+    values = np.array([-5.0, -1.0, 0.0, 0.09, 0.11, 1.0, 7.0])
+    idx = np.clip(np.rint((values + 1) * 5), 0, 10).astype(int)
+    np.testing.assert_array_equal(enc.quantize(values), idx)
+    np.testing.assert_array_equal(enc.encode(values).data, table[idx])
+    np.testing.assert_array_equal(enc.encode_one(0.11).data, table[idx[4]])
+
+
+def test_thermometer_encoder():
+    enc = ThermometerEncoder(100, levels=5)
+    for i, row in enumerate(enc.table.data):
+        k = round(i * 100 / 4)
+        assert row.tolist() == [1] * k + [-1] * (100 - k)
+    assert np.array_equal(enc.table.data[0], -enc.table.data[-1])
+    dots = enc.table.dot(enc.table[0])
+    np.testing.assert_array_equal(dots, [100, 50, 0, -50, -100])
+
+
+@pytest.mark.parametrize("kernel", ["gaussian", "sinc"])
+def test_fractional_power_encoder(kernel):
+    enc = FractionalPowerEncoder(4000, levels=101, bandwidth=0.1, kernel=kernel, seed=2)
+    table = enc.table.data
+    assert set(np.unique(table)) <= {-1, 0, 1}
+    assert abs(np.mean(table == 0) - 1 / 3) < 0.05
+    sims = enc.table.similarity(enc.table[50])
+    assert sims[50] == pytest.approx(1.0)
+    # similarity falls off with distance and is near chance far away
+    assert sims[48] > sims[45] > sims[40]
+    assert abs(sims[0]) < 0.1
+    with pytest.raises(ValueError):
+        FractionalPowerEncoder(10, kernel="box")
+
+
+def test_record_encoder_matches_bundle_of_bindings():
+    dim = 500
+    fields = {"age": LevelEncoder(dim, levels=10, high=100, seed=3),
+              "temp": ThermometerEncoder(dim, levels=8, low=-10, high=40),
+              "city": SymbolTable(dim, seed=4)}
+    enc = RecordEncoder(fields, dim=dim, seed=5)
+    rows = {"age": [3, 50, 99, 42], "temp": [-10, 0, 12.5, 40],
+            "city": ["oslo", "lima", "oslo", "pune"], "ignored": [0, 0, 0, 0]}
+    out = enc.encode(rows)
+    for i in range(4):
+        parts = [bind(enc.roles[name], fields[name][rows[name][i]]
+                      if isinstance(fields[name], SymbolTable)
+                      else fields[name].encode_one(rows[name][i]))
+                 for name in fields]
+        expected = np.sign(sum(p.data.astype(np.int64) for p in parts))
+        np.testing.assert_array_equal(out.data[i], expected)
+        record = {name: rows[name][i] for name in fields}
+        np.testing.assert_array_equal(enc.encode_one(record).data, expected)
+
+
+def test_record_encoder_spans_chunks(monkeypatch):
+    monkeypatch.setattr(RecordEncoder, "_CHUNK", 3)
+    enc = RecordEncoder({"x": ThermometerEncoder(64, levels=4)}, dim=64)
+    values = np.linspace(0, 1, 8)
+    role = enc.roles["x"].data
+    expected = enc.fields["x"].encode(values).data * role
+    np.testing.assert_array_equal(enc.encode({"x": values}).data, expected)
@@ -0,0 +1,99 @@
+"""LSHIndex against exhaustive cosine search."""
+
+import numpy as np
+import pytest
+
+from trinity_vsa import LSHIndex, TritMatrix, TritVector
+
+
+def exact_top_k(codebook, query, k):
+    sims = codebook.similarity(query)
+    order = np.argsort(-sims, kind="stable")[:k]
+    return order, sims[order]
+
+
+def noisy(v, flips, seed):
+    data = v.data.copy()
+    idx = np.random.default_rng(seed).choice(v.dim, size=flips, replace=False)
+    data[idx] = -data[idx]
+    return TritVector(data)
+
+
+@pytest.fixture(scope="module")
+def setup():
+    codebook = TritMatrix.random(500, 1024, seed=0)
+    return codebook, LSHIndex.build(codebook, n_tables=16, n_bits=8, seed=1)
+
+
+def test_similarities_are_exact(setup):
+    codebook, index = setup
+    query = noisy(codebook[7], 200, 2)
+    exact = codebook.similarity(query)
+    for label, sim in index.query(query, k=5):
+        assert sim == pytest.approx(exact[label])
+
+
+def test_recall_on_noisy_copies(setup):
+    codebook, index = setup
+    hits = 0
+    for i in range(0, 500, 10):
+        query = noisy(codebook[i], 150, i)
+        expected, _ = exact_top_k(codebook, query, 1)
+        hits += index.query(query, k=1)[0][0] == expected[0]
+    assert hits >= 48
+
+
+def test_candidates_include_exact_duplicates(setup):
+    codebook, index = setup
+    for i in (0, 123, 499):
+        assert i in index.candidates(codebook[i], n_probes=0)
+        assert index.query(codebook[i], k=1)[0] == (i, pytest.approx(1.0))
+
+
+def test_full_probe_matches_exhaustive():
+    codebook = TritMatrix.random(60, 256, seed=3)
+    # one bit per table and one probe: every row is a candidate
+    index = LSHIndex.build(codebook, n_tables=1, n_bits=1, n_probes=1, seed=4)
+    query = TritVector.random(256, seed=5)
+    labels, sims = index.batch_query(TritMatrix.from_vectors([query]), k=10)
+    _, expected = exact_top_k(codebook, query, 10)
+    np.testing.assert_allclose(sims[0], expected)
+    np.testing.assert_allclose(codebook.similarity(query)[labels[0]], expected)
+
+
+def test_incremental_insert_and_labels():
+    codebook = TritMatrix.random(40, 256, seed=6)
+    index = LSHIndex(256, n_tables=8, n_bits=4, seed=7)
+    index.insert(codebook[:20], labels=[f"a{i}" for i in range(20)])
+    assert index.query(codebook[3], k=1)[0][0] == "a3"
+    # default labels count up from 0 independently of string labels
+    assert index.insert(codebook[20:]) == list(range(20))
+    assert len(index) == 40
+    assert index.query(codebook[35], k=1)[0] == (15, pytest.approx(1.0))
+
+
+def test_default_labels_skip_explicit_ints():
+    codebook = TritMatrix.random(6, 128, seed=8)
+    index = LSHIndex(128, n_tables=4, n_bits=4, seed=9)
+    index.insert(codebook[:2], labels=[0, 1])
+    index.insert(codebook[2:3], labels=[5])
+    assert index.insert(codebook[3:5]) == [6, 7]
+    with pytest.raises(KeyError):
+        index.insert(codebook[5:], labels=[5])
+    with pytest.raises(KeyError):
+        index.insert(codebook[4:], labels=["x", "x"])
+    assert len(index) == 5
+
+
+def test_batch_query_matches_single_queries(setup):
+    codebook, index = setup
+    queries = [noisy(codebook[i], 300, i) for i in range(0, 500, 25)]
+    queries.append(TritVector(np.zeros(1024, dtype=np.int8)))
+    labels, sims = index.batch_query(TritMatrix.from_vectors(queries), k=3, n_probes=2)
+    assert len(labels) == len(queries)
+    for query, row_labels, row_sims in zip(queries, labels, sims):
+        single = index.query(query, k=3, n_probes=2)
+        assert row_labels == [label for label, _ in single]
+        np.testing.assert_allclose(row_sims, [sim for _, sim in single])
+        exact = codebook.similarity(query)
+        np.testing.assert_allclose(row_sims, exact[row_labels])
@@ -0,0 +1,47 @@
+"""out= buffers and in-place ops against freshly allocated results."""
+
+import numpy as np
+import pytest
+
+from trinity_vsa import TritMatrix, TritVector, bind, bundle, permute, similarity, unbind
+
+
+def naive_majority(rows):
+    return np.sign(rows.astype(np.int64).sum(axis=0)).astype(np.int8)
+
+
+def test_matrix_in_place_matches_out_of_place():
+    a, b = TritMatrix.random(40, 257, seed=0), TritMatrix.random(40, 257, seed=1)
+    expected = np.roll(-(a.data * b.data), -3, axis=1)
+    c = TritMatrix(a.data)
+    assert c.bind_(b).neg_().permute_(-3) is c
+    np.testing.assert_array_equal(c.data, expected)
+
+
+def test_vector_ops_with_out():
+    a, b = TritVector.random(300, seed=6), TritVector.random(300, seed=7)
+    out = TritVector.zeros(300)
+    assert bind(a, b, out=out) is out
+    np.testing.assert_array_equal(out.data, a.data * b.data)
+    assert unbind(out, b, out=out) is out
+    np.testing.assert_array_equal(out.data, a.data * b.data * b.data)
+    assert permute(a, 11, out=out) is out
+    np.testing.assert_array_equal(out.data, np.roll(a.data, 11))
+    assert bundle([a, b, out], out=out) is out
+    np.testing.assert_array_equal(out.data, naive_majority(np.stack([a.data, b.data,
+                                                                     np.roll(a.data, 11)])))
+
+
+def test_permute_out_aliases_input():
+    a = TritVector.random(100, seed=8)
+    expected = np.roll(a.data, -250)
+    assert permute(a, -250, out=a) is a
+    np.testing.assert_array_equal(a.data, expected)
+
+
+def test_vector_in_place_ops():
+    a, b = TritVector.random(200, seed=9), TritVector.random(200, seed=10)
+    expected = np.roll(-(a.data * b.data), 4)
+    assert a.bind_(b).neg_().permute_(4) is a
+    np.testing.assert_array_equal(a.data, expected)
+    assert similarity(a, TritVector.from_trusted(expected)) == pytest.approx(1.0)
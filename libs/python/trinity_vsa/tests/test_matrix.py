@@ -0,0 +1,73 @@
+"""TritMatrix batch ops against per-row numpy."""
+
+import numpy as np
+import pytest
+
+from trinity_vsa import TritMatrix, TritVector
+from trinity_vsa.matrix import _MATMUL_CHUNK
+
+from conftest import naive_cosine
+
+
+def naive_majority(rows):
+    return np.sign(rows.astype(np.int64).sum(axis=0)).astype(np.int8)
+
+
+@pytest.fixture
+def mats():
+    return TritMatrix.random(40, 257, seed=0), TritMatrix.random(40, 257, seed=1)
+
+
+def test_bind_and_permute(mats):
+    a, b = mats
+    v = b[0]
+    np.testing.assert_array_equal(a.bind(b).data, a.data * b.data)
+    np.testing.assert_array_equal(a.bind(v).data, a.data * v.data)
+    np.testing.assert_array_equal(a.unbind(v).data, a.data * v.data)
+    np.testing.assert_array_equal(a.permute(5).data, np.roll(a.data, 5, axis=1))
+    shifts = np.arange(len(a)) * 7 - 100
+    expected = np.stack([np.roll(row, s) for row, s in zip(a.data, shifts)])
+    np.testing.assert_array_equal(a.permute(shifts).data, expected)
+
+
+def test_dot_and_similarity(mats):
+    a, b = mats
+    v = b[3]
+    ref = a.data.astype(np.int64) @ b.data.T
+    np.testing.assert_array_equal(a.dot(b), ref)
+    np.testing.assert_array_equal(a.dot(v), ref[:, 3])
+    expected = [[naive_cosine(x, y) for y in b.data] for x in a.data]
+    np.testing.assert_allclose(a.similarity(b), expected)
+    np.testing.assert_allclose(a.similarity(v), [naive_cosine(x, v.data) for x in a.data])
+    np.testing.assert_allclose(np.diag(a.similarity()), 1.0)
+
+
+def test_dot_spans_matmul_chunks():
+    m = TritMatrix.random(_MATMUL_CHUNK + 3, 64, seed=2)
+    v = TritVector.random(64, seed=3)
+    np.testing.assert_array_equal(m.dot(v), m.data.astype(np.int64) @ v.data)
+
+
+def test_similarity_with_zero_rows():
+    m = TritMatrix.zeros(3, 50)
+    assert not m.similarity(TritVector.random(50, seed=4)).any()
+
+
+def test_bundle_and_grouped_bundle(mats):
+    a, _ = mats
+    np.testing.assert_array_equal(a.bundle().data, naive_majority(a.data))
+    groups = np.random.default_rng(5).integers(0, 4, size=len(a))
+    groups[groups == 2] = 1  # leave group 2 empty
+    out = a.bundle(groups, num_groups=5)
+    assert out.shape == (5, a.dim)
+    for g in range(5):
+        rows = a.data[groups == g]
+        expected = naive_majority(rows) if len(rows) else np.zeros(a.dim, dtype=np.int8)
+        np.testing.assert_array_equal(out.data[g], expected)
+
+
+def test_packed_roundtrip(mats):
+    a, _ = mats
+    assert TritMatrix.from_packed(*a.to_packed(), a.dim) == a
+    for row, packed in zip(a, a.to_packed_vectors()):
+        assert packed.to_trit_vector() == row
@@ -0,0 +1,63 @@
+"""ItemMemory lookups against brute-force cosine scoring."""
+
+import numpy as np
+import pytest
+
+from trinity_vsa import ItemMemory, TritMatrix, TritVector
+
+from conftest import naive_cosine
+
+
+def noisy(v, noise, seed):
+    rng = np.random.default_rng(seed)
+    data = v.data.copy()
+    mask = rng.random(len(data)) < noise
+    data[mask] = rng.integers(-1, 2, size=int(mask.sum()), dtype=np.int8)
+    return TritVector.from_trusted(data)
+
+
+@pytest.fixture(scope="module")
+def codebook():
+    return TritMatrix.random(300, 2048, seed=0)
+
+
+def test_top_k_matches_brute_force(codebook):
+    memory = ItemMemory.from_vectors(codebook)
+    query = noisy(codebook[17], 0.5, 1)
+    expected = np.argsort(-naive_cosine(codebook.data, query.data), kind="stable")[:5]
+    found = memory.top_k(query, k=5)
+    assert [label for label, _ in found] == expected.tolist()
+    np.testing.assert_allclose([s for _, s in found],
+                               naive_cosine(codebook.data, query.data)[expected], atol=1e-5)
+
+
+@pytest.mark.parametrize("z", [None, 5.0])
+def test_progressive_top_k_matches_top_k(codebook, z):
+    memory = ItemMemory.from_vectors(codebook)
+    for seed in range(5):
+        query = noisy(codebook[seed * 11], 0.6, seed)
+        result = memory.progressive_top_k(query, k=1, block=256, z=z)
+        assert result.labels == [label for label, _ in memory.top_k(query, k=1)]
+        assert 0.0 <= result.skipped < 1.0
+    # the exact bound keeps the full top-k, not just the winner
+    exact = memory.progressive_top_k(query, k=4, block=256)
+    assert exact.labels == [label for label, _ in memory.top_k(query, k=4)]
+
+
+def test_remove_keeps_lookups_consistent(codebook):
+    memory = ItemMemory.from_vectors(codebook[:10], labels=list("abcdefghij"))
+    memory.remove("c")
+    assert "c" not in memory and len(memory) == 9
+    np.testing.assert_array_equal(memory["j"].data, codebook[9].data)
+    assert memory.top_k(codebook[9], k=1)[0][0] == "j"
+
+
+def test_duplicate_labels_in_batch_are_rejected_atomically(codebook):
+    memory = ItemMemory(codebook.dim)
+    memory.add(codebook[0], "a")
+    with pytest.raises(KeyError):
+        memory.add_many(codebook[1:3], ["x", "x"])
+    with pytest.raises(KeyError):
+        memory.add_many(codebook[1:3], [7, "a"])
+    assert memory.labels == ["a"] and len(memory) == 1
+    assert memory.add(codebook[1]) == 0   # _next_id untouched by the failed batches
@@ -0,0 +1,66 @@
+"""Bit-plane packing and popcount kernels against plain int8 math."""
+
+import numpy as np
+import pytest
+
+from trinity_vsa import PackedTritVec, dot_many, pack_trits, similarity_many, unpack_trits
+from trinity_vsa.core import popcount
+
+from conftest import naive_cosine
+
+
+def trits(shape, seed):
+    return np.random.default_rng(seed).integers(-1, 2, size=shape, dtype=np.int8)
+
+
+@pytest.mark.parametrize("dim", [1, 63, 64, 65, 1000])
+def test_pack_roundtrip(dim):
+    data = trits((3, dim), dim)
+    pos, neg = pack_trits(data)
+    assert pos.shape == neg.shape == (3, -(-dim // 64))
+    np.testing.assert_array_equal(unpack_trits(pos, neg, dim), data)
+    for row, packed in zip(data, PackedTritVec.from_batch(data)):
+        np.testing.assert_array_equal(packed.to_numpy(), row)
+        np.testing.assert_array_equal(PackedTritVec.from_numpy(row).pos, packed.pos)
+
+
+def test_pack_bit_layout():
+    # trit i lives in bit i % 64 of word i // 64
+    data = np.zeros(130, dtype=np.int8)
+    data[[0, 65, 129]] = [1, -1, 1]
+    pos, neg = pack_trits(data)
+    assert pos.tolist() == [1, 0, 2]
+    assert neg.tolist() == [0, 2, 0]
+
+
+def test_popcount_matches_bin():
+    words = np.random.default_rng(0).integers(0, 2**63, size=(4, 7), dtype=np.uint64) * 2 + 1
+    expected = [sum(bin(int(w)).count("1") for w in row) for row in words]
+    assert popcount(words).tolist() == expected
+
+
+@pytest.mark.parametrize("dim", [7, 64, 1000])
+def test_packed_ops_match_int8(dim):
+    a, b = trits(dim, 1), trits(dim, 2)
+    pa, pb = PackedTritVec.from_numpy(a), PackedTritVec.from_numpy(b)
+    np.testing.assert_array_equal(pa.bind(pb).to_numpy(), a * b)
+    assert pa.dot(pb) == int(a.astype(np.int64) @ b)
+    assert pa.nnz == np.count_nonzero(a)
+    assert pa.similarity(pb) == pytest.approx(naive_cosine(a, b))
+
+
+def test_dot_many_and_similarity_many():
+    rows = trits((50, 300), 3)
+    query = trits(300, 4)
+    packed = PackedTritVec.from_batch(rows)
+    pq = PackedTritVec.from_numpy(query)
+    expected = rows.astype(np.int64) @ query
+    np.testing.assert_array_equal(dot_many(pq, packed), expected)
+    np.testing.assert_array_equal(dot_many(pq, pack_trits(rows)), expected)
+    np.testing.assert_allclose(similarity_many(pq, packed),
+                               [naive_cosine(r, query) for r in rows])
+
+
+def test_zero_vector_similarity():
+    zero = PackedTritVec.from_numpy(np.zeros(100, dtype=np.int8))
+    assert zero.similarity(PackedTritVec.from_numpy(trits(100, 5))) == 0.0
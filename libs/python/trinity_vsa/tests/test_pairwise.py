@@ -0,0 +1,105 @@
+"""Blocked pairwise hamming/similarity and top-k against full numpy matrices."""
+
+import numpy as np
+import pytest
+
+from trinity_vsa import (PackedTritVec, TritMatrix, TritVector, hamming_distance, pack_trits,
+                         pairwise_hamming, pairwise_similarity, top_k_hamming)
+from trinity_vsa.pairwise import hamming_many
+
+from conftest import naive_cosine
+
+
+def naive_hamming(a, b):
+    return (a[:, None, :] != b[None, :, :]).sum(axis=2)
+
+
+@pytest.fixture
+def data():
+    rng = np.random.default_rng(0)
+    a = rng.integers(-1, 2, size=(37, 130), dtype=np.int8)
+    b = rng.integers(-1, 2, size=(23, 130), dtype=np.int8)
+    a[5] = 0
+    return a, b
+
+
+@pytest.mark.parametrize("budget", [1, 4096, 64 << 20])
+def test_pairwise_hamming(data, budget):
+    a, b = data
+    expected = naive_hamming(a, b)
+    for arg in (a, TritMatrix(a), pack_trits(a), PackedTritVec.from_batch(a)):
+        np.testing.assert_array_equal(pairwise_hamming(arg, b, memory_budget=budget), expected)
+    np.testing.assert_array_equal(pairwise_hamming(a, memory_budget=budget), naive_hamming(a, a))
+
+
+def test_pairwise_hamming_into_memmap(data, tmp_path):
+    a, b = data
+    out = np.lib.format.open_memmap(tmp_path / "d.npy", "w+", np.int32, (len(a), len(b)))
+    assert pairwise_hamming(a, b, memory_budget=2048, out=out) is out
+    out.flush()
+    np.testing.assert_array_equal(np.load(tmp_path / "d.npy"), naive_hamming(a, b))
+
+
+def test_hamming_distance_matches_count(data):
+    a, b = data
+    pa, pb = PackedTritVec.from_numpy(a[0]), PackedTritVec.from_numpy(b[0])
+    expected = np.count_nonzero(a[0] != b[0])
+    assert pa.hamming(pb) == hamming_distance(pa, pb) == expected
+    assert hamming_distance(TritVector(a[0]), TritVector(b[0])) == expected
+
+
+def test_hamming_many(data):
+    a, b = data
+    q = PackedTritVec.from_numpy(b[0])
+    np.testing.assert_array_equal(hamming_many(q, a), naive_hamming(b[:1], a)[0])
+
+
+@pytest.mark.parametrize("k", [1, 5, 100])
+def test_top_k_hamming(data, k):
+    a, b = data
+    a = np.concatenate([a, a[:4]])  # exact ties resolve to the lower index
+    idx, dist = top_k_hamming(b, a, k=k, memory_budget=4096)
+    full = naive_hamming(b, a)
+    order = np.lexsort((np.broadcast_to(np.arange(len(a)), full.shape), full), axis=1)
+    k = min(k, len(a))
+    np.testing.assert_array_equal(idx, order[:, :k])
+    np.testing.assert_array_equal(dist, np.take_along_axis(full, order[:, :k], axis=1))
+
+
+@pytest.mark.parametrize("block", [4, 16, 2048])
+def test_pairwise_similarity_dense(data, block):
+    a, b = data
+    np.testing.assert_allclose(pairwise_similarity(a, b, block=block), naive_cosine(a, b),
+                               atol=1e-6)
+    np.testing.assert_allclose(pairwise_similarity(a, block=block), naive_cosine(a, a),
+                               atol=1e-6)
+    dots = pairwise_similarity(a, b, block=block, normalize=False)
+    assert dots.dtype == np.int32
+    np.testing.assert_array_equal(dots, a.astype(np.int64) @ b.T)
+
+
+def test_pairwise_similarity_threshold(data):
+    a, _ = data
+    a = np.concatenate([a, -a[:3], a[:3]])
+    i, j, v = pairwise_similarity(a, block=8, threshold=0.2)
+    full = naive_cosine(a, a)
+    ei, ej = np.nonzero(np.triu(full >= 0.2, k=1))
+    assert sorted(zip(i.tolist(), j.tolist())) == sorted(zip(ei.tolist(), ej.tolist()))
+    np.testing.assert_allclose(v, full[i, j], atol=1e-6)
+    i, j, _ = pairwise_similarity(a, a[:7], block=8, threshold=0.99)
+    assert sorted(zip(i.tolist(), j.tolist())) == sorted(
+        zip(*[x.tolist() for x in np.nonzero(full[:, :7] >= 0.99)]))
+
+
+def test_pairwise_similarity_callback_and_memmap(data, tmp_path):
+    a, b = data
+    seen = np.zeros((len(a), len(b)), dtype=np.float32)
+
+    def collect(rows, cols, tile):
+        seen[rows, cols] = tile
+
+    assert pairwise_similarity(a, b, block=10, callback=collect) is None
+    np.testing.assert_allclose(seen, naive_cosine(a, b), atol=1e-6)
+    out = np.lib.format.open_memmap(tmp_path / "s.npy", "w+", np.float32, (len(a), len(a)))
+    pairwise_similarity(a, block=10, out=out)
+    np.testing.assert_allclose(out, naive_cosine(a, a), atol=1e-6)
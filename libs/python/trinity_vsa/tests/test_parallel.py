@@ -0,0 +1,38 @@
+"""ParallelExecutor results against the serial TritMatrix operations."""
+
+import numpy as np
+import pytest
+
+from trinity_vsa import ParallelExecutor, TritMatrix, TritVector, encode_sequences
+from trinity_vsa.permutation import Permutation
+
+
+@pytest.fixture(scope="module")
+def data():
+    m = TritMatrix.random(1000, 128, seed=0)
+    queries = TritMatrix.random(7, 128, seed=1)
+    role = TritVector.random(128, seed=2)
+    return m, queries, role
+
+
+@pytest.mark.parametrize("backend", ["thread", "process"])
+def test_matches_serial(data, backend):
+    m, queries, role = data
+    with ParallelExecutor(workers=3, backend=backend, chunk_rows=97) as ex:
+        np.testing.assert_array_equal(ex.bind(m, role).data, m.data * role.data)
+        np.testing.assert_array_equal(ex.dot(m, queries), m.dot(queries))
+        np.testing.assert_allclose(ex.similarity(m, queries), m.similarity(queries))
+        np.testing.assert_array_equal(ex.bundle(m).data, m.bundle().data)
+
+
+def test_threaded_encode_sequences_with_shared_random_permutation():
+    rng = np.random.default_rng(3)
+    codebook = TritMatrix.random(50, 256, seed=4)
+    ids = rng.integers(0, 50, size=(600, 12))
+    for trial in range(10):
+        # a fresh permutation each time: its power cache starts empty
+        p = Permutation.random(256, seed=trial)
+        expected = encode_sequences(ids, permutation=Permutation(p.table), codebook=codebook)
+        with ParallelExecutor(workers=4, chunk_rows=16) as ex:
+            got = ex.encode_sequences(ids, codebook, permutation=p)
+        np.testing.assert_array_equal(got.data, expected.data)
@@ -0,0 +1,82 @@
+"""Permutation powers and batched sequence encoding against naive loops."""
+
+import sys
+import threading
+
+import numpy as np
+
+from trinity_vsa import TritMatrix, TritVector, bind, encode_sequences, permute
+from trinity_vsa.ops import encode_sequence
+from trinity_vsa.permutation import Permutation
+
+
+def naive_power(table, k):
+    result = np.arange(len(table))
+    for _ in range(k):
+        result = result[table]
+    return result
+
+
+def test_random_powers_match_repeated_gather():
+    p = Permutation.random(257, seed=3)
+    for k in [0, 1, 2, 5, 9, 3]:
+        np.testing.assert_array_equal(p.power(k).table, naive_power(p.table, k))
+    v = TritVector.random(257, seed=4)
+    np.testing.assert_array_equal(p.power(-4).apply(p.power(4).apply(v)).data, v.data)
+
+
+def test_cyclic_power_matches_permute():
+    p = Permutation.cyclic(100, 3)
+    v = TritVector.random(100, seed=0)
+    np.testing.assert_array_equal(p.power(5).apply(v).data, permute(v, 15).data)
+
+
+def test_power_is_thread_safe():
+    errors = []
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)  # switch threads often to expose races
+    try:
+        for trial in range(100):
+            p = Permutation.random(64, seed=trial)
+            barrier = threading.Barrier(4)
+
+            def worker(offset):
+                try:
+                    barrier.wait()
+                    for k in range(2 + offset, 200, 4):
+                        assert np.array_equal(p.power(k).table, naive_power(p.table, k))
+                except Exception as exc:  # noqa: BLE001 - collected for the main thread
+                    errors.append(exc)
+
+            threads = [threading.Thread(target=worker, args=(i,)) for i in range(4)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+    finally:
+        sys.setswitchinterval(interval)
+    assert not errors, errors[0]
+
+
+def test_encode_sequences_matches_encode_sequence():
+    rng = np.random.default_rng(1)
+    codebook = TritMatrix.random(20, 64, seed=2)
+    ids = rng.integers(0, 20, size=(8, 5))
+    batch = encode_sequences(ids, codebook=codebook)
+    for row, seq in zip(batch.data, ids):
+        expected = encode_sequence([codebook[int(i)] for i in seq])
+        np.testing.assert_array_equal(row, expected.data)
+
+
+def test_encode_sequences_with_random_permutation():
+    rng = np.random.default_rng(5)
+    p = Permutation.random(64, seed=6)
+    codebook = TritMatrix.random(10, 64, seed=7)
+    ids = rng.integers(0, 10, size=(4, 6))
+    batch = encode_sequences(ids, permutation=p, codebook=codebook)
+    for row, seq in zip(batch.data, ids):
+        acc = codebook[int(seq[0])]
+        for i, tok in enumerate(seq[1:], 1):
+            word = codebook.data[int(tok)][naive_power(p.table, i)]
+            acc = bind(acc, TritVector.from_trusted(word))
+        np.testing.assert_array_equal(row, acc.data)
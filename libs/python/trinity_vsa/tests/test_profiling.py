@@ -0,0 +1,68 @@
+"""Profiling hooks: counts, result bytes, dims and export formats."""
+
+import pytest
+
+from trinity_vsa import TritVector, bind, profiling, unbind
+
+
+@pytest.fixture
+def vectors():
+    return TritVector.random(1000, seed=0), TritVector.random(1000, seed=1)
+
+
+def test_off_by_default_and_records_nothing(vectors):
+    a, b = vectors
+    assert not profiling.is_enabled()
+    bind(a, b)
+    assert profiling.current() is None
+
+
+def test_profile_counts_calls_bytes_and_dims(vectors):
+    a, b = vectors
+    with profiling.profile() as prof:
+        for _ in range(3):
+            bind(a, b)
+        unbind(a, b)
+    stats = prof.to_dict()
+    assert stats["bind"]["calls"] == 4          # inclusive: unbind calls bind
+    assert stats["unbind"]["calls"] == 1
+    assert stats["bind"]["result_bytes"] == 4 * a.data.nbytes
+    assert stats["bind"]["dims"] == {1000: 4}
+    assert not profiling.is_enabled()
+
+
+def test_out_buffers_count_zero_bytes(vectors):
+    a, b = vectors
+    buf = TritVector.zeros(1000)
+    with profiling.profile() as prof:
+        bind(a, b, out=buf)
+        bind(a, b, buf)
+    assert prof.to_dict()["bind"]["result_bytes"] == 0
+
+
+def test_nested_profile_restores_enabled_profile(vectors):
+    a, b = vectors
+    outer = profiling.enable()
+    try:
+        with profiling.profile() as inner:
+            bind(a, b)
+        bind(a, b)
+        assert inner.to_dict()["bind"]["calls"] == 1
+        assert outer.to_dict()["bind"]["calls"] == 1
+    finally:
+        profiling.disable()
+
+
+def test_prometheus_histogram_is_cumulative(vectors):
+    a, b = vectors
+    small = TritVector.random(100, seed=2)
+    with profiling.profile() as prof:
+        bind(a, b)
+        bind(small, small)
+    text = prof.to_prometheus()
+    assert 'trinity_vsa_op_calls_total{op="bind"} 2' in text
+    assert 'trinity_vsa_op_dim_bucket{op="bind",le="256"} 1' in text
+    assert 'trinity_vsa_op_dim_bucket{op="bind",le="1024"} 2' in text
+    assert 'trinity_vsa_op_dim_bucket{op="bind",le="+Inf"} 2' in text
+    assert 'trinity_vsa_op_dim_sum{op="bind"} 1100' in text
+    assert "# TYPE trinity_vsa_op_result_bytes_total counter" in text
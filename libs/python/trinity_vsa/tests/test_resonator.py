@@ -0,0 +1,65 @@
+"""Resonator factorization against brute-force search over all combinations."""
+
+import itertools
+
+import numpy as np
+import pytest
+
+from trinity_vsa import Resonator, TritMatrix
+
+
+def brute_force(books, s):
+    best, best_sim = None, -np.inf
+    for combo in itertools.product(*(range(len(b)) for b in books)):
+        v = np.prod([b.data[i].astype(np.int64) for b, i in zip(books, combo)], axis=0)
+        denom = np.linalg.norm(v) * np.linalg.norm(s)
+        sim = 0.0 if denom == 0 else abs(v @ s) / denom
+        if sim > best_sim:
+            best, best_sim = list(combo), sim
+    return best
+
+
+def compose(books, idx):
+    return np.prod([b.data[i] for b, i in zip(books, idx)], axis=0).astype(np.int8)
+
+
+@pytest.fixture(scope="module")
+def books():
+    return [TritMatrix.random(12, 2000, seed=i) for i in range(3)]
+
+
+def test_matches_brute_force(books):
+    rng = np.random.default_rng(0)
+    targets = [rng.integers(0, 12, size=3).tolist() for _ in range(4)]
+    composites = np.stack([compose(books, t) for t in targets])
+    result = Resonator(books).factorize_batch(composites)
+    for t, s, got in zip(targets, composites, result.indices.tolist()):
+        assert got == t == brute_force(books, s)
+    assert result.converged.all()
+    np.testing.assert_allclose(result.similarities, 1.0)
+
+
+@pytest.mark.parametrize("min_coverage", [0.9, None])
+def test_single_and_batch_agree(books, min_coverage):
+    res = Resonator(books, min_coverage=min_coverage)
+    s = compose(books, [3, 7, 11])
+    assert res.factorize(TritMatrix(s[None])[0]) == [3, 7, 11]
+    batch = res.factorize_batch(np.stack([s, compose(books, [0, 0, 0])]))
+    assert batch.indices.tolist() == [[3, 7, 11], [0, 0, 0]]
+
+
+def test_large_ternary_codebooks():
+    books = [TritMatrix.random(500, 4000, seed=10 + i) for i in range(3)]
+    targets = np.random.default_rng(1).integers(0, 500, size=(8, 3))
+    composites = np.stack([compose(books, t) for t in targets])
+    result = Resonator(books).factorize_batch(composites)
+    np.testing.assert_array_equal(result.indices, targets)
+    assert result.iterations.max() <= 3
+
+
+def test_bipolar_codebooks_sign_ambiguity():
+    rng = np.random.default_rng(2)
+    books = [TritMatrix(rng.choice([-1, 1], size=(10, 3000))) for _ in range(2)]
+    s = compose(books, [4, 6])
+    assert Resonator(books).factorize(TritMatrix(s[None])[0]) == [4, 6]
+    assert brute_force(books, s) == [4, 6]
@@ -0,0 +1,88 @@
+"""Wire format and pickling: every round trip must reproduce the trits."""
+
+import pickle
+
+import numpy as np
+import pytest
+
+from trinity_vsa import PackedTritVec, SparseVec, TritMatrix, TritVector
+from trinity_vsa.serialize import (dump_into, dumps, dumps_batch, loads, loads_batch,
+                                   serialized_size)
+
+
+def dense_trits(obj):
+    if isinstance(obj, PackedTritVec):
+        return obj.to_numpy()
+    if isinstance(obj, SparseVec):
+        return obj.to_trit_vector().data
+    return obj.data
+
+
+@pytest.fixture(params=[1, 63, 64, 65, 1000])
+def objects(request):
+    dim = request.param
+    v = TritVector.random(dim, seed=dim)
+    return [v, PackedTritVec.from_trit_vector(v), SparseVec.from_trit_vector(v),
+            TritMatrix.random(5, dim, seed=1)]
+
+
+def test_dumps_loads_round_trip(objects):
+    for obj in objects:
+        frame = dumps(obj)
+        assert len(frame) == serialized_size(obj)
+        back = loads(frame)
+        assert type(back) is type(obj)
+        np.testing.assert_array_equal(dense_trits(back), dense_trits(obj))
+
+
+def test_dump_into_offset(objects):
+    buf = bytearray(16 + sum(serialized_size(o) for o in objects))
+    offset = 16
+    for obj in objects:
+        offset += dump_into(obj, buf, offset)
+    offset = 16
+    for obj in objects:
+        np.testing.assert_array_equal(dense_trits(loads(buf, offset)), dense_trits(obj))
+        offset += serialized_size(obj)
+
+
+@pytest.mark.parametrize("protocol", [2, 4, 5])
+def test_pickle_round_trip(objects, protocol):
+    for obj in objects:
+        back = pickle.loads(pickle.dumps(obj, protocol=protocol))
+        np.testing.assert_array_equal(dense_trits(back), dense_trits(obj))
+
+
+def test_pickle5_out_of_band(objects):
+    for obj in objects[:2] + objects[3:]:
+        buffers = []
+        data = pickle.dumps(obj, protocol=5, buffer_callback=buffers.append)
+        assert buffers
+        back = pickle.loads(data, buffers=buffers)
+        np.testing.assert_array_equal(dense_trits(back), dense_trits(obj))
+
+
+def test_batch_round_trip():
+    vectors = [TritVector.random(130, seed=s) for s in range(6)]
+    frame = dumps_batch(vectors)
+    np.testing.assert_array_equal(loads_batch(frame).data, np.stack([v.data for v in vectors]))
+    packed = loads_batch(frame, packed=True)
+    np.testing.assert_array_equal(np.stack([p.to_numpy() for p in packed]),
+                                  np.stack([v.data for v in vectors]))
+
+
+def test_sparse_explicit_zeros_are_dropped():
+    v = SparseVec(np.array([2, 5, 9]), np.array([0, 1, -1]), 10)
+    frame = dumps(v)
+    assert len(frame) == serialized_size(v)
+    back = loads(frame)
+    np.testing.assert_array_equal(dense_trits(back), dense_trits(v))
+    assert back.nnz == 2
+    np.testing.assert_array_equal(dense_trits(pickle.loads(pickle.dumps(v))), dense_trits(v))
+
+
+def test_bad_magic_and_kind_mismatch():
+    with pytest.raises(ValueError):
+        loads(b"XXXX" + bytes(20))
+    with pytest.raises(TypeError):
+        TritVector.from_bytes(dumps(TritMatrix.random(2, 8, seed=0)))
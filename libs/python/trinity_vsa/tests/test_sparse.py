@@ -0,0 +1,67 @@
+"""Sparse kernels and mixed dense/sparse dispatch against dense numpy."""
+
+import numpy as np
+import pytest
+
+from trinity_vsa import (BundleAccumulator, SparseVec, TritVector, auto_format, bind, bundle,
+                         permute, similarity, to_dense, to_sparse)
+from trinity_vsa.ops import dot_product
+
+from conftest import naive_cosine
+
+
+def sparse_random(dim, density, seed):
+    rng = np.random.default_rng(seed)
+    data = np.zeros(dim, dtype=np.int8)
+    idx = rng.choice(dim, size=int(dim * density), replace=False)
+    data[idx] = rng.choice(np.array([-1, 1], dtype=np.int8), size=len(idx))
+    return TritVector.from_trusted(data)
+
+
+@pytest.fixture
+def pair():
+    return sparse_random(1000, 0.05, 0), sparse_random(1000, 0.05, 1)
+
+
+def test_sparse_kernels_match_dense(pair):
+    a, b = pair
+    sa, sb = to_sparse(a), to_sparse(b)
+    np.testing.assert_array_equal(to_dense(bind(sa, sb)).data, a.data * b.data)
+    np.testing.assert_array_equal(to_dense(bind(sa, b)).data, a.data * b.data)
+    np.testing.assert_array_equal(to_dense(permute(sa, 13)).data, np.roll(a.data, 13))
+    assert dot_product(sa, sb) == int(a.data.astype(np.int64) @ b.data)
+    assert dot_product(sa, b) == int(a.data.astype(np.int64) @ b.data)
+    assert similarity(sa, sb) == pytest.approx(naive_cosine(a.data, b.data))
+
+
+def test_sparse_bundle_matches_dense():
+    vectors = [sparse_random(500, 0.1, seed) for seed in range(7)]
+    expected = np.sign(np.sum([v.data for v in vectors], axis=0, dtype=np.int32))
+    result = bundle([to_sparse(v) for v in vectors])
+    assert isinstance(result, SparseVec)
+    np.testing.assert_array_equal(to_dense(result).data, expected)
+
+
+def test_mixed_dense_sparse_bundle():
+    vectors = [sparse_random(500, 0.3, seed) for seed in range(5)]
+    mixed = [v if i % 2 == 0 else to_sparse(v) for i, v in enumerate(vectors)]
+    expected = np.sign(np.sum([v.data for v in vectors], axis=0, dtype=np.int32))
+    result = bundle(mixed)
+    assert isinstance(result, TritVector)
+    np.testing.assert_array_equal(result.data, expected)
+
+
+def test_accumulator_sparse_add_and_subtract():
+    a, b = sparse_random(300, 0.2, 3), sparse_random(300, 0.2, 4)
+    acc = BundleAccumulator(300).add(a).add(to_sparse(b), weight=3)
+    np.testing.assert_array_equal(acc.sums, a.data + 3 * b.data.astype(np.int32))
+    acc.subtract(to_sparse(a))
+    np.testing.assert_array_equal(acc.sums, 3 * b.data.astype(np.int32))
+
+
+def test_auto_format_round_trips():
+    dense = TritVector.random(400, seed=9)
+    sparse = sparse_random(400, 0.01, 10)
+    assert isinstance(auto_format(dense), TritVector)
+    assert isinstance(auto_format(sparse), SparseVec)
+    np.testing.assert_array_equal(to_dense(auto_format(sparse)).data, sparse.data)
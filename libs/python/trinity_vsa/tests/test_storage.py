@@ -0,0 +1,68 @@
+"""Codebook files against the in-memory vectors they were written from."""
+
+import numpy as np
+import pytest
+
+from trinity_vsa import MappedCodebook, TritMatrix, open_codebook, save_codebook
+from trinity_vsa.codec import encoded_size
+from trinity_vsa.storage import _HEADER
+
+
+@pytest.mark.parametrize("codec", ["packed", "base243"])
+@pytest.mark.parametrize("dim", [5, 64, 1001])
+def test_roundtrip(tmp_path, codec, dim):
+    m = TritMatrix.random(17, dim, seed=dim)
+    names = [f"sym{i}" for i in range(16)] + ["ünï"]
+    path = tmp_path / "book.tvsa"
+    save_codebook(path, m, names=names, codec=codec)
+    book = open_codebook(path)
+    assert (len(book), book.dim, book.names) == (17, dim, names)
+    assert book.to_matrix() == m
+    assert book.to_matrix(slice(3, 9)) == m[3:9]
+    assert book.to_matrix(np.array([16, 0])) == m[np.array([16, 0])]
+    for i in (0, 16):
+        assert book.vector(i) == m[i]
+        assert book[names[i]].to_trit_vector() == m[i]
+        assert book.index(names[i]) == i
+
+
+def test_packed_rows_are_zero_copy_memmaps(tmp_path):
+    m = TritMatrix.random(4, 200, seed=0)
+    save_codebook(tmp_path / "b.tvsa", m)
+    book = open_codebook(tmp_path / "b.tvsa")
+    assert isinstance(book.pos, np.memmap) and not book.pos.flags.writeable
+    assert np.shares_memory(book[2].pos, book.pos)
+    assert not book.has_names and book.names is None
+    with pytest.raises(KeyError):
+        book.name(0)
+
+
+def test_base243_is_smaller(tmp_path):
+    m = TritMatrix.random(100, 1000, seed=1)
+    save_codebook(tmp_path / "p.tvsa", m)
+    save_codebook(tmp_path / "b.tvsa", m, codec="base243")
+    packed = (tmp_path / "p.tvsa").stat().st_size
+    base = (tmp_path / "b.tvsa").stat().st_size
+    assert base < packed
+    assert open_codebook(tmp_path / "b.tvsa").payload.shape == (100, encoded_size(1000))
+
+
+def test_empty_codebook(tmp_path):
+    save_codebook(tmp_path / "e.tvsa", np.zeros((0, 32), dtype=np.int8))
+    book = open_codebook(tmp_path / "e.tvsa")
+    assert len(book) == 0 and book.to_matrix().shape == (0, 32)
+
+
+def test_rejects_bad_files(tmp_path):
+    path = tmp_path / "x.tvsa"
+    with pytest.raises(ValueError):
+        save_codebook(path, TritMatrix.random(2, 8), codec="zip")
+    path.write_bytes(b"TVSA")
+    with pytest.raises(ValueError, match="too short"):
+        MappedCodebook(path)
+    path.write_bytes(_HEADER.pack(b"NOPE", 1, 0, 8, 0, 0, 64, 0, 0).ljust(64, b"\0"))
+    with pytest.raises(ValueError, match="magic"):
+        open_codebook(path)
+    path.write_bytes(_HEADER.pack(b"TVSA", 99, 0, 8, 0, 0, 64, 0, 0).ljust(64, b"\0"))
+    with pytest.raises(ValueError, match="version"):
+        open_codebook(path)
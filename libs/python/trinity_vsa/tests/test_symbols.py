@@ -0,0 +1,93 @@
+"""SymbolTable determinism, LRU behaviour and materialize against per-name lookups."""
+
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+from trinity_vsa import SymbolTable
+
+
+def test_deterministic_and_independent():
+    a, b = SymbolTable(512, seed=7), SymbolTable(512, seed=7)
+    assert a["cat"] == b["cat"]
+    assert not np.array_equal(a["cat"].data, a["dog"].data)
+    assert not np.array_equal(a["cat"].data, SymbolTable(512, seed=8)["cat"].data)
+    # type-tagged keys: 1, "1" and b"1" are different symbols
+    assert len({a[1].data.tobytes(), a["1"].data.tobytes(), a[b"1"].data.tobytes()}) == 3
+    assert a[np.int64(1)] == a[1]
+
+
+def test_large_seeds_are_not_truncated():
+    big = 2 ** 200
+    assert not np.array_equal(SymbolTable(256, seed=big)["x"].data,
+                              SymbolTable(256, seed=big + 1)["x"].data)
+
+
+def test_same_vectors_in_another_process():
+    code = ("import sys; from trinity_vsa import SymbolTable; "
+            "sys.stdout.write(SymbolTable(64, seed=3)[('k', 2)].data.tobytes().hex())")
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True,
+                         check=True, env={"PYTHONHASHSEED": "123",
+                                          "PYTHONPATH": ":".join(sys.path)})
+    assert out.stdout == SymbolTable(64, seed=3)[("k", 2)].data.tobytes().hex()
+
+
+def test_values_are_uniform_trits():
+    data = SymbolTable(30000, seed=0)["x"].data
+    assert data.dtype == np.int8
+    counts = np.bincount(data + 1, minlength=3) / len(data)
+    np.testing.assert_allclose(counts, 1 / 3, atol=0.02)
+
+
+def test_lru_eviction_and_cache_info():
+    table = SymbolTable(32, cache_size=2)
+    first = table["a"]
+    table["b"]
+    assert table["a"] is first          # hit, moves "a" to the front
+    table["c"]                          # evicts "b"
+    assert "a" in table and "c" in table and "b" not in table
+    assert table.cache_info() == (1, 3, 2, 2)
+    table.cache_clear()
+    assert table.cache_info() == (0, 0, 2, 0)
+    assert table["a"] == first and table["a"] is not first
+
+
+def test_uncached_and_unbounded():
+    off = SymbolTable(32, cache_size=0)
+    assert off["a"] is not off["a"] and "a" not in off
+    unbounded = SymbolTable(32, cache_size=None)
+    for i in range(5000):
+        unbounded[i]
+    assert unbounded.cache_info().currsize == 5000
+
+
+def test_cached_vectors_are_read_only():
+    v = SymbolTable(32)["a"]
+    with pytest.raises(ValueError):
+        v.data[0] = 1
+    with pytest.raises(ValueError):
+        v.bind_(v)
+
+
+def test_materialize_matches_lookups():
+    table = SymbolTable(128, seed=1, cache_size=4)
+    table["b"]
+    names = ["a", "b", "c", "a", 5, "b"]
+    m = table.materialize(names)
+    for row, name in zip(m.data, names):
+        np.testing.assert_array_equal(row, SymbolTable(128, seed=1)[name].data)
+    # misses are not cached and repeated names are generated once
+    assert "a" not in table and 5 not in table
+    assert table.cache_info()[:2] == (1, 4)
+    assert table.materialize([]).shape == (0, 128)
+
+
+def test_materialize_hits_refresh_lru_order():
+    table = SymbolTable(32, cache_size=2)
+    table["a"]
+    table["b"]
+    table.materialize(["a"])   # "a" becomes most recently used
+    table["c"]                 # so "b" is evicted, not "a"
+    assert "a" in table and "b" not in table
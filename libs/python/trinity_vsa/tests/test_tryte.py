@@ -0,0 +1,57 @@
+"""TryteArray arithmetic against Python integers reduced modulo 3**width."""
+
+import numpy as np
+import pytest
+
+from trinity_vsa import TryteArray
+from trinity_vsa.tryte import max_value
+
+
+def wrap(x, width):
+    """Balanced residue of ``x`` modulo 3**width, as a Python int."""
+    m = 3 ** width
+    return (x + max_value(width)) % m - max_value(width)
+
+
+def values(width, n, seed):
+    limit = max_value(width)
+    return np.random.default_rng(seed).integers(-limit, limit + 1, size=n, dtype=np.int64)
+
+
+@pytest.mark.parametrize("width", [1, 3, 20, 21, 40])
+def test_roundtrip_and_arithmetic(width):
+    xs, ys = values(width, 200, width), values(width, 200, width + 1)
+    if width >= 3:
+        xs[:3] = [0, max_value(width), -max_value(width)]
+    a, b = TryteArray.from_ints(xs, width), TryteArray.from_ints(ys, width)
+    np.testing.assert_array_equal(a.to_ints(), xs)
+    for got, op in ((a + b, lambda x, y: x + y), (a - b, lambda x, y: x - y),
+                    (a * b, lambda x, y: x * y)):
+        assert [got[i] for i in range(len(got))] == [
+            wrap(op(int(x), int(y)), width) for x, y in zip(xs, ys)]
+    assert (-a).to_ints().tolist() == (-xs).tolist()
+    np.testing.assert_array_equal(a.sign(), np.sign(xs))
+
+
+def test_tryte_range_wraps():
+    # width 3 holds -13..13, like the VM's tryte
+    a = TryteArray.from_ints([13, -13, 7], width=3)
+    b = TryteArray.from_ints([1, -1, 7], width=3)
+    assert (a + b).to_ints().tolist() == [-13, 13, -13]
+    assert (a * b).to_ints().tolist() == [13, 13, wrap(49, 3)]
+
+
+def test_out_of_range_rejected():
+    with pytest.raises(ValueError):
+        TryteArray.from_ints([14], width=3)
+
+
+def test_digits_and_strings():
+    t = TryteArray.from_ints([5, -5, 0], width=3)
+    # 5 = 9 - 3 - 1 -> "1TT"
+    assert t.to_strings() == ["1TT", "T11", "000"]
+    for s, x in zip(t.to_strings(), [5, -5, 0]):
+        digits = {"T": -1, "0": 0, "1": 1}
+        assert sum(digits[c] * 3 ** i for i, c in enumerate(reversed(s))) == x
+    assert t[1:].to_ints().tolist() == [-5, 0]
+    assert t == TryteArray(t.planes)